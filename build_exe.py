@@ -8,12 +8,59 @@ Build script for creating a standalone executable of AudKyɛfo
 import os
 import sys
 import shutil
+import argparse
 import subprocess
 import platform
 
-def main():
+APP_EXE_NAME = "AudKyefo"
+
+def parse_args(argv=None):
+    """Parse the command line arguments of the build script"""
+    parser = argparse.ArgumentParser(description="Build a standalone AudKyɛfo executable")
+    parser.add_argument(
+        "--pack",
+        choices=["onedir", "onefile"],
+        default="onedir",
+        help="Bundle layout. 'onedir' (default) starts much faster because nothing "
+             "has to be unpacked to a temp directory on launch."
+    )
+    return parser.parse_args(argv)
+
+def create_launcher(dist_dir, executable_path):
+    """
+    Create a launcher in the dist directory so a onedir build can still be
+    started by a single name
+
+    Args:
+        dist_dir: The PyInstaller dist directory
+        executable_path: Path to the executable inside the bundle directory
+
+    Returns:
+        Path to the created launcher, or None if it could not be created
+    """
+    try:
+        if platform.system() == "Windows":
+            launcher_path = os.path.join(dist_dir, f"{APP_EXE_NAME}.cmd")
+            relative_path = os.path.relpath(executable_path, dist_dir)
+            with open(launcher_path, "w") as f:
+                f.write("@echo off\r\n")
+                f.write(f'start "" "%~dp0{relative_path}" %*\r\n')
+        else:
+            # A lower-case name would clash with the bundle directory on
+            # case-insensitive filesystems (the macOS default)
+            launcher_path = os.path.join(dist_dir, f"{APP_EXE_NAME}-launcher")
+            if os.path.lexists(launcher_path):
+                os.remove(launcher_path)
+            os.symlink(os.path.relpath(executable_path, dist_dir), launcher_path)
+        return launcher_path
+    except Exception as e:
+        print(f"Error creating launcher: {e}")
+        return None
+
+def main(argv=None):
     """Main function to build the executable"""
-    print("Building AudKyɛfo executable...")
+    args = parse_args(argv)
+    print(f"Building AudKyɛfo executable ({args.pack})...")
 
     # Get the current directory
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -37,10 +84,13 @@ def main():
     # Build the PyInstaller command
     cmd = [
         "pyinstaller",
-        "--onefile",
+        f"--{args.pack}",
         "--windowed",
-        "--name=AudKyefo",
-        "--add-data=resources;resources",
+        # UPX-compressed binaries must be decompressed on every launch
+        "--noupx",
+        f"--name={APP_EXE_NAME}",
+        f"--specpath={build_dir}",
+        f"--add-data={os.path.join(current_dir, 'resources')}{os.pathsep}resources",
     ]
 
     # Add icon if available
@@ -62,22 +112,36 @@ def main():
         print("Error: PyInstaller not found. Please install it with 'pip install pyinstaller'")
         return 1
 
+    # In onedir mode the executable lives in its own bundle directory
+    exe_suffix = ".exe" if platform.system() == "Windows" else ""
+    if args.pack == "onedir":
+        bundle_dir = os.path.join(dist_dir, APP_EXE_NAME)
+    else:
+        bundle_dir = dist_dir
+    executable_path = os.path.join(bundle_dir, APP_EXE_NAME + exe_suffix)
+
     # Copy ffmpeg binaries if needed
     if platform.system() == "Windows":
         try:
             # Check if ffmpeg is installed
             ffmpeg_path = shutil.which("ffmpeg")
             if ffmpeg_path:
-                # Copy ffmpeg.exe to the dist directory
-                shutil.copy(ffmpeg_path, os.path.join(dist_dir, "ffmpeg.exe"))
-                print(f"Copied ffmpeg from {ffmpeg_path} to dist directory")
+                # Copy ffmpeg.exe next to the executable
+                shutil.copy(ffmpeg_path, os.path.join(bundle_dir, "ffmpeg.exe"))
+                print(f"Copied ffmpeg from {ffmpeg_path} to {bundle_dir}")
             else:
                 print("Warning: ffmpeg not found in PATH. The application may not work correctly.")
         except Exception as e:
             print(f"Error copying ffmpeg: {e}")
 
+    # Keep a single-name entry point for onedir builds
+    if args.pack == "onedir":
+        launcher_path = create_launcher(dist_dir, executable_path)
+        if launcher_path:
+            print(f"Created launcher at: {launcher_path}")
+
     print("Build completed successfully")
-    print(f"Executable can be found at: {os.path.join(dist_dir, 'AudKyefo.exe')}")
+    print(f"Executable can be found at: {executable_path}")
 
     return 0
 
@@ -0,0 +1,144 @@
+"""
+Lower-memory replacement for pydub's AudioSegment.from_file
+
+pydub decodes compressed files by piping ffmpeg's WAV output through
+bytes -> bytearray -> bytes -> BytesIO and finally slices the sample data
+out of the WAV container, holding several full copies of the PCM buffer at
+once. The replacement below fixes the WAV headers in place, strips the
+header and any trailing chunks with `del` on the bytearray and builds the
+AudioSegment directly from the sample data.
+
+Importing this module applies the patch.
+"""
+
+import struct
+import logging
+import subprocess
+from os import fsdecode
+
+from pydub.audio_segment import (
+    AudioSegment,
+    AUDIO_FILE_EXT_ALIASES,
+    extract_wav_headers,
+    fix_wav_headers
+)
+from pydub.exceptions import CouldntDecodeError
+from pydub.logging_utils import log_conversion
+from pydub.utils import mediainfo_json
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+_original_from_file = AudioSegment.from_file.__func__
+
+def _decode_to_wav(cls, filename, format=None, codec=None, parameters=None):
+    """
+    Decode a file to WAV with ffmpeg, the same way pydub does
+
+    Returns:
+        The WAV data written by ffmpeg as a bytearray
+    """
+    conversion_command = [cls.converter, "-y"]
+
+    if format:
+        conversion_command += ["-f", format]
+
+    if codec:
+        conversion_command += ["-acodec", codec]
+
+    conversion_command += ["-i", filename]
+
+    if not codec:
+        info = mediainfo_json(filename)
+        audio_streams = [x for x in info["streams"] if x["codec_type"] == "audio"]
+        # Some ffprobe versions always report fltp for these codecs
+        if (audio_streams[0].get("sample_fmt") == "fltp" and
+                audio_streams[0].get("codec_name") in ["mp3", "mp4", "aac", "webm", "ogg"]):
+            bits_per_sample = 16
+        else:
+            bits_per_sample = audio_streams[0]["bits_per_sample"]
+        acodec = "pcm_u8" if bits_per_sample == 8 else "pcm_s%dle" % bits_per_sample
+        conversion_command += ["-acodec", acodec]
+
+    conversion_command += ["-vn", "-f", "wav", "-"]
+
+    if parameters is not None:
+        conversion_command.extend(parameters)
+
+    log_conversion(conversion_command)
+
+    p = subprocess.Popen(conversion_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    p_out, p_err = p.communicate()
+
+    if p.returncode != 0 or len(p_out) == 0:
+        raise CouldntDecodeError(
+            "Decoding failed. ffmpeg returned error code: {0}\n\nOutput from ffmpeg/avlib:\n\n{1}".format(
+                p.returncode, p_err.decode(errors="ignore")))
+
+    return bytearray(p_out)
+
+def _segment_from_wav_bytearray(cls, data):
+    """
+    Build an AudioSegment from WAV data, reusing the buffer for the samples
+
+    Args:
+        data: WAV data as a bytearray, modified in place
+
+    Returns:
+        AudioSegment, or None if the data uses 8-bit samples (which pydub
+        has to convert from unsigned) or is not a PCM WAV stream
+    """
+    fix_wav_headers(data)
+    headers = extract_wav_headers(data)
+
+    fmt = [x for x in headers if x.id == b"fmt "]
+    if not fmt or fmt[0].size < 16 or headers[-1].id != b"data":
+        return None
+
+    pos = fmt[0].position + 8
+    audio_format, channels, sample_rate = struct.unpack_from("<HHI", data, pos)
+    bits_per_sample = struct.unpack_from("<H", data, pos + 14)[0]
+    if audio_format not in (1, 0xFFFE) or bits_per_sample == 8:
+        return None
+
+    # Drop the header and anything after the data chunk without copying
+    data_start = headers[-1].position + 8
+    del data[:data_start]
+    del data[headers[-1].size:]
+
+    return cls(
+        data=bytes(data),
+        sample_width=bits_per_sample // 8,
+        frame_rate=sample_rate,
+        channels=channels
+    )
+
+def from_file(cls, file, format=None, codec=None, parameters=None, start_second=None, duration=None, **kwargs):
+    """
+    Drop-in replacement for AudioSegment.from_file
+
+    Compressed files given by path are decoded with fewer copies of the
+    sample data; everything else is handed to the original implementation.
+    """
+    try:
+        filename = fsdecode(file)
+    except TypeError:
+        filename = None
+
+    if format:
+        format = format.lower()
+        format = AUDIO_FILE_EXT_ALIASES.get(format, format)
+
+    if (filename is None or start_second is not None or duration is not None or
+            format in ("wav", "raw", "pcm") or
+            filename.lower().endswith((".wav", ".raw", ".pcm"))):
+        return _original_from_file(cls, file, format, codec, parameters, start_second, duration, **kwargs)
+
+    data = _decode_to_wav(cls, filename, format, codec, parameters)
+    segment = _segment_from_wav_bytearray(cls, data)
+    if segment is None:
+        logger.debug("Falling back to pydub decoding for %s", filename)
+        return _original_from_file(cls, file, format, codec, parameters, start_second, duration, **kwargs)
+    return segment
+
+AudioSegment.from_file = classmethod(from_file)
@@ -3,40 +3,138 @@ Main audio processing logic for AudKyɛfo
 """
 
 import os
+import mmap
+import time
 import logging
-from typing import List, Dict, Tuple, Callable, Optional, Union
-from pydub import AudioSegment
-from mutagen.mp3 import MP3
-from mutagen.wave import WAVE
-from mutagen.flac import FLAC
-from mutagen.oggvorbis import OggVorbis
-from mutagen.aac import AAC
-from mutagen.mp4 import MP4
+import functools
+import importlib
+import contextlib
+from typing import List, Dict, Tuple, Callable, Optional, Union, TYPE_CHECKING
 
 from utils.constants import (
-    SUPPORTED_INPUT_FORMATS,
-    SUPPORTED_OUTPUT_FORMATS,
+    SUPPORTED_INPUT_EXTENSIONS,
+    SUPPORTED_OUTPUT_EXTENSIONS,
     SPLIT_METHOD_EQUAL,
     SPLIT_METHOD_DURATION,
-    SPLIT_METHOD_CUSTOM
+    SPLIT_METHOD_CUSTOM,
+    LOW_MEMORY_THRESHOLD_BYTES,
+    PROGRESS_MIN_INTERVAL
 )
 from utils.helpers import get_file_extension, human_readable_size, ensure_directory_exists
+from utils.format_detect import sniff_format
+from core.ffmpeg_tools import StreamedAudio
+from core.metadata_cache import MetadataCache
 from core.splitter import split_audio
 
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Tag keys for title/artist/album in the "easy" interfaces and Vorbis comments
+COMMON_TAG_KEYS = {"title": "title", "artist": "artist", "album": "album"}
+
+# Mutagen parser (module, class) and metadata key -> tag key map per
+# extension. Parsers are imported on first use so only the ones for the
+# formats actually opened get loaded. MP3 uses the "easy" ID3 interface,
+# which exposes plain title/artist/album keys. Formats without a tag map
+# only provide stream properties.
+MUTAGEN_PARSERS = {
+    "mp3": ("mutagen.mp3", "EasyMP3", COMMON_TAG_KEYS),
+    "wav": ("mutagen.wave", "WAVE", None),
+    "flac": ("mutagen.flac", "FLAC", COMMON_TAG_KEYS),
+    "ogg": ("mutagen.oggvorbis", "OggVorbis", COMMON_TAG_KEYS),
+    "aac": ("mutagen.aac", "AAC", None),
+    "m4a": ("mutagen.mp4", "MP4", {"title": "\xa9nam", "artist": "\xa9ART", "album": "\xa9alb"}),
+}
+
+@functools.lru_cache(maxsize=None)
+def _get_mutagen_parser(extension: str) -> Optional[Callable]:
+    """
+    Import and return the mutagen parser class for a file extension
+
+    Args:
+        extension: File extension without the dot
+
+    Returns:
+        Mutagen file type class, or None if the extension is not supported
+    """
+    entry = MUTAGEN_PARSERS.get(extension)
+    if entry is None:
+        return None
+    module_name, class_name, _ = entry
+    return getattr(importlib.import_module(module_name), class_name)
+
+@contextlib.contextmanager
+def _open_for_parsing(file_path: str):
+    """
+    Open a file read-only for header parsing, memory-mapped when possible
+
+    Mutagen seeks around the headers (and to the end for ID3v1 tags); on a
+    mapping those reads are served straight from the page cache.
+
+    Args:
+        file_path: Path to the file
+
+    Yields:
+        A file-like object (an mmap, or the open file if it can't be mapped)
+    """
+    with open(file_path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and some special files can't be mapped
+            yield f
+            return
+
+    with mapped:
+        yield mapped
+
+# Metadata keys describing the audio stream, read from the file headers
+# when possible so that loading a file does not have to decode it
+STREAM_METADATA_KEYS = frozenset({"channels", "sample_width", "frame_rate", "duration_seconds"})
+
+# Other output formats the compressed frames of a source format can be copied
+# into without re-encoding (AAC frames move between ADTS and MP4 containers)
+STREAM_COPY_TARGETS = {
+    "aac": frozenset({"m4a"}),
+    "m4a": frozenset({"aac"}),
+}
+
 class AudioProcessor:
     """
     Main class for audio processing operations
     """
 
-    def __init__(self):
-        """Initialize the audio processor"""
+    def __init__(
+        self,
+        low_memory: Optional[bool] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        progress_interval: float = PROGRESS_MIN_INTERVAL
+    ):
+        """
+        Initialize the audio processor
+
+        Args:
+            low_memory: If True, never decode whole files into memory and let
+                ffmpeg cut each segment from the source file instead. If False,
+                always load files with pydub. If None, decide per file based on
+                its size (see LOW_MEMORY_THRESHOLD_BYTES).
+            metadata_cache: Cache for extracted metadata (default: the
+                per-user cache in ~/.audkyefo)
+            progress_interval: Minimum number of seconds between two
+                progress callbacks (0 and 100 percent are always reported)
+        """
+        self.low_memory = low_memory
+        self.metadata_cache = metadata_cache if metadata_cache is not None else MetadataCache()
         self.audio_file = None
         self.audio_segment = None
+        self.audio_stream = None
         self.metadata = {}
         self.progress_callback = None
+        self.progress_interval = progress_interval
+        self._last_progress_time = None
 
     def set_progress_callback(self, callback: Callable[[int, str], None]) -> None:
         """
@@ -55,38 +153,69 @@ class AudioProcessor:
             progress: Progress percentage (0-100)
             message: Status message
         """
-        if self.progress_callback:
-            self.progress_callback(progress, message)
+        if not self.progress_callback:
+            return
+
+        # Coalesce bursts of updates so a UI callback doesn't repaint per part
+        now = time.monotonic()
+        if (progress not in (0, 100) and self._last_progress_time is not None and
+                now - self._last_progress_time < self.progress_interval):
+            return
 
-    def load_file(self, file_path: str) -> bool:
+        self._last_progress_time = now
+        self.progress_callback(progress, message)
+
+    def load_file(self, file_path: str, read_tags: bool = True) -> bool:
         """
         Load an audio file and extract its metadata
 
+        The stream properties are read from the file headers; the samples are
+        only decoded once they are needed (see _get_audio), or right away for
+        formats whose headers don't describe the stream.
+
         Args:
             file_path: Path to the audio file
+            read_tags: If False, skip title/artist/album and only read the
+                stream properties
 
         Returns:
             True if the file was loaded successfully, False otherwise
         """
-        if not os.path.exists(file_path):
+        # One stat call serves the existence check, the size and the cache key
+        try:
+            st = os.stat(file_path)
+        except OSError:
             logger.error(f"File not found: {file_path}")
             return False
 
         self.audio_file = file_path
-        extension = get_file_extension(file_path)
 
-        if extension not in SUPPORTED_INPUT_FORMATS:
-            logger.error(f"Unsupported file format: {extension}")
+        # Trust the file contents over the extension, which may be wrong or missing
+        file_format = sniff_format(file_path) or get_file_extension(file_path)
+
+        if file_format not in SUPPORTED_INPUT_EXTENSIONS:
+            logger.error(f"Unsupported file format: {file_format}")
             return False
 
         try:
             self._update_progress(0, f"Loading {os.path.basename(file_path)}...")
 
-            # Load audio file using pydub
-            self.audio_segment = AudioSegment.from_file(file_path)
+            low_memory = self.low_memory
+            if low_memory is None:
+                low_memory = st.st_size >= LOW_MEMORY_THRESHOLD_BYTES
+
+            self.audio_segment = None
+            self.audio_stream = None
+            if low_memory:
+                # Only read the stream properties, segments are decoded on demand
+                try:
+                    self.audio_stream = StreamedAudio(file_path)
+                except (RuntimeError, OSError) as e:
+                    # Without ffprobe fall back to pydub, which reads WAV natively
+                    logger.warning(f"Could not stream {file_path}, loading it normally: {e}")
 
             # Extract metadata
-            self._extract_metadata(file_path)
+            self._extract_metadata(file_path, read_tags, file_format, st)
 
             self._update_progress(10, "File loaded successfully")
             return True
@@ -94,78 +223,154 @@ class AudioProcessor:
             logger.error(f"Error loading audio file: {e}")
             self.audio_file = None
             self.audio_segment = None
+            self.audio_stream = None
             self.metadata = {}
             return False
 
-    def _extract_metadata(self, file_path: str) -> None:
+    def _extract_metadata(
+        self,
+        file_path: str,
+        read_tags: bool = True,
+        file_format: Optional[str] = None,
+        st: Optional[os.stat_result] = None
+    ) -> None:
         """
-        Extract metadata from the audio file
+        Extract metadata from the audio file, using the metadata cache when
+        the file has not changed since it was last parsed
 
         Args:
             file_path: Path to the audio file
+            read_tags: If False, skip title/artist/album and only read the
+                stream properties
+            file_format: Detected format of the file (default: its extension)
+            st: Result of os.stat(file_path), if already available
+        """
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                st = None
+
+        # Only complete (tagged) entries are cached, so they serve both modes
+        if st is not None:
+            cached = self.metadata_cache.get(file_path, st)
+            if cached is not None:
+                self.metadata = cached
+                return
+
+        self._read_metadata(file_path, read_tags, st, file_format)
+
+        if st is not None and read_tags:
+            self.metadata_cache.put(file_path, self.metadata, st)
+
+    def _read_metadata(
+        self,
+        file_path: str,
+        read_tags: bool = True,
+        st: Optional[os.stat_result] = None,
+        file_format: Optional[str] = None
+    ) -> None:
         """
-        extension = get_file_extension(file_path)
+        Read metadata from the file headers, falling back to the loaded audio
+
+        Args:
+            file_path: Path to the audio file
+            read_tags: If False, skip title/artist/album and only read the
+                stream properties
+            st: Result of os.stat(file_path), if already available
+            file_format: Detected format of the file (default: its extension)
+        """
+        extension = file_format or get_file_extension(file_path)
+        size = st.st_size if st is not None else os.path.getsize(file_path)
 
-        # Basic metadata from pydub
         self.metadata = {
             "filename": os.path.basename(file_path),
             "path": file_path,
             "format": extension,
-            "channels": self.audio_segment.channels,
-            "sample_width": self.audio_segment.sample_width,
-            "frame_rate": self.audio_segment.frame_rate,
-            "duration_seconds": len(self.audio_segment) / 1000,
-            "size_bytes": os.path.getsize(file_path),
-            "size_human": human_readable_size(os.path.getsize(file_path))
+            "size_bytes": size,
+            "size_human": human_readable_size(size)
         }
 
-        # Try to extract additional metadata using mutagen
         try:
-            if extension == "mp3":
-                audio = MP3(file_path)
-                self.metadata.update({
-                    "bitrate": audio.info.bitrate,
-                    "title": audio.get("TIT2", ["Unknown"])[0],
-                    "artist": audio.get("TPE1", ["Unknown"])[0],
-                    "album": audio.get("TALB", ["Unknown"])[0]
-                })
-            elif extension == "wav":
-                audio = WAVE(file_path)
-                self.metadata.update({
-                    "bitrate": audio.info.bitrate
-                })
-            elif extension == "flac":
-                audio = FLAC(file_path)
-                self.metadata.update({
-                    "bitrate": audio.info.bitrate,
-                    "title": audio.get("title", ["Unknown"])[0],
-                    "artist": audio.get("artist", ["Unknown"])[0],
-                    "album": audio.get("album", ["Unknown"])[0]
-                })
-            elif extension == "ogg":
-                audio = OggVorbis(file_path)
-                self.metadata.update({
-                    "bitrate": audio.info.bitrate,
-                    "title": audio.get("title", ["Unknown"])[0],
-                    "artist": audio.get("artist", ["Unknown"])[0],
-                    "album": audio.get("album", ["Unknown"])[0]
-                })
-            elif extension == "aac":
-                audio = AAC(file_path)
-                self.metadata.update({
-                    "bitrate": audio.info.bitrate
-                })
-            elif extension == "m4a":
-                audio = MP4(file_path)
-                self.metadata.update({
-                    "bitrate": audio.info.bitrate,
-                    "title": audio.get("\xa9nam", ["Unknown"])[0],
-                    "artist": audio.get("\xa9ART", ["Unknown"])[0],
-                    "album": audio.get("\xa9alb", ["Unknown"])[0]
-                })
+            self._read_header_metadata(file_path, extension, read_tags)
         except Exception as e:
             logger.warning(f"Error extracting additional metadata: {e}")
 
+        # Formats mutagen can't describe need the decoded (or probed) audio
+        if not STREAM_METADATA_KEYS.issubset(self.metadata):
+            audio = self._get_audio()
+            for key, value in (
+                ("channels", audio.channels),
+                ("sample_width", audio.sample_width),
+                ("frame_rate", audio.frame_rate),
+                ("duration_seconds", len(audio) / 1000)
+            ):
+                self.metadata.setdefault(key, value)
+
+    def _read_header_metadata(self, file_path: str, extension: str, read_tags: bool) -> None:
+        """
+        Read stream properties and tags with mutagen, without decoding audio
+
+        Args:
+            file_path: Path to the audio file
+            extension: File extension without the dot
+            read_tags: If False, skip title/artist/album
+        """
+        parser = _get_mutagen_parser(extension)
+        if parser is None:
+            return
+
+        with _open_for_parsing(file_path) as f:
+            if not read_tags and extension == "mp3":
+                # Without tags only the MPEG frame headers need to be parsed
+                from mutagen.mp3 import MPEGInfo
+
+                info = MPEGInfo(f)
+                audio = None
+            else:
+                audio = parser(f)
+                info = audio.info
+
+        self.metadata["bitrate"] = getattr(info, "bitrate", 0)
+        if getattr(info, "codec", None):
+            self.metadata["codec"] = info.codec
+        self.metadata.update({
+            "channels": info.channels,
+            "sample_width": (getattr(info, "bits_per_sample", 0) or 16) // 8,
+            "frame_rate": info.sample_rate,
+            "duration_seconds": info.length
+        })
+
+        tag_keys = MUTAGEN_PARSERS[extension][2]
+        if audio is None or not read_tags or tag_keys is None:
+            return
+
+        # Only plain text tags are read, embedded pictures are never touched
+        if extension == "m4a" and audio.tags is not None:
+            # Drop the cover art right away instead of keeping it alive
+            audio.tags.pop("covr", None)
+        for key, tag_key in tag_keys.items():
+            value = audio.get(tag_key)
+            self.metadata[key] = value[0] if value else "Unknown"
+
+    def _get_audio(self) -> Optional[Union["AudioSegment", StreamedAudio]]:
+        """
+        Get the loaded audio, decoding the file on first use
+
+        Returns:
+            The AudioSegment or StreamedAudio of the loaded file, or None if
+            no file is loaded
+        """
+        if self.audio_stream is not None:
+            return self.audio_stream
+        if self.audio_segment is None and self.audio_file is not None:
+            # Load audio file using pydub (the patch module lowers peak memory)
+            import core._pydub_patch  # noqa: F401
+            from pydub import AudioSegment
+
+            self.audio_segment = AudioSegment.from_file(self.audio_file)
+        return self.audio_segment
+
     def get_metadata(self) -> Dict:
         """
         Get the metadata of the loaded audio file
@@ -175,6 +380,34 @@ class AudioProcessor:
         """
         return self.metadata
 
+    def _can_stream_copy(self, output_format: str, overlap: float) -> bool:
+        """
+        Check whether the parts can be cut from the source without re-encoding
+
+        Args:
+            output_format: Output format
+            overlap: Overlap duration in seconds
+
+        Returns:
+            True if the output format can hold the source's compressed frames
+            as they are and nothing has to be done to the samples, False
+            otherwise
+        """
+        if self.audio_file is None or overlap:
+            return False
+
+        source_format = self.metadata.get("format")
+        # pydub reads and writes WAV itself, so there is nothing to copy
+        if source_format == "wav":
+            return False
+        if output_format == source_format:
+            return True
+        if output_format not in STREAM_COPY_TARGETS.get(source_format, ()):
+            return False
+
+        # An MP4 container may hold ALAC instead of AAC ("mp4a" codecs)
+        return source_format != "m4a" or self.metadata.get("codec", "").startswith("mp4a")
+
     def split_audio(
         self,
         method: str,
@@ -196,15 +429,16 @@ class AudioProcessor:
                 - duration: Duration in seconds (for fixed_duration method)
                 - ranges: List of (start, end) tuples in seconds (for custom_ranges method)
                 - overlap: Overlap duration in seconds
+                - skip_existing: Don't re-export parts whose file already exists
 
         Returns:
             List of paths to the created audio files
         """
-        if not self.audio_segment:
+        if self.audio_file is None:
             logger.error("No audio file loaded")
             return []
 
-        if output_format not in SUPPORTED_OUTPUT_FORMATS:
+        if output_format not in SUPPORTED_OUTPUT_EXTENSIONS:
             logger.error(f"Unsupported output format: {output_format}")
             return []
 
@@ -220,10 +454,29 @@ class AudioProcessor:
 
         # Call the appropriate splitting function
         try:
+            if self._can_stream_copy(output_format, kwargs.get("overlap", 0)):
+                # Copy the compressed frames with ffmpeg, the header
+                # metadata is all that's needed
+                audio = StreamedAudio(self.audio_file, {
+                    "duration_ms": int(self.metadata["duration_seconds"] * 1000),
+                    "channels": self.metadata["channels"],
+                    "frame_rate": self.metadata["frame_rate"],
+                    "sample_width": self.metadata["sample_width"],
+                    "codec": self.metadata.get("codec", "")
+                }, stream_copy=True)
+                self._update_progress(
+                    25,
+                    "Copying audio without re-encoding; cut points snap to the nearest audio frame."
+                )
+            else:
+                if self.audio_segment is None and self.audio_stream is None:
+                    self._update_progress(25, "Decoding audio...")
+                audio = self._get_audio()
+
             self._update_progress(30, f"Splitting audio using {method} method...")
 
             output_files = split_audio(
-                self.audio_segment,
+                audio,
                 method,
                 output_dir,
                 original_name,
@@ -4,9 +4,20 @@ Settings management for AudKyɛfo
 
 import os
 import json
+import time
+import atexit
 import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the json module
+    orjson = None
+
 from utils.constants import (
     DEFAULT_OUTPUT_FORMAT,
     DEFAULT_NAMING_PATTERN,
@@ -17,6 +28,44 @@ from utils.helpers import ensure_directory_exists
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Seconds for which the existence check of the recent files is reused
+RECENT_FILES_CHECK_TTL = 5.0
+
+# Threads used to check the recent files, which may live on network shares
+RECENT_FILES_CHECK_WORKERS = 16
+
+def _dump_settings(settings: Dict[str, Any]) -> bytes:
+    """
+    Serialize settings to JSON
+
+    Args:
+        settings: Dictionary containing the settings
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=4).encode("utf-8")
+
+def _parse_settings(data: bytes) -> Dict[str, Any]:
+    """
+    Parse settings from JSON
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Dictionary containing the settings
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Seconds to wait after a change before the settings are written, so a burst
+# of changes results in a single write
+SAVE_DELAY_SECONDS = 0.5
+
 class ConfigManager:
     """
     Class for managing application settings
@@ -26,7 +75,11 @@ class ConfigManager:
         """Initialize the config manager"""
         self.config_dir = os.path.expanduser("~/.audkyefo")
         self.config_file = os.path.join(self.config_dir, "config.json")
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
         self.settings = self._load_settings()
+        self._recent_files_checked_at: Optional[float] = None
 
     def _load_settings(self) -> Dict[str, Any]:
         """
@@ -53,8 +106,8 @@ class ConfigManager:
             return default_settings
 
         try:
-            with open(self.config_file, 'r') as f:
-                settings = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                settings = _parse_settings(f.read())
 
             # Update with any missing default settings
             for key, value in default_settings.items():
@@ -78,13 +131,71 @@ class ConfigManager:
         """
         try:
             ensure_directory_exists(self.config_dir)
-            with open(self.config_file, 'w') as f:
-                json.dump(settings, f, indent=4)
+
+            data = _dump_settings(settings)
+
+            # Write to a temporary file first so the config is never left half written
+            with tempfile.NamedTemporaryFile(
+                'wb', dir=self.config_dir, prefix="config.", suffix=".tmp", delete=False
+            ) as f:
+                f.write(data)
+            try:
+                os.replace(f.name, self.config_file)
+            except OSError:
+                os.remove(f.name)
+                raise
             return True
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
             return False
 
+    def _mark_dirty(self) -> bool:
+        """
+        Schedule a write of the settings
+
+        The write happens SAVE_DELAY_SECONDS after the last change, so
+        several changes in a row are saved together. Until then an exit
+        hook makes sure the changes are written if the application exits.
+
+        Returns:
+            True (the write itself happens later, see flush)
+        """
+        with self._lock:
+            if not self._dirty:
+                atexit.register(self.flush)
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+        return True
+
+    def flush(self) -> bool:
+        """
+        Write pending changes to the config file now
+
+        Returns:
+            True if there was nothing to write or the settings were saved
+            successfully, False otherwise
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+
+            if not self._dirty:
+                return True
+
+            self._dirty = False
+            saved = self._save_settings(self.settings)
+            atexit.unregister(self.flush)
+            return saved
+
+    def close(self) -> None:
+        """Write pending changes and stop the delayed writer"""
+        self.flush()
+
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
         Get a setting value
@@ -98,19 +209,23 @@ class ConfigManager:
         """
         return self.settings.get(key, default)
 
-    def set_setting(self, key: str, value: Any) -> bool:
+    def set_setting(self, key: str, value: Any, flush: bool = False) -> bool:
         """
         Set a setting value
 
         Args:
             key: Setting key
             value: Setting value
+            flush: If True, write the settings immediately instead of
+                scheduling a delayed write
 
         Returns:
-            True if the setting was saved successfully, False otherwise
+            True if the setting was saved (or scheduled) successfully, False otherwise
         """
-        self.settings[key] = value
-        return self._save_settings(self.settings)
+        with self._lock:
+            self.settings[key] = value
+            self._mark_dirty()
+        return self.flush() if flush else True
 
     def add_recent_file(self, file_path: str, max_count: int = 10) -> bool:
         """
@@ -123,20 +238,16 @@ class ConfigManager:
         Returns:
             True if the list was updated successfully, False otherwise
         """
-        recent_files = self.settings.get("recent_files", [])
-
-        # Remove the file if it already exists in the list
-        if file_path in recent_files:
-            recent_files.remove(file_path)
-
-        # Add the file to the beginning of the list
-        recent_files.insert(0, file_path)
+        with self._lock:
+            # Keyed by path, so moving a file to the front needs no list scan
+            recent_files = OrderedDict.fromkeys(self.settings.get("recent_files", []))
+            recent_files[file_path] = None
+            recent_files.move_to_end(file_path, last=False)
 
-        # Limit the number of files
-        recent_files = recent_files[:max_count]
-
-        self.settings["recent_files"] = recent_files
-        return self._save_settings(self.settings)
+            # Limit the number of files (stored as a list for JSON)
+            self.settings["recent_files"] = list(recent_files)[:max_count]
+            self._recent_files_checked_at = None
+            return self._mark_dirty()
 
     def get_recent_files(self, max_count: int = 10) -> list:
         """
@@ -150,15 +261,32 @@ class ConfigManager:
         """
         recent_files = self.settings.get("recent_files", [])
 
-        # Filter out files that no longer exist
-        recent_files = [f for f in recent_files if os.path.exists(f)]
-
-        # Update the settings if files were removed
-        if len(recent_files) != len(self.settings.get("recent_files", [])):
-            self.settings["recent_files"] = recent_files
-            self._save_settings(self.settings)
-
-        return recent_files[:max_count]
+        # Reuse a recent existence check instead of stat-ing every file again
+        now = time.monotonic()
+        if (self._recent_files_checked_at is not None and
+                now - self._recent_files_checked_at < RECENT_FILES_CHECK_TTL):
+            return recent_files[:max_count]
+
+        # Filter out files that no longer exist, checking them in parallel so
+        # the wait is one round-trip rather than one per file on network shares
+        if len(recent_files) > 1:
+            workers = min(len(recent_files), RECENT_FILES_CHECK_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                exists = list(executor.map(os.path.exists, recent_files))
+        else:
+            exists = [os.path.exists(f) for f in recent_files]
+        existing_files = [f for f, found in zip(recent_files, exists) if found]
+        self._recent_files_checked_at = now
+
+        # Update the settings if files were removed (and the list wasn't
+        # replaced while the files were being checked)
+        with self._lock:
+            if (len(existing_files) != len(recent_files) and
+                    self.settings.get("recent_files") is recent_files):
+                self.settings["recent_files"] = existing_files
+                self._mark_dirty()
+
+        return existing_files[:max_count]
 
     def clear_recent_files(self) -> bool:
         """
@@ -167,8 +295,10 @@ class ConfigManager:
         Returns:
             True if the list was cleared successfully, False otherwise
         """
-        self.settings["recent_files"] = []
-        return self._save_settings(self.settings)
+        with self._lock:
+            self.settings["recent_files"] = []
+            self._recent_files_checked_at = None
+            return self._mark_dirty()
 
     def save_last_configuration(self, config: Dict[str, Any]) -> bool:
         """
@@ -183,10 +313,10 @@ class ConfigManager:
         if not self.settings.get("remember_last_settings", True):
             return True
 
-        for key, value in config.items():
-            self.settings[f"last_{key}"] = value
-
-        return self._save_settings(self.settings)
+        with self._lock:
+            for key, value in config.items():
+                self.settings[f"last_{key}"] = value
+            return self._mark_dirty()
 
     def get_last_configuration(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,249 @@
+"""
+FFmpeg helpers for AudKyɛfo
+Probes and cuts audio files without decoding them into memory
+"""
+
+import json
+import logging
+import subprocess
+from typing import Dict, List, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+FFMPEG_BINARY = "ffmpeg"
+FFPROBE_BINARY = "ffprobe"
+
+# Bytes per sample for the ffprobe sample formats (planar variants end in "p")
+SAMPLE_FORMAT_WIDTHS = {
+    "u8": 1,
+    "s16": 2,
+    "s32": 4,
+    "flt": 4,
+    "s64": 8,
+    "dbl": 8,
+}
+
+# Raw PCM input formats for the sample widths used by pydub (8-bit is signed)
+PCM_FORMATS = {
+    1: "s8",
+    2: "s16le",
+    4: "s32le",
+}
+
+def _run(cmd: List[str], input_data=None) -> subprocess.CompletedProcess:
+    """
+    Run an ffmpeg/ffprobe command and raise on failure
+
+    Args:
+        cmd: Command line to run
+        input_data: Bytes-like object to feed to the command's stdin
+
+    Returns:
+        The completed process
+
+    Raises:
+        RuntimeError: If the command exits with a non-zero status
+    """
+    result = subprocess.run(
+        cmd,
+        input=input_data,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{cmd[0]} failed: {result.stderr.decode(errors='ignore').strip()}")
+    return result
+
+def probe_audio(file_path: str) -> Dict:
+    """
+    Read the stream properties of an audio file from its headers
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Dictionary with duration_ms, channels, frame_rate, sample_width and codec
+
+    Raises:
+        RuntimeError: If ffprobe fails or the file has no audio stream
+    """
+    result = _run([
+        FFPROBE_BINARY,
+        "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "format=duration:stream=codec_name,channels,sample_rate,sample_fmt,duration",
+        "-of", "json",
+        file_path
+    ])
+    info = json.loads(result.stdout.decode("utf-8"))
+
+    streams = info.get("streams") or []
+    if not streams:
+        raise RuntimeError(f"No audio stream found in {file_path}")
+    stream = streams[0]
+
+    duration = stream.get("duration") or info.get("format", {}).get("duration") or 0
+    sample_fmt = (stream.get("sample_fmt") or "s16").rstrip("p")
+
+    return {
+        "duration_ms": int(float(duration) * 1000),
+        "channels": int(stream.get("channels", 2)),
+        "frame_rate": int(stream.get("sample_rate", 44100)),
+        "sample_width": SAMPLE_FORMAT_WIDTHS.get(sample_fmt, 2),
+        "codec": stream.get("codec_name", ""),
+    }
+
+def cut_audio(
+    source_path: str,
+    output_path: str,
+    start_ms: int,
+    end_ms: int,
+    stream_copy: bool = False
+) -> None:
+    """
+    Cut a time range out of an audio file with ffmpeg
+
+    Only the requested range is decoded, so memory use does not depend on the
+    size of the source file. The output format is taken from the output file
+    extension.
+
+    Args:
+        source_path: Path to the source audio file
+        output_path: Path of the file to create
+        start_ms: Start time in milliseconds
+        end_ms: End time in milliseconds
+        stream_copy: Copy the compressed frames instead of decoding and
+            re-encoding them (the cut points snap to frame boundaries)
+    """
+    cmd = [
+        FFMPEG_BINARY,
+        "-hide_banner",
+        "-loglevel", "error",
+        "-y",
+        "-ss", f"{start_ms / 1000:.3f}",
+        "-i", source_path,
+        "-t", f"{(end_ms - start_ms) / 1000:.3f}",
+        "-vn"
+    ]
+    if stream_copy:
+        cmd += ["-c", "copy", "-avoid_negative_ts", "make_zero"]
+    cmd.append(output_path)
+    _run(cmd)
+
+def segment_audio(
+    source_path: str,
+    output_pattern: str,
+    start_ms: int,
+    end_ms: int,
+    cut_times_ms: List[int],
+    stream_copy: bool = False
+) -> None:
+    """
+    Cut a time range of an audio file into consecutive pieces in one ffmpeg run
+
+    The source is read (and decoded, unless stream copying) only once, using
+    ffmpeg's segment muxer.
+
+    Args:
+        source_path: Path to the source audio file
+        output_pattern: Output path with a printf-style number, e.g.
+            "part_%04d.mp3" (the format is taken from its extension)
+        start_ms: Start time of the first piece in milliseconds
+        end_ms: End time of the last piece in milliseconds
+        cut_times_ms: Times between start_ms and end_ms where a new piece
+            starts, in milliseconds
+        stream_copy: Copy the compressed frames instead of decoding and
+            re-encoding them (the cut points snap to frame boundaries)
+    """
+    cmd = [
+        FFMPEG_BINARY,
+        "-hide_banner",
+        "-loglevel", "error",
+        "-y",
+        "-ss", f"{start_ms / 1000:.3f}",
+        "-i", source_path,
+        "-t", f"{(end_ms - start_ms) / 1000:.3f}",
+        "-vn"
+    ]
+    if stream_copy:
+        cmd += ["-c", "copy"]
+    cmd += ["-f", "segment", "-reset_timestamps", "1"]
+    if cut_times_ms:
+        cmd += ["-segment_times", ",".join(f"{(t - start_ms) / 1000:.3f}" for t in cut_times_ms)]
+    cmd.append(output_pattern)
+    _run(cmd)
+
+def encode_pcm(
+    data,
+    output_path: str,
+    frame_rate: int,
+    channels: int,
+    sample_width: int
+) -> None:
+    """
+    Encode raw PCM samples with ffmpeg by piping them to its stdin
+
+    Args:
+        data: Bytes-like object holding interleaved little-endian samples
+        output_path: Path of the file to create (the format is taken from
+            its extension)
+        frame_rate: Sample rate in Hz
+        channels: Number of channels
+        sample_width: Bytes per sample
+    """
+    _run([
+        FFMPEG_BINARY,
+        "-hide_banner",
+        "-loglevel", "error",
+        "-y",
+        "-f", PCM_FORMATS[sample_width],
+        "-ar", str(frame_rate),
+        "-ac", str(channels),
+        "-i", "-",
+        output_path
+    ], input_data=data)
+
+class StreamedAudio:
+    """
+    Lightweight handle on an audio file that is never fully decoded
+
+    Mirrors the parts of the pydub AudioSegment interface used by the
+    splitter (len() in milliseconds, channels, sample_width, frame_rate),
+    but exports ranges by letting ffmpeg seek into the source file.
+    """
+
+    def __init__(self, file_path: str, info: Optional[Dict] = None, stream_copy: bool = False):
+        """
+        Initialize the handle
+
+        Args:
+            file_path: Path to the audio file
+            info: Stream properties as returned by probe_audio (probed if None)
+            stream_copy: Export ranges without re-encoding (the output
+                format must match the source)
+        """
+        self.path = file_path
+        self.stream_copy = stream_copy
+        info = info if info is not None else probe_audio(file_path)
+        self.duration_ms = info["duration_ms"]
+        self.channels = info["channels"]
+        self.frame_rate = info["frame_rate"]
+        self.sample_width = info["sample_width"]
+        self.codec = info["codec"]
+
+    def __len__(self) -> int:
+        """Duration in milliseconds, like AudioSegment"""
+        return self.duration_ms
+
+    def export_range(self, start_ms: int, end_ms: int, output_path: str) -> None:
+        """
+        Export a time range of the file
+
+        Args:
+            start_ms: Start time in milliseconds
+            end_ms: End time in milliseconds
+            output_path: Path of the file to create (the format is taken
+                from its extension)
+        """
+        cut_audio(self.path, output_path, start_ms, end_ms, self.stream_copy)
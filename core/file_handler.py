@@ -5,13 +5,22 @@ File I/O operations for AudKyɛfo
 import os
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
-from utils.constants import SUPPORTED_INPUT_FORMATS
+from utils.constants import SUPPORTED_INPUT_EXTENSIONS
 from utils.helpers import get_file_extension, ensure_directory_exists
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# File system types where every stat is a network round-trip
+NETWORK_FILESYSTEMS = frozenset({
+    "nfs", "nfs4", "cifs", "smbfs", "smb3", "afs", "9p", "fuse.sshfs", "davfs", "fuse.rclone"
+})
+
+# Number of threads used to check entries on network file systems
+NETWORK_SCAN_WORKERS = 32
+
 def get_recent_files(max_count: int = 10) -> List[str]:
     """
     Get the list of recently used files from the settings
@@ -98,6 +107,60 @@ def delete_file(file_path: str) -> bool:
         logger.error(f"Error deleting file: {e}")
         return False
 
+def is_network_path(path: str) -> bool:
+    """
+    Check if a path is on a network file system
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if the path is on a network share, False if it is local or
+        the file system type can't be determined
+    """
+    path = os.path.realpath(path)
+
+    if os.name == 'nt':
+        if path.startswith("\\\\"):  # UNC path
+            return True
+        try:
+            import ctypes
+            drive = os.path.splitdrive(path)[0] + "\\"
+            return ctypes.windll.kernel32.GetDriveTypeW(drive) == 4  # DRIVE_REMOTE
+        except Exception:
+            return False
+
+    # Find the file system type of the longest mount point containing the path
+    try:
+        with open("/proc/mounts", "r") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+
+    best_mount, best_type = "", ""
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        if (path == mount_point or path.startswith(mount_point.rstrip("/") + "/")) \
+                and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fs_type
+
+    return best_type in NETWORK_FILESYSTEMS
+
+def _is_file_entry(entry: os.DirEntry) -> bool:
+    """
+    Check if a directory entry is a file (following symlinks)
+
+    Args:
+        entry: Directory entry
+
+    Returns:
+        True if the entry is a file, False otherwise
+    """
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
 def get_files_in_directory(directory: str, filter_audio: bool = True) -> List[str]:
     """
     Get the list of files in a directory
@@ -109,25 +172,24 @@ def get_files_in_directory(directory: str, filter_audio: bool = True) -> List[st
     Returns:
         List of file paths
     """
-    if not os.path.exists(directory) or not os.path.isdir(directory):
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
         return []
 
-    files = []
-
-    for filename in os.listdir(directory):
-        file_path = os.path.join(directory, filename)
+    # The extension check is free, so do it before anything that may stat
+    if filter_audio:
+        entries = [e for e in entries if get_file_extension(e.name) in SUPPORTED_INPUT_EXTENSIONS]
 
-        if not os.path.isfile(file_path):
-            continue
-
-        if filter_audio:
-            extension = get_file_extension(file_path)
-            if extension not in SUPPORTED_INPUT_FORMATS:
-                continue
-
-        files.append(file_path)
+    if len(entries) > 1 and is_network_path(directory):
+        # Overlap the per-file round-trips instead of paying for them one by one
+        with ThreadPoolExecutor(max_workers=min(NETWORK_SCAN_WORKERS, len(entries))) as executor:
+            is_file = list(executor.map(_is_file_entry, entries))
+    else:
+        is_file = [_is_file_entry(e) for e in entries]
 
-    return files
+    return [e.path for e, file_flag in zip(entries, is_file) if file_flag]
 
 def open_directory(directory: str) -> bool:
     """
@@ -0,0 +1,128 @@
+"""
+Persistent metadata cache for AudKyɛfo
+Keeps extracted metadata so unchanged files are not parsed again
+"""
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def _cache_key(path: str) -> str:
+    """
+    Normalise a path so every spelling of the same file shares one entry
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Absolute, case-normalised path
+    """
+    return os.path.normcase(os.path.abspath(path))
+
+class MetadataCache:
+    """
+    SQLite backed cache of audio file metadata
+
+    Entries are keyed on the absolute file path and are only valid while the file's
+    modification time and size are unchanged.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the metadata cache
+
+        Args:
+            db_path: Path to the database file (default: ~/.audkyefo/metadata_cache.db)
+        """
+        self.db_path = db_path or os.path.expanduser("~/.audkyefo/metadata_cache.db")
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database on first use
+
+        Returns:
+            The database connection
+        """
+        if self._connection is None:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir and not os.path.exists(db_dir):
+                os.makedirs(db_dir)
+
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "path TEXT PRIMARY KEY, "
+                "mtime_ns INTEGER, "
+                "size INTEGER, "
+                "meta_json TEXT)"
+            )
+        return self._connection
+
+    def get(self, path: str, st: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached metadata of a file
+
+        Args:
+            path: Path to the file
+            st: Result of os.stat(path), if already available
+
+        Returns:
+            The cached metadata, or None if there is no valid entry
+        """
+        try:
+            st = st or os.stat(path)
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT mtime_ns, size, meta_json FROM metadata WHERE path = ?",
+                    (_cache_key(path),)
+                ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Error reading metadata cache: {e}")
+            return None
+
+        if row is None or row[0] != st.st_mtime_ns or row[1] != st.st_size:
+            return None
+
+        return json.loads(row[2])
+
+    def put(self, path: str, metadata: Dict[str, Any], st: Optional[os.stat_result] = None) -> bool:
+        """
+        Store the metadata of a file
+
+        Args:
+            path: Path to the file
+            metadata: Metadata to store
+            st: Result of os.stat(path), if already available
+
+        Returns:
+            True if the metadata was stored, False otherwise
+        """
+        try:
+            st = st or os.stat(path)
+            meta_json = json.dumps(metadata, default=str)
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO metadata (path, mtime_ns, size, meta_json) VALUES (?, ?, ?, ?)",
+                    (_cache_key(path), st.st_mtime_ns, st.st_size, meta_json)
+                )
+                connection.commit()
+            return True
+        except (OSError, sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Error writing metadata cache: {e}")
+            return False
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,125 @@
+"""
+Decoded audio as a numpy sample array for AudKyɛfo
+Lets the splitter export ranges as views on one buffer instead of copies
+"""
+
+import wave
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.ffmpeg_tools import encode_pcm
+from utils.helpers import get_file_extension
+
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Numpy sample types for the sample widths used by pydub (8-bit is signed)
+SAMPLE_DTYPES = {
+    1: np.int8,
+    2: np.dtype("<i2"),
+    4: np.dtype("<i4"),
+}
+
+class PcmAudio:
+    """
+    Decoded audio held as a (frames x channels) numpy array
+
+    Mirrors the parts of the pydub AudioSegment interface used by the
+    splitter (len() in milliseconds, channels, sample_width, frame_rate).
+    Slicing a range is a zero-copy view; WAV output is written directly and
+    other formats are encoded by piping the samples to ffmpeg.
+    """
+
+    def __init__(self, samples: np.ndarray, frame_rate: int, sample_width: int):
+        """
+        Initialize the audio
+
+        Args:
+            samples: Array of shape (frames, channels)
+            frame_rate: Sample rate in Hz
+            sample_width: Bytes per sample
+        """
+        self.samples = samples
+        self.frame_rate = frame_rate
+        self.sample_width = sample_width
+        self.channels = samples.shape[1]
+
+    @classmethod
+    def from_segment(cls, segment: "AudioSegment") -> "PcmAudio":
+        """
+        Wrap the sample data of a pydub AudioSegment without copying it
+
+        Args:
+            segment: AudioSegment to wrap
+
+        Returns:
+            PcmAudio sharing the segment's buffer
+        """
+        samples = np.frombuffer(segment.raw_data, dtype=SAMPLE_DTYPES[segment.sample_width])
+        return cls(samples.reshape(-1, segment.channels), segment.frame_rate, segment.sample_width)
+
+    def __len__(self) -> int:
+        """Duration in milliseconds, like AudioSegment"""
+        return round(len(self.samples) * 1000 / self.frame_rate)
+
+    def get_range(self, start_ms: int, end_ms: int) -> np.ndarray:
+        """
+        Get a time range of the samples as a view
+
+        Args:
+            start_ms: Start time in milliseconds
+            end_ms: End time in milliseconds
+
+        Returns:
+            Array view of shape (frames, channels)
+        """
+        # Integer arithmetic keeps the frame indices exact for any duration
+        start_frame = start_ms * self.frame_rate // 1000
+        end_frame = end_ms * self.frame_rate // 1000
+        return self.samples[start_frame:end_frame]
+
+    def export_range(self, start_ms: int, end_ms: int, output_path: str) -> None:
+        """
+        Export a time range of the audio
+
+        Args:
+            start_ms: Start time in milliseconds
+            end_ms: End time in milliseconds
+            output_path: Path of the file to create (the format is taken
+                from its extension)
+        """
+        view = self.get_range(start_ms, end_ms)
+
+        if get_file_extension(output_path) == "wav":
+            self._write_wav(view, output_path)
+        else:
+            encode_pcm(
+                memoryview(view).cast("B"),
+                output_path,
+                self.frame_rate,
+                self.channels,
+                self.sample_width
+            )
+
+    def _write_wav(self, view: np.ndarray, output_path: str) -> None:
+        """
+        Write samples to a WAV file without going through ffmpeg
+
+        Args:
+            view: Array of shape (frames, channels)
+            output_path: Path of the file to create
+        """
+        if self.sample_width == 1:
+            # 8-bit WAV samples are unsigned, flipping the sign bit converts them
+            view = view.view(np.uint8) ^ 0x80
+
+        with wave.open(output_path, "wb") as w:
+            # The frame count is known up front, so the header is written once
+            # and the samples go straight from the buffer to the file
+            w.setparams((self.channels, self.sample_width, self.frame_rate, len(view), "NONE", "not compressed"))
+            w.writeframesraw(memoryview(view).cast("B"))
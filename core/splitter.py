@@ -3,9 +3,16 @@ Audio splitting algorithms for AudKyɛfo
 """
 
 import os
+import shutil
 import logging
-from typing import List, Tuple, Callable, Optional
-from pydub import AudioSegment
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Tuple, Callable, Optional, Union, TYPE_CHECKING
+
+import numpy as np
+
+from core.ffmpeg_tools import StreamedAudio, segment_audio
+from core.pcm_audio import PcmAudio
 
 from utils.constants import (
     SPLIT_METHOD_EQUAL,
@@ -14,14 +21,205 @@ from utils.constants import (
     PROGRESS_SPLITTING_START,
     PROGRESS_SPLITTING_END
 )
-from utils.helpers import generate_output_filename
+from utils.helpers import compile_naming_pattern
 from utils.translation_loader import tr
 
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+AudioSource = Union["AudioSegment", PcmAudio, StreamedAudio]
+
+# (start_ms, end_ms, output_path) of one file to create
+ExportJob = Tuple[int, int, str]
+
+# Parts are written concurrently; the work is file I/O and ffmpeg subprocesses,
+# so threads are enough and the decoded samples are shared without copying
+EXPORT_WORKERS = os.cpu_count() or 1
+
+def equal_parts_bounds(total_ms: int, num_parts: int, overlap_ms: int = 0) -> np.ndarray:
+    """
+    Compute the part boundaries for an equal-parts split
+
+    Args:
+        total_ms: Total duration in milliseconds
+        num_parts: Number of parts
+        overlap_ms: Time added before and after each part in milliseconds
+
+    Returns:
+        int64 array of shape (parts, 2) holding (start_ms, end_ms) pairs
+    """
+    # Whole-millisecond cut points, the remainder is spread over the parts
+    cuts = np.arange(num_parts + 1, dtype=np.int64) * total_ms // num_parts
+    starts = np.maximum(cuts[:-1] - overlap_ms, 0)
+    ends = np.minimum(cuts[1:] + overlap_ms, total_ms)
+    return np.stack((starts, ends), axis=1)
+
+def fixed_duration_bounds(total_ms: int, duration_ms: int, overlap_ms: int = 0) -> np.ndarray:
+    """
+    Compute the part boundaries for a fixed-duration split
+
+    Args:
+        total_ms: Total duration in milliseconds
+        duration_ms: Duration of a part in milliseconds
+        overlap_ms: Overlap between consecutive parts in milliseconds
+
+    Returns:
+        int64 array of shape (parts, 2) holding (start_ms, end_ms) pairs;
+        the last part is shorter if the duration doesn't divide evenly
+    """
+    step_ms = duration_ms - overlap_ms
+    if step_ms <= 0:
+        raise ValueError("Overlap must be shorter than the part duration")
+    if total_ms <= 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Enough parts for the last one to reach the end of the audio
+    num_parts = 1 + max(0, -(-(total_ms - duration_ms) // step_ms))
+
+    starts = np.arange(num_parts, dtype=np.int64) * step_ms
+    ends = np.minimum(starts + duration_ms, total_ms)
+    return np.stack((starts, ends), axis=1)
+
+def _export_segment(
+    audio: Union[PcmAudio, StreamedAudio],
+    start_time: int,
+    end_time: int,
+    output_path: str
+) -> None:
+    """
+    Export a time range of the audio to a file
+
+    Args:
+        audio: PcmAudio or StreamedAudio to export from
+        start_time: Start time in milliseconds
+        end_time: End time in milliseconds
+        output_path: Path of the file to create
+    """
+    # Either a view on the decoded samples or an ffmpeg seek into the source
+    audio.export_range(start_time, end_time, output_path)
+
+def _export_with_segment_muxer(audio: StreamedAudio, jobs: List[ExportJob]) -> bool:
+    """
+    Export all jobs with a single ffmpeg run of the segment muxer
+
+    Only possible when no two jobs overlap, since the muxer produces
+    back-to-back pieces. Gaps between jobs become pieces that are discarded.
+
+    Args:
+        audio: StreamedAudio to export from
+        jobs: List of (start_ms, end_ms, output_path) tuples
+
+    Returns:
+        True if the jobs were exported, False if they overlap
+    """
+    # Every job has to span exactly one interval between consecutive cuts
+    bounds = sorted({round(t) for start_time, end_time, _ in jobs for t in (start_time, end_time)})
+    piece_index = {t: i for i, t in enumerate(bounds)}
+    pieces = [piece_index[round(start_time)] for start_time, _, _ in jobs]
+    if (len(set(pieces)) != len(jobs) or
+            any(piece_index[round(end_time)] != piece + 1 for piece, (_, end_time, _) in zip(pieces, jobs))):
+        return False
+
+    output_dir = os.path.dirname(jobs[0][2]) or "."
+    extension = os.path.splitext(jobs[0][2])[1]
+    temp_dir = tempfile.mkdtemp(prefix=".audkyefo_", dir=output_dir)
+    try:
+        segment_audio(
+            audio.path,
+            os.path.join(temp_dir, f"%04d{extension}"),
+            bounds[0],
+            bounds[-1],
+            bounds[1:-1],
+            audio.stream_copy
+        )
+        for piece, (_, _, output_path) in zip(pieces, jobs):
+            os.replace(os.path.join(temp_dir, f"{piece:04d}{extension}"), output_path)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def _export_jobs(
+    audio: Union[PcmAudio, StreamedAudio],
+    jobs: List[ExportJob],
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    label: str = "part",
+    max_workers: Optional[int] = None,
+    skip_existing: bool = False
+) -> List[str]:
+    """
+    Export a list of time ranges in parallel
+
+    Args:
+        audio: PcmAudio or StreamedAudio to export from
+        jobs: List of (start_ms, end_ms, output_path) tuples
+        progress_callback: Function for progress updates
+        label: Name of a piece in the progress messages ("part" or "segment")
+        max_workers: Number of parts written at once (default: EXPORT_WORKERS)
+        skip_existing: Don't export parts whose output file already exists
+
+    Returns:
+        List of paths to the created audio files, in job order
+    """
+    if not jobs:
+        return []
+
+    output_paths = [output_path for _, _, output_path in jobs]
+    if skip_existing:
+        jobs = [job for job in jobs if not os.path.exists(job[2])]
+        skipped = len(output_paths) - len(jobs)
+        if skipped:
+            logger.info(f"Skipping {skipped} existing {label}s")
+        if not jobs:
+            if progress_callback:
+                progress_callback(PROGRESS_SPLITTING_END, f"All {label}s already exist")
+            return output_paths
+
+    total = len(jobs)
+
+    # A streamed source is read once for all parts rather than once per part
+    if isinstance(audio, StreamedAudio) and total > 1:
+        try:
+            if _export_with_segment_muxer(audio, jobs):
+                if progress_callback:
+                    progress_callback(PROGRESS_SPLITTING_END, f"Created {total} {label}s")
+                return output_paths
+        except (RuntimeError, OSError) as e:
+            logger.warning(f"Segment muxer failed, exporting {label}s one by one: {e}")
+
+    progress_step = (PROGRESS_SPLITTING_END - PROGRESS_SPLITTING_START) / total
+    last_progress = None
+    workers = min(total, max_workers or EXPORT_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_export_segment, audio, start_time, end_time, output_path)
+            for start_time, end_time, output_path in jobs
+        ]
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if not progress_callback:
+                    continue
+
+                # With many parts most completions don't move the percentage,
+                # only report those that do (and the last one)
+                progress = int(PROGRESS_SPLITTING_START + progress_step * done)
+                if progress != last_progress or done == total:
+                    last_progress = progress
+                    progress_callback(progress, f"Created {label} {done} of {total}...")
+        except Exception:
+            # Don't start the remaining exports once one has failed
+            for future in futures:
+                future.cancel()
+            raise
+
+    return output_paths
+
 def split_audio(
-    audio: AudioSegment,
+    audio: AudioSource,
     method: str,
     output_dir: str,
     original_name: str,
@@ -34,7 +232,7 @@ def split_audio(
     Split audio using the specified method
 
     Args:
-        audio: AudioSegment to split
+        audio: AudioSegment, PcmAudio or StreamedAudio to split
         method: Splitting method (equal_parts, fixed_duration, custom_ranges)
         output_dir: Output directory
         original_name: Original file name without extension
@@ -46,10 +244,16 @@ def split_audio(
             - duration: Duration in seconds (for fixed_duration method)
             - ranges: List of (start, end) tuples in seconds (for custom_ranges method)
             - overlap: Overlap duration in seconds
+            - max_workers: Number of parts written at once
+            - skip_existing: Don't re-export parts whose file already exists
 
     Returns:
         List of paths to the created audio files
     """
+    # Work on a view of the decoded samples rather than slicing AudioSegments
+    if not isinstance(audio, (PcmAudio, StreamedAudio)):
+        audio = PcmAudio.from_segment(audio)
+
     if method == SPLIT_METHOD_EQUAL:
         return split_equal_parts(
             audio, output_dir, original_name, output_format, naming_pattern,
@@ -69,7 +273,7 @@ def split_audio(
         raise ValueError(f"Unknown splitting method: {method}")
 
 def split_equal_parts(
-    audio: AudioSegment,
+    audio: AudioSource,
     output_dir: str,
     original_name: str,
     output_format: str,
@@ -81,7 +285,7 @@ def split_equal_parts(
     Split audio into equal parts
 
     Args:
-        audio: AudioSegment to split
+        audio: PcmAudio or StreamedAudio to split
         output_dir: Output directory
         original_name: Original file name without extension
         output_format: Output format
@@ -90,6 +294,8 @@ def split_equal_parts(
         **kwargs: Additional parameters
             - num_parts: Number of equal parts
             - overlap: Overlap duration in seconds
+            - max_workers: Number of parts written at once
+            - skip_existing: Don't re-export parts whose file already exists
 
     Returns:
         List of paths to the created audio files
@@ -101,43 +307,31 @@ def split_equal_parts(
         raise ValueError("Number of parts must be at least 2")
 
     total_duration = len(audio)
-    part_duration = total_duration / num_parts
+    overlap_ms = int(overlap * 1000)  # Convert to milliseconds
 
-    if part_duration <= 0:
+    if total_duration <= 0:
         raise ValueError("Part duration is too small")
 
-    output_files = []
+    # All boundaries in one go, the loop below only names the files
+    bounds = equal_parts_bounds(total_duration, num_parts, overlap_ms).tolist()
 
-    for i in range(num_parts):
-        # Calculate progress
-        progress = PROGRESS_SPLITTING_START + (PROGRESS_SPLITTING_END - PROGRESS_SPLITTING_START) * (i / num_parts)
-        if progress_callback:
-            progress_callback(int(progress), f"Creating part {i+1} of {num_parts}...")
-
-        # Calculate start and end times
-        start_time = max(0, i * part_duration - overlap)
-        end_time = min(total_duration, (i + 1) * part_duration + overlap)
-
-        # Extract segment
-        segment = audio[start_time:end_time]
+    # Parse the naming pattern and strip the extension once for all parts
+    name_part = compile_naming_pattern(naming_pattern, output_format)
+    base_name = os.path.splitext(original_name)[0]
+    jobs = []
 
+    for i, (start_time, end_time) in enumerate(bounds):
         # Generate output filename
-        filename = generate_output_filename(
-            original_name, i+1,
-            start_time/1000, end_time/1000,  # Convert to seconds
-            pattern=naming_pattern,
-            extension=output_format
-        )
-        output_path = os.path.join(output_dir, filename)
-
-        # Export segment
-        segment.export(output_path, format=output_format)
-        output_files.append(output_path)
+        filename = name_part(base_name, i+1, start_time/1000, end_time/1000)  # Convert to seconds
+        jobs.append((start_time, end_time, os.path.join(output_dir, filename)))
 
-    return output_files
+    return _export_jobs(
+        audio, jobs, progress_callback,
+        max_workers=kwargs.get("max_workers"), skip_existing=kwargs.get("skip_existing", False)
+    )
 
 def split_fixed_duration(
-    audio: AudioSegment,
+    audio: AudioSource,
     output_dir: str,
     original_name: str,
     output_format: str,
@@ -149,7 +343,7 @@ def split_fixed_duration(
     Split audio into segments of fixed duration
 
     Args:
-        audio: AudioSegment to split
+        audio: PcmAudio or StreamedAudio to split
         output_dir: Output directory
         original_name: Original file name without extension
         output_format: Output format
@@ -158,6 +352,8 @@ def split_fixed_duration(
         **kwargs: Additional parameters
             - duration: Duration in seconds
             - overlap: Overlap duration in seconds
+            - max_workers: Number of parts written at once
+            - skip_existing: Don't re-export parts whose file already exists
 
     Returns:
         List of paths to the created audio files
@@ -169,48 +365,29 @@ def split_fixed_duration(
         raise ValueError("Duration must be greater than 0")
 
     total_duration = len(audio)
-    duration_ms = duration * 1000  # Convert to milliseconds
-    overlap_ms = overlap * 1000  # Convert to milliseconds
-
-    # Calculate number of parts
-    num_parts = max(1, int((total_duration + overlap_ms) / (duration_ms - overlap_ms)))
-
-    output_files = []
-
-    for i in range(num_parts):
-        # Calculate progress
-        progress = PROGRESS_SPLITTING_START + (PROGRESS_SPLITTING_END - PROGRESS_SPLITTING_START) * (i / num_parts)
-        if progress_callback:
-            progress_callback(int(progress), f"Creating part {i+1} of {num_parts}...")
+    duration_ms = int(duration * 1000)  # Convert to milliseconds
+    overlap_ms = int(overlap * 1000)  # Convert to milliseconds
 
-        # Calculate start and end times
-        start_time = max(0, i * (duration_ms - overlap_ms))
-        end_time = min(total_duration, start_time + duration_ms)
+    # All boundaries in one go, the loop below only names the files
+    bounds = fixed_duration_bounds(total_duration, duration_ms, overlap_ms).tolist()
 
-        # Break if we've reached the end
-        if start_time >= total_duration:
-            break
-
-        # Extract segment
-        segment = audio[start_time:end_time]
+    # Parse the naming pattern and strip the extension once for all parts
+    name_part = compile_naming_pattern(naming_pattern, output_format)
+    base_name = os.path.splitext(original_name)[0]
+    jobs = []
 
+    for i, (start_time, end_time) in enumerate(bounds):
         # Generate output filename
-        filename = generate_output_filename(
-            original_name, i+1,
-            start_time/1000, end_time/1000,  # Convert to seconds
-            pattern=naming_pattern,
-            extension=output_format
-        )
-        output_path = os.path.join(output_dir, filename)
+        filename = name_part(base_name, i+1, start_time/1000, end_time/1000)  # Convert to seconds
+        jobs.append((start_time, end_time, os.path.join(output_dir, filename)))
 
-        # Export segment
-        segment.export(output_path, format=output_format)
-        output_files.append(output_path)
-
-    return output_files
+    return _export_jobs(
+        audio, jobs, progress_callback,
+        max_workers=kwargs.get("max_workers"), skip_existing=kwargs.get("skip_existing", False)
+    )
 
 def split_custom_ranges(
-    audio: AudioSegment,
+    audio: AudioSource,
     output_dir: str,
     original_name: str,
     output_format: str,
@@ -222,7 +399,7 @@ def split_custom_ranges(
     Split audio based on custom time ranges
 
     Args:
-        audio: AudioSegment to split
+        audio: PcmAudio or StreamedAudio to split
         output_dir: Output directory
         original_name: Original file name without extension
         output_format: Output format
@@ -230,6 +407,8 @@ def split_custom_ranges(
         progress_callback: Function for progress updates
         **kwargs: Additional parameters
             - ranges: List of (start, end) tuples in seconds
+            - max_workers: Number of segments written at once
+            - skip_existing: Don't re-export segments whose file already exists
 
     Returns:
         List of paths to the created audio files
@@ -240,37 +419,26 @@ def split_custom_ranges(
         raise ValueError("No time ranges specified")
 
     total_duration = len(audio)
-    output_files = []
+    # Parse the naming pattern and strip the extension once for all parts
+    name_part = compile_naming_pattern(naming_pattern, output_format)
+    base_name = os.path.splitext(original_name)[0]
+    jobs = []
 
     for i, (start_sec, end_sec) in enumerate(ranges):
-        # Calculate progress
-        progress = PROGRESS_SPLITTING_START + (PROGRESS_SPLITTING_END - PROGRESS_SPLITTING_START) * (i / len(ranges))
-        if progress_callback:
-            progress_callback(int(progress), f"Creating segment {i+1} of {len(ranges)}...")
-
         # Convert to milliseconds
-        start_time = max(0, start_sec * 1000)
-        end_time = min(total_duration, end_sec * 1000)
+        start_time = max(0, int(start_sec * 1000))
+        end_time = min(total_duration, int(end_sec * 1000))
 
         # Skip invalid ranges
         if start_time >= end_time or start_time >= total_duration:
             logger.warning(f"Skipping invalid range: {start_sec}-{end_sec}")
             continue
 
-        # Extract segment
-        segment = audio[start_time:end_time]
-
         # Generate output filename
-        filename = generate_output_filename(
-            original_name, i+1,
-            start_sec, end_sec,
-            pattern=naming_pattern,
-            extension=output_format
-        )
-        output_path = os.path.join(output_dir, filename)
-
-        # Export segment
-        segment.export(output_path, format=output_format)
-        output_files.append(output_path)
+        filename = name_part(base_name, i+1, start_sec, end_sec)
+        jobs.append((start_time, end_time, os.path.join(output_dir, filename)))
 
-    return output_files
\ No newline at end of file
+    return _export_jobs(
+        audio, jobs, progress_callback, label="segment",
+        max_workers=kwargs.get("max_workers"), skip_existing=kwargs.get("skip_existing", False)
+    )
\ No newline at end of file
@@ -9,13 +9,7 @@ Main entry point for the application
 import sys
 import os
 import logging
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QIcon
-from ui.main_window import MainWindow
-from core.config_manager import ConfigManager
-from utils.style_loader import apply_stylesheet
 from utils.logger import setup_logging
-from utils.translation_loader import translator
 
 # Set up logging
 setup_logging(
@@ -26,6 +20,15 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Main function to start the application"""
+    # Qt and the UI (which pulls in the audio libraries) are only loaded
+    # once the application actually starts
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QIcon
+    from ui.main_window import MainWindow
+    from core.config_manager import ConfigManager
+    from utils.style_loader import apply_stylesheet
+    from utils.translation_loader import translator
+
     # Create the application
     app = QApplication(sys.argv)
 
@@ -8,9 +8,11 @@ This script checks for required packages and installs them if needed before runn
 
 import sys
 import subprocess
+import shutil
+import functools
 import importlib.util
 import os
-import platform
+from importlib.metadata import distribution, PackageNotFoundError
 
 # Required packages
 REQUIRED_PACKAGES = [
@@ -21,55 +23,78 @@ REQUIRED_PACKAGES = [
     "PyQt5.QtMultimedia"
 ]
 
+@functools.lru_cache(maxsize=None)
 def check_package(package_name):
     """Check if a package is installed"""
-    return importlib.util.find_spec(package_name) is not None
+    # Submodules such as PyQt5.QtMultimedia ship with their distribution
+    top_level = package_name.split(".")[0]
+    try:
+        # Only reads the installed metadata, nothing gets imported
+        distribution(top_level)
+        return True
+    except PackageNotFoundError:
+        # Installed without metadata (e.g. some system packages)
+        return importlib.util.find_spec(top_level) is not None
 
 def install_package(package_name):
     """Install a package using pip"""
     print(f"Installing {package_name}...")
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
+        check_package.cache_clear()
         return True
     except subprocess.CalledProcessError:
         print(f"Failed to install {package_name}. Please install it manually.")
         return False
 
+def install_packages(package_names):
+    """Install several packages with a single pip run"""
+    print(f"Installing {', '.join(package_names)}...")
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *package_names])
+        check_package.cache_clear()
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
 def check_and_install_packages():
     """Check for required packages and install them if needed"""
-    all_packages_installed = True
+    missing = []
 
     for package in REQUIRED_PACKAGES:
         if not check_package(package):
             print(f"{package} is not installed.")
-            if not install_package(package):
-                all_packages_installed = False
+            missing.append(package)
         else:
             print(f"{package} is already installed.")
 
+    # Submodules are installed with their top-level package
+    missing = list(dict.fromkeys(package.split(".")[0] for package in missing))
+    if not missing or install_packages(missing):
+        return True
+
+    # Install one at a time so a single broken package doesn't block the others
+    all_packages_installed = True
+    for package in missing:
+        if not install_package(package):
+            all_packages_installed = False
+
     return all_packages_installed
 
 def check_ffmpeg():
     """Check if FFmpeg is installed"""
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        if result.returncode == 0:
-            print("FFmpeg is installed.")
-            return True
-        else:
-            print("FFmpeg is not installed or not in PATH.")
-            return False
-    except FileNotFoundError:
-        print("FFmpeg is not installed or not in PATH.")
-        return False
+    # Resolving the executable on PATH is enough, no need to start it
+    if shutil.which("ffmpeg") is not None:
+        print("FFmpeg is installed.")
+        return True
+
+    print("FFmpeg is not installed or not in PATH.")
+    return False
 
 def install_ffmpeg():
     """Provide instructions for installing FFmpeg"""
+    import platform
+
     system = platform.system()
 
     print("\nFFmpeg is required for audio processing.")
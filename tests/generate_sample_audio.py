@@ -9,7 +9,39 @@ import os
 import sys
 import numpy as np
 from pydub import AudioSegment
-from pydub.generators import Sine
+
+def generate_sine_samples(duration_ms=5000, freq=440, sample_rate=44100):
+    """
+    Generate the 16-bit samples of a full-scale sine wave
+
+    Args:
+        duration_ms: Duration in milliseconds
+        freq: Frequency in Hz
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        numpy int16 array of samples
+    """
+    t = np.arange(int(sample_rate * duration_ms / 1000), dtype=np.float64)
+    return (np.sin(2 * np.pi * freq * t / sample_rate) * 32767).astype(np.int16)
+
+def samples_to_audio_segment(samples, sample_rate=44100):
+    """
+    Wrap mono 16-bit samples in an audio segment
+
+    Args:
+        samples: numpy int16 array of samples
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        AudioSegment containing the samples
+    """
+    return AudioSegment(
+        data=samples.tobytes(),
+        sample_width=2,
+        frame_rate=sample_rate,
+        channels=1
+    )
 
 def generate_sine_wave(duration_ms=5000, freq=440, sample_rate=44100):
     """
@@ -23,8 +55,7 @@ def generate_sine_wave(duration_ms=5000, freq=440, sample_rate=44100):
     Returns:
         AudioSegment containing the sine wave
     """
-    sine_generator = Sine(freq, sample_rate=sample_rate)
-    return sine_generator.to_audio_segment(duration=duration_ms)
+    return samples_to_audio_segment(generate_sine_samples(duration_ms, freq, sample_rate), sample_rate)
 
 def generate_sample_files():
     """Generate sample audio files for testing"""
@@ -56,16 +87,16 @@ def generate_sample_files():
     segments = []
 
     # 10 seconds of 440 Hz
-    segments.append(generate_sine_wave(10000, 440))
+    segments.append(generate_sine_samples(10000, 440))
 
     # 10 seconds of 880 Hz
-    segments.append(generate_sine_wave(10000, 880))
+    segments.append(generate_sine_samples(10000, 880))
 
     # 10 seconds of 220 Hz
-    segments.append(generate_sine_wave(10000, 220))
+    segments.append(generate_sine_samples(10000, 220))
 
-    # Combine the segments
-    multi_freq = segments[0] + segments[1] + segments[2]
+    # Combine the samples once instead of copying the audio for every +
+    multi_freq = samples_to_audio_segment(np.concatenate(segments))
 
     # Export in MP3 format
     output_path = os.path.join(sample_dir, "multi_freq_30s.mp3")
@@ -3,6 +3,7 @@ Tests for the audio processor
 """
 
 import os
+import wave
 import unittest
 import tempfile
 from unittest.mock import MagicMock, patch
@@ -19,14 +20,14 @@ class TestAudioProcessor(unittest.TestCase):
         self.progress_callback = MagicMock()
         self.processor.set_progress_callback(self.progress_callback)
 
-    @patch('core.audio_processor.AudioSegment')
-    @patch('core.audio_processor.os.path.exists')
-    @patch('core.audio_processor.os.path.getsize')
-    def test_load_file(self, mock_getsize, mock_exists, mock_audio_segment):
+    @patch('pydub.AudioSegment')
+    @patch('core.audio_processor.os.stat')
+    def test_load_file(self, mock_stat, mock_audio_segment):
         """Test the load_file method"""
         # Mock the dependencies
-        mock_exists.return_value = True
-        mock_getsize.return_value = 1024
+        mock_stat.return_value = MagicMock(st_size=1024, st_mtime_ns=0)
+        self.processor.metadata_cache = MagicMock()
+        self.processor.metadata_cache.get.return_value = None
         mock_audio = MagicMock()
         mock_audio.channels = 2
         mock_audio.sample_width = 2
@@ -43,16 +44,132 @@ class TestAudioProcessor(unittest.TestCase):
         self.progress_callback.assert_called()
 
         # Test with a non-existent file
-        mock_exists.return_value = False
+        mock_stat.side_effect = FileNotFoundError
         result = self.processor.load_file("non_existent.mp3")
         self.assertFalse(result)
 
         # Test with an exception
-        mock_exists.return_value = True
+        mock_stat.side_effect = None
         mock_audio_segment.from_file.side_effect = Exception("Test error")
         result = self.processor.load_file("test.mp3")
         self.assertFalse(result)
 
+    @patch('core.audio_processor.StreamedAudio')
+    @patch('pydub.AudioSegment')
+    @patch('core.audio_processor.os.stat')
+    def test_load_file_low_memory(self, mock_stat, mock_audio_segment, mock_streamed_audio):
+        """Test that large files are streamed instead of decoded"""
+        mock_stat.return_value = MagicMock(st_size=1024, st_mtime_ns=0)
+        mock_stream = MagicMock()
+        mock_stream.channels = 2
+        mock_stream.sample_width = 2
+        mock_stream.frame_rate = 44100
+        mock_stream.__len__.return_value = 60000
+        mock_streamed_audio.return_value = mock_stream
+
+        cache = MagicMock()
+        cache.get.return_value = None
+        processor = AudioProcessor(low_memory=True, metadata_cache=cache)
+        self.assertTrue(processor.load_file("test.mp3"))
+        self.assertIsNone(processor.audio_segment)
+        self.assertEqual(processor.audio_stream, mock_stream)
+        self.assertEqual(processor.get_metadata()["duration_seconds"], 60)
+        mock_audio_segment.from_file.assert_not_called()
+
+    @patch('core.audio_processor.StreamedAudio')
+    def test_load_file_low_memory_without_ffprobe(self, mock_streamed_audio):
+        """Test that large files still load when they can't be probed"""
+        mock_streamed_audio.side_effect = FileNotFoundError("ffprobe")
+        cache = MagicMock()
+        cache.get.return_value = None
+        processor = AudioProcessor(low_memory=True, metadata_cache=cache)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "test.wav")
+            with wave.open(path, "wb") as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(1000)
+                w.writeframes(b"\x00\x00" * 2000)
+
+            self.assertTrue(processor.load_file(path))
+
+        self.assertIsNone(processor.audio_stream)
+        self.assertEqual(processor.get_metadata()["duration_seconds"], 2)
+
+    def test_extract_metadata_cached(self):
+        """Test that cached metadata is used for unchanged files"""
+        cache = MagicMock()
+        cached_metadata = {"filename": "test.mp3", "duration_seconds": 60}
+        cache.get.return_value = cached_metadata
+        processor = AudioProcessor(metadata_cache=cache)
+
+        with tempfile.NamedTemporaryFile(suffix=".mp3") as audio_file:
+            processor._extract_metadata(audio_file.name)
+
+        self.assertEqual(processor.get_metadata(), cached_metadata)
+        cache.put.assert_not_called()
+
+    @patch('core.audio_processor._get_mutagen_parser')
+    def test_read_metadata_tags(self, mock_get_parser):
+        """Test that tags are mapped per format"""
+        tags = MagicMock()
+        tags.info.bitrate = 256000
+        tags.get.side_effect = {"\xa9nam": ["Song"], "\xa9ART": ["Artist"]}.get
+        mock_get_parser.return_value = MagicMock(return_value=tags)
+
+        self.processor.audio_segment = MagicMock(channels=2, sample_width=2, frame_rate=44100)
+        self.processor.audio_segment.__len__.return_value = 60000
+
+        with tempfile.NamedTemporaryFile(suffix=".m4a") as audio_file:
+            self.processor._read_metadata(audio_file.name)
+
+        metadata = self.processor.get_metadata()
+        self.assertEqual(metadata["bitrate"], 256000)
+        self.assertEqual(metadata["title"], "Song")
+        self.assertEqual(metadata["artist"], "Artist")
+        self.assertEqual(metadata["album"], "Unknown")
+        tags.tags.pop.assert_called_with("covr", None)
+
+    @patch('pydub.AudioSegment')
+    def test_load_file_reads_headers(self, mock_audio_segment):
+        """Test that loading a file reads its headers without decoding it"""
+        cache = MagicMock()
+        cache.get.return_value = None
+        processor = AudioProcessor(low_memory=False, metadata_cache=cache)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "test.mp3")
+
+            # ID3v2 tag of 5 bytes followed by 100 MPEG-1 Layer III 128 kbps frames
+            frame = b"\xff\xfb\x90\x00" + b"\x00" * 413
+            with open(path, "wb") as f:
+                f.write(b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"\x00" * 5 + frame * 100)
+
+            self.assertTrue(processor.load_file(path, read_tags=False))
+
+        metadata = processor.get_metadata()
+        self.assertEqual(metadata["bitrate"], 128000)
+        self.assertEqual(metadata["frame_rate"], 44100)
+        self.assertAlmostEqual(metadata["duration_seconds"], 2.6, places=1)
+        mock_audio_segment.from_file.assert_not_called()
+        self.assertIsNone(processor.audio_segment)
+
+    @patch('core.audio_processor.time.monotonic')
+    def test_update_progress_throttled(self, mock_monotonic):
+        """Test that progress updates are coalesced"""
+        mock_monotonic.side_effect = [0.0, 0.01, 0.02, 0.1]
+
+        self.processor._update_progress(30, "a")
+        self.processor._update_progress(40, "b")
+        self.processor._update_progress(100, "c")
+        self.processor._update_progress(50, "d")
+
+        self.assertEqual(
+            [c[0][0] for c in self.progress_callback.call_args_list],
+            [30, 100, 50]
+        )
+
     def test_get_metadata(self):
         """Test the get_metadata method"""
         # Set up test metadata
@@ -90,7 +207,7 @@ class TestAudioProcessor(unittest.TestCase):
         self.progress_callback.assert_called()
 
         # Test with no audio loaded
-        self.processor.audio_segment = None
+        self.processor.audio_file = None
         output_files = self.processor.split_audio(
             method="equal_parts",
             output_dir="/output",
@@ -102,7 +219,7 @@ class TestAudioProcessor(unittest.TestCase):
         self.assertEqual(output_files, [])
 
         # Test with invalid output format
-        self.processor.audio_segment = MagicMock()
+        self.processor.audio_file = "test.mp3"
         output_files = self.processor.split_audio(
             method="equal_parts",
             output_dir="/output",
@@ -138,5 +255,61 @@ class TestAudioProcessor(unittest.TestCase):
 
         self.assertEqual(output_files, [])
 
+    @patch('core.audio_processor.split_audio')
+    @patch('core.audio_processor.ensure_directory_exists')
+    def test_split_audio_stream_copy(self, mock_ensure_dir, mock_split_audio):
+        """Test that same-format splits are cut without re-encoding"""
+        mock_ensure_dir.return_value = True
+        mock_split_audio.return_value = ["output1.mp3", "output2.mp3"]
+
+        # Only the header metadata is needed, nothing gets decoded
+        self.processor.audio_file = "test.mp3"
+        self.processor.metadata = {
+            "format": "mp3",
+            "channels": 2,
+            "sample_width": 2,
+            "frame_rate": 44100,
+            "duration_seconds": 60.0
+        }
+
+        self.assertTrue(self.processor._can_stream_copy("mp3", 0))
+        self.assertFalse(self.processor._can_stream_copy("mp3", 1))
+        self.assertFalse(self.processor._can_stream_copy("wav", 0))
+
+        self.processor.split_audio(
+            method="equal_parts",
+            output_dir="/output",
+            output_format="mp3",
+            naming_pattern="{original_name}_part_{number}",
+            num_parts=2
+        )
+        audio = mock_split_audio.call_args[0][0]
+        self.assertTrue(audio.stream_copy)
+        self.assertEqual(audio.path, "test.mp3")
+        self.assertEqual(len(audio), 60000)
+
+    def test_can_stream_copy_wav_source(self):
+        """Test that WAV sources are never stream copied"""
+        self.processor.audio_file = "test.wav"
+        self.processor.metadata = {"format": "wav"}
+
+        self.assertFalse(self.processor._can_stream_copy("wav", 0))
+
+    def test_can_stream_copy_between_containers(self):
+        """Test stream copying AAC between MP4 and ADTS containers"""
+        self.processor.audio_file = "test.m4a"
+
+        self.processor.metadata = {"format": "m4a", "codec": "mp4a.40.2"}
+        self.assertTrue(self.processor._can_stream_copy("aac", 0))
+
+        # ALAC can only be copied into another MP4 container
+        self.processor.metadata = {"format": "m4a", "codec": "alac"}
+        self.assertFalse(self.processor._can_stream_copy("aac", 0))
+        self.assertTrue(self.processor._can_stream_copy("m4a", 0))
+
+        self.processor.metadata = {"format": "aac"}
+        self.assertTrue(self.processor._can_stream_copy("m4a", 0))
+        self.assertFalse(self.processor._can_stream_copy("mp3", 0))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
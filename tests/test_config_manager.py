@@ -0,0 +1,96 @@
+"""
+Tests for the config manager
+"""
+
+import os
+import json
+import unittest
+import tempfile
+from unittest.mock import patch
+from core.config_manager import ConfigManager
+
+class TestConfigManager(unittest.TestCase):
+    """Test case for the ConfigManager class"""
+
+    def setUp(self):
+        """Set up the test case"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        home = self.temp_dir.name
+        with patch('core.config_manager.os.path.expanduser',
+                   side_effect=lambda path: path.replace("~", home)):
+            self.config_manager = ConfigManager()
+
+    def tearDown(self):
+        """Clean up the test case"""
+        self.config_manager.close()
+        self.temp_dir.cleanup()
+
+    def _read_config_file(self):
+        """Read the settings currently stored on disk"""
+        with open(self.config_manager.config_file, 'r') as f:
+            return json.load(f)
+
+    def test_default_settings(self):
+        """Test that a default config file is created"""
+        self.assertTrue(os.path.exists(self.config_manager.config_file))
+        self.assertEqual(self._read_config_file()["recent_files"], [])
+
+    def test_set_setting_is_batched(self):
+        """Test that changes are written together on flush"""
+        self.config_manager.set_setting("theme", "light")
+        self.config_manager.set_setting("language", "tw")
+
+        self.assertEqual(self.config_manager.get_setting("theme"), "light")
+        self.assertEqual(self._read_config_file()["theme"], "dark")
+
+        self.assertTrue(self.config_manager.flush())
+        settings = self._read_config_file()
+        self.assertEqual(settings["theme"], "light")
+        self.assertEqual(settings["language"], "tw")
+
+    def test_set_setting_flush(self):
+        """Test writing a setting immediately"""
+        self.assertTrue(self.config_manager.set_setting("theme", "light", flush=True))
+        self.assertEqual(self._read_config_file()["theme"], "light")
+        self.assertEqual(os.listdir(self.config_manager.config_dir), ["config.json"])
+
+    @patch('core.config_manager.atexit')
+    def test_exit_hook_only_while_dirty(self, mock_atexit):
+        """Test that the exit hook is only registered while changes are pending"""
+        self.config_manager.set_setting("theme", "light")
+        self.config_manager.set_setting("language", "tw")
+        mock_atexit.register.assert_called_once_with(self.config_manager.flush)
+
+        self.config_manager.flush()
+        mock_atexit.unregister.assert_called_once_with(self.config_manager.flush)
+
+    def test_add_recent_file(self):
+        """Test that re-added files move to the front"""
+        for path in ("a.mp3", "b.mp3", "c.mp3", "a.mp3"):
+            self.config_manager.add_recent_file(path, max_count=3)
+        self.config_manager.add_recent_file("d.mp3", max_count=3)
+
+        self.assertEqual(
+            self.config_manager.get_setting("recent_files"),
+            ["d.mp3", "a.mp3", "c.mp3"]
+        )
+
+    def test_get_recent_files_prunes_missing(self):
+        """Test that missing recent files are dropped"""
+        paths = [os.path.join(self.temp_dir.name, f"{name}.mp3") for name in ("a", "b", "c")]
+        for path in paths[:2]:
+            open(path, "wb").close()
+        for path in reversed(paths):
+            self.config_manager.add_recent_file(path)
+
+        self.assertEqual(self.config_manager.get_recent_files(), paths[:2])
+        self.assertEqual(self.config_manager.get_setting("recent_files"), paths[:2])
+
+    @patch('core.config_manager.orjson', None)
+    def test_json_fallback(self):
+        """Test saving and loading settings without orjson"""
+        self.assertTrue(self.config_manager.set_setting("theme", "light", flush=True))
+        self.assertEqual(self.config_manager._load_settings()["theme"], "light")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for the ffmpeg helpers
+"""
+
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+from core.ffmpeg_tools import probe_audio, cut_audio, segment_audio, encode_pcm, StreamedAudio
+
+class TestFFmpegTools(unittest.TestCase):
+    """Test case for the ffmpeg helpers"""
+
+    @patch('core.ffmpeg_tools.subprocess.run')
+    def test_probe_audio(self, mock_run):
+        """Test the probe_audio function"""
+        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps({
+            "streams": [{
+                "codec_name": "mp3",
+                "channels": 1,
+                "sample_rate": "22050",
+                "sample_fmt": "fltp"
+            }],
+            "format": {"duration": "12.5"}
+        }).encode("utf-8"))
+
+        info = probe_audio("test.mp3")
+        self.assertEqual(info["duration_ms"], 12500)
+        self.assertEqual(info["channels"], 1)
+        self.assertEqual(info["frame_rate"], 22050)
+        self.assertEqual(info["sample_width"], 4)
+        self.assertEqual(info["codec"], "mp3")
+
+        # Test a file without an audio stream
+        mock_run.return_value = MagicMock(returncode=0, stdout=b'{"streams": []}')
+        with self.assertRaises(RuntimeError):
+            probe_audio("test.mp3")
+
+        # Test an ffprobe failure
+        mock_run.return_value = MagicMock(returncode=1, stderr=b"error")
+        with self.assertRaises(RuntimeError):
+            probe_audio("test.mp3")
+
+    @patch('core.ffmpeg_tools.subprocess.run')
+    def test_cut_audio(self, mock_run):
+        """Test the cut_audio function"""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        cut_audio("in.mp3", "out.wav", 1500, 4000)
+        cmd = mock_run.call_args[0][0]
+        self.assertEqual(cmd[cmd.index("-ss") + 1], "1.500")
+        self.assertEqual(cmd[cmd.index("-t") + 1], "2.500")
+        self.assertEqual(cmd[cmd.index("-i") + 1], "in.mp3")
+        self.assertEqual(cmd[-1], "out.wav")
+        self.assertNotIn("copy", cmd)
+
+        cut_audio("in.mp3", "out.mp3", 1500, 4000, stream_copy=True)
+        cmd = mock_run.call_args[0][0]
+        self.assertEqual(cmd[cmd.index("-c") + 1], "copy")
+        self.assertEqual(cmd[-1], "out.mp3")
+
+    @patch('core.ffmpeg_tools.subprocess.run')
+    def test_segment_audio(self, mock_run):
+        """Test the segment_audio function"""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        segment_audio("in.mp3", "out/%04d.mp3", 1000, 31000, [11000, 21000], stream_copy=True)
+        cmd = mock_run.call_args[0][0]
+        self.assertEqual(cmd[cmd.index("-ss") + 1], "1.000")
+        self.assertEqual(cmd[cmd.index("-t") + 1], "30.000")
+        self.assertEqual(cmd[cmd.index("-c") + 1], "copy")
+        self.assertEqual(cmd[cmd.index("-f") + 1], "segment")
+        self.assertEqual(cmd[cmd.index("-segment_times") + 1], "10.000,20.000")
+        self.assertEqual(cmd[-1], "out/%04d.mp3")
+
+    @patch('core.ffmpeg_tools.subprocess.run')
+    def test_encode_pcm(self, mock_run):
+        """Test the encode_pcm function"""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        encode_pcm(b"\x00\x00" * 4, "out.mp3", 8000, 2, 2)
+        cmd = mock_run.call_args[0][0]
+        self.assertEqual(cmd[cmd.index("-f") + 1], "s16le")
+        self.assertEqual(cmd[cmd.index("-ar") + 1], "8000")
+        self.assertEqual(cmd[cmd.index("-ac") + 1], "2")
+        self.assertEqual(cmd[cmd.index("-i") + 1], "-")
+        self.assertEqual(mock_run.call_args[1]["input"], b"\x00\x00" * 4)
+
+    def test_streamed_audio(self):
+        """Test the StreamedAudio handle"""
+        info = {
+            "duration_ms": 60000,
+            "channels": 2,
+            "frame_rate": 44100,
+            "sample_width": 2,
+            "codec": "mp3"
+        }
+        audio = StreamedAudio("test.mp3", info)
+        self.assertEqual(len(audio), 60000)
+        self.assertEqual(audio.channels, 2)
+        self.assertEqual(audio.frame_rate, 44100)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Tests for the file handler functions
+"""
+
+import os
+import unittest
+import tempfile
+from unittest.mock import patch
+from core.file_handler import get_files_in_directory
+
+class TestFileHandler(unittest.TestCase):
+    """Test case for file handler functions"""
+
+    def setUp(self):
+        """Set up the test case"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        for name in ["a.mp3", "b.WAV", "notes.txt"]:
+            with open(os.path.join(self.temp_dir.name, name), "w") as f:
+                f.write("data")
+        os.makedirs(os.path.join(self.temp_dir.name, "folder.mp3"))
+
+    def tearDown(self):
+        """Clean up the test case"""
+        self.temp_dir.cleanup()
+
+    def _names(self, paths):
+        """Get the sorted base names of a list of paths"""
+        return sorted(os.path.basename(p) for p in paths)
+
+    def test_get_files_in_directory(self):
+        """Test the get_files_in_directory function"""
+        self.assertEqual(
+            self._names(get_files_in_directory(self.temp_dir.name)),
+            ["a.mp3", "b.WAV"]
+        )
+        self.assertEqual(
+            self._names(get_files_in_directory(self.temp_dir.name, filter_audio=False)),
+            ["a.mp3", "b.WAV", "notes.txt"]
+        )
+
+        # Test with a non-existent directory
+        self.assertEqual(get_files_in_directory(os.path.join(self.temp_dir.name, "missing")), [])
+
+    @patch('core.file_handler.is_network_path', return_value=True)
+    def test_get_files_in_network_directory(self, mock_is_network_path):
+        """Test that network directories give the same result"""
+        self.assertEqual(
+            self._names(get_files_in_directory(self.temp_dir.name)),
+            ["a.mp3", "b.WAV"]
+        )
+        mock_is_network_path.assert_called_once()
+
+if __name__ == "__main__":
+    unittest.main()
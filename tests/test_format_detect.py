@@ -0,0 +1,45 @@
+"""
+Tests for the format detection
+"""
+
+import os
+import unittest
+import tempfile
+from utils.format_detect import sniff_format
+
+class TestFormatDetect(unittest.TestCase):
+    """Test case for the format detection"""
+
+    def setUp(self):
+        """Set up the test case"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up the test case"""
+        self.temp_dir.cleanup()
+
+    def _write(self, data, name="audio"):
+        """Write a test file and return its path"""
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_sniff_format(self):
+        """Test detecting formats from their leading bytes"""
+        self.assertEqual(sniff_format(self._write(b"ID3\x04\x00" + b"\x00" * 7)), "mp3")
+        self.assertEqual(sniff_format(self._write(b"\xff\xfb\x90\x00")), "mp3")
+        self.assertEqual(sniff_format(self._write(b"\xff\xf1\x50\x80")), "aac")
+        self.assertEqual(sniff_format(self._write(b"RIFF\x24\x00\x00\x00WAVE")), "wav")
+        self.assertEqual(sniff_format(self._write(b"fLaC\x00\x00\x00\x22")), "flac")
+        self.assertEqual(sniff_format(self._write(b"OggS\x00\x02")), "ogg")
+        self.assertEqual(sniff_format(self._write(b"\x00\x00\x00\x20ftypM4A ")), "m4a")
+
+    def test_sniff_format_unknown(self):
+        """Test files that are not recognized"""
+        self.assertIsNone(sniff_format(self._write(b"not audio")))
+        self.assertIsNone(sniff_format(self._write(b"")))
+        self.assertIsNone(sniff_format(os.path.join(self.temp_dir.name, "missing")))
+
+if __name__ == "__main__":
+    unittest.main()
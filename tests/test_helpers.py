@@ -8,10 +8,12 @@ import tempfile
 from utils.helpers import (
     format_time,
     parse_time,
+    try_parse_time,
     get_file_extension,
     human_readable_size,
     ensure_directory_exists,
-    generate_output_filename
+    generate_output_filename,
+    compile_naming_pattern
 )
 
 class TestHelpers(unittest.TestCase):
@@ -41,6 +43,18 @@ class TestHelpers(unittest.TestCase):
         with self.assertRaises(ValueError):
             parse_time("01:60")
 
+    def test_try_parse_time(self):
+        """Test the try_parse_time function"""
+        self.assertEqual(try_parse_time("00:00"), 0)
+        self.assertEqual(try_parse_time("01:30"), 90)
+        self.assertEqual(try_parse_time("120:05"), 7205)
+
+        # Invalid formats give None instead of raising
+        self.assertIsNone(try_parse_time(""))
+        self.assertIsNone(try_parse_time("1:30"))
+        self.assertIsNone(try_parse_time("01:60"))
+        self.assertIsNone(try_parse_time("invalid"))
+
     def test_get_file_extension(self):
         """Test the get_file_extension function"""
         self.assertEqual(get_file_extension("file.mp3"), "mp3")
@@ -50,6 +64,11 @@ class TestHelpers(unittest.TestCase):
         self.assertEqual(get_file_extension("file."), "")
         self.assertEqual(get_file_extension("/path/to/file.mp3"), "mp3")
 
+        # Repeated lookups are served from the cache
+        hits = get_file_extension.cache_info().hits
+        self.assertEqual(get_file_extension("file.MP3"), "mp3")
+        self.assertEqual(get_file_extension.cache_info().hits, hits + 1)
+
     def test_human_readable_size(self):
         """Test the human_readable_size function"""
         self.assertEqual(human_readable_size(0), "0 B")
@@ -94,5 +113,12 @@ class TestHelpers(unittest.TestCase):
         )
         self.assertEqual(filename, "test_part_1.wav")
 
+    def test_compile_naming_pattern(self):
+        """Test the compile_naming_pattern function"""
+        name = compile_naming_pattern("{original_name}_{number:02d}_{start_time}", "ogg")
+        self.assertEqual(name("test", 3, 90, 120), "test_03_01:30.ogg")
+        self.assertEqual(name("test", 4), "test_04_.ogg")
+        self.assertIs(compile_naming_pattern("{original_name}_{number:02d}_{start_time}", "ogg"), name)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
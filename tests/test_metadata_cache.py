@@ -0,0 +1,62 @@
+"""
+Tests for the metadata cache
+"""
+
+import os
+import unittest
+import tempfile
+from core.metadata_cache import MetadataCache
+
+class TestMetadataCache(unittest.TestCase):
+    """Test case for the MetadataCache class"""
+
+    def setUp(self):
+        """Set up the test case"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = MetadataCache(os.path.join(self.temp_dir.name, "cache", "metadata.db"))
+        self.audio_path = os.path.join(self.temp_dir.name, "test.mp3")
+        with open(self.audio_path, "wb") as f:
+            f.write(b"audio")
+
+    def tearDown(self):
+        """Clean up the test case"""
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_get_and_put(self):
+        """Test storing and reading metadata"""
+        metadata = {"filename": "test.mp3", "duration_seconds": 60}
+
+        self.assertIsNone(self.cache.get(self.audio_path))
+        self.assertTrue(self.cache.put(self.audio_path, metadata))
+        self.assertEqual(self.cache.get(self.audio_path), metadata)
+
+    def test_relative_path(self):
+        """Test that relative and absolute paths share an entry"""
+        metadata = {"filename": "test.mp3"}
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        try:
+            self.assertTrue(self.cache.put("test.mp3", metadata))
+        finally:
+            os.chdir(cwd)
+
+        # getcwd() resolves symlinks in the temp directory (e.g. on macOS)
+        self.assertEqual(self.cache.get(os.path.realpath(self.audio_path)), metadata)
+
+    def test_invalidation(self):
+        """Test that entries are ignored once the file changes"""
+        self.cache.put(self.audio_path, {"filename": "test.mp3"})
+
+        with open(self.audio_path, "ab") as f:
+            f.write(b"more audio")
+
+        self.assertIsNone(self.cache.get(self.audio_path))
+
+    def test_missing_file(self):
+        """Test that missing files are never served from the cache"""
+        self.assertFalse(self.cache.put("non_existent.mp3", {}))
+        self.assertIsNone(self.cache.get("non_existent.mp3"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for the PcmAudio class
+"""
+
+import os
+import sys
+import wave
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pydub import AudioSegment
+
+from core.pcm_audio import PcmAudio
+
+class TestPcmAudio(unittest.TestCase):
+    """Test cases for the PcmAudio class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        # One second of 16-bit stereo audio at 1000 Hz with increasing samples
+        samples = np.arange(2000, dtype="<i2")
+        self.segment = AudioSegment(
+            data=samples.tobytes(),
+            sample_width=2,
+            frame_rate=1000,
+            channels=2
+        )
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_from_segment(self):
+        """Test wrapping an AudioSegment"""
+        audio = PcmAudio.from_segment(self.segment)
+
+        self.assertEqual(len(audio), 1000)
+        self.assertEqual(audio.channels, 2)
+        self.assertEqual(audio.samples.shape, (1000, 2))
+
+        view = audio.get_range(100, 200)
+        self.assertEqual(view.shape, (100, 2))
+        self.assertEqual(view[0, 0], 200)
+        self.assertTrue(np.shares_memory(view, audio.samples))
+
+    def test_export_range_wav(self):
+        """Test exporting a range to WAV"""
+        audio = PcmAudio.from_segment(self.segment)
+        output_path = os.path.join(self.temp_dir, "part.wav")
+
+        audio.export_range(250, 500, output_path)
+
+        with wave.open(output_path, "rb") as w:
+            self.assertEqual(w.getnchannels(), 2)
+            self.assertEqual(w.getframerate(), 1000)
+            self.assertEqual(w.getnframes(), 250)
+            frames = w.readframes(w.getnframes())
+        self.assertEqual(frames, self.segment[250:500].raw_data)
+
+    def test_export_range_wav_8bit(self):
+        """Test exporting 8-bit audio, which WAV stores unsigned"""
+        segment = AudioSegment(data=bytes(range(256)), sample_width=1, frame_rate=1000, channels=1)
+        output_path = os.path.join(self.temp_dir, "part.wav")
+
+        PcmAudio.from_segment(segment).export_range(0, 256, output_path)
+
+        self.assertEqual(AudioSegment.from_wav(output_path).raw_data, segment.raw_data)
+
+    @patch('core.pcm_audio.encode_pcm')
+    def test_export_range_encoded(self, mock_encode_pcm):
+        """Test exporting a range to a compressed format"""
+        audio = PcmAudio.from_segment(self.segment)
+
+        audio.export_range(0, 10, "part.mp3")
+
+        args = mock_encode_pcm.call_args[0]
+        self.assertEqual(bytes(args[0]), self.segment[0:10].raw_data)
+        self.assertEqual(args[1:], ("part.mp3", 1000, 2, 2))
+
+if __name__ == '__main__':
+    unittest.main()
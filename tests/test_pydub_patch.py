@@ -0,0 +1,44 @@
+"""
+Tests for the pydub from_file patch
+"""
+
+import io
+import wave
+import unittest
+from pydub import AudioSegment
+from core._pydub_patch import _segment_from_wav_bytearray
+
+class TestPydubPatch(unittest.TestCase):
+    """Test case for the pydub from_file patch"""
+
+    def _make_wav(self, frames: bytes, sample_width: int = 2, channels: int = 2) -> bytearray:
+        """Create WAV data with a broken size header, as ffmpeg writes to a pipe"""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as w:
+            w.setnchannels(channels)
+            w.setsampwidth(sample_width)
+            w.setframerate(8000)
+            w.writeframes(frames)
+        data = bytearray(buffer.getvalue())
+        data[4:8] = b"\xff\xff\xff\xff"
+        return data
+
+    def test_segment_from_wav_bytearray(self):
+        """Test building a segment from decoded WAV data"""
+        frames = bytes(range(256)) * 4
+        segment = _segment_from_wav_bytearray(AudioSegment, self._make_wav(frames))
+
+        self.assertEqual(segment.raw_data, frames)
+        self.assertEqual(segment.channels, 2)
+        self.assertEqual(segment.sample_width, 2)
+        self.assertEqual(segment.frame_rate, 8000)
+
+        # 8-bit audio is left to pydub
+        self.assertIsNone(_segment_from_wav_bytearray(AudioSegment, self._make_wav(frames, 1, 1)))
+
+    def test_from_file_is_patched(self):
+        """Test that importing the module replaced AudioSegment.from_file"""
+        self.assertEqual(AudioSegment.from_file.__func__.__module__, "core._pydub_patch")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+"""
+Tests for the splitter module
+"""
+
+import os
+import sys
+import wave
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pydub import AudioSegment
+
+from core.ffmpeg_tools import StreamedAudio
+from core.splitter import split_audio, equal_parts_bounds, fixed_duration_bounds
+from utils.constants import (
+    SPLIT_METHOD_EQUAL,
+    SPLIT_METHOD_DURATION,
+    SPLIT_METHOD_CUSTOM,
+    PROGRESS_SPLITTING_END
+)
+
+class TestSplitter(unittest.TestCase):
+    """Test cases for the splitter module"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        # Ten seconds of 16-bit mono audio at 1000 Hz
+        self.audio = AudioSegment(
+            data=np.arange(10000, dtype="<i2").tobytes(),
+            sample_width=2,
+            frame_rate=1000,
+            channels=1
+        )
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        shutil.rmtree(self.temp_dir)
+
+    def _frame_count(self, path):
+        """Get the number of frames in a WAV file"""
+        with wave.open(path, "rb") as w:
+            return w.getnframes()
+
+    def test_split_equal_parts(self):
+        """Test splitting into equal parts"""
+        progress_callback = MagicMock()
+
+        output_files = split_audio(
+            self.audio, SPLIT_METHOD_EQUAL, self.temp_dir, "test", "wav",
+            "{original_name}_part_{number:03d}", progress_callback, num_parts=4
+        )
+
+        self.assertEqual(
+            [os.path.basename(f) for f in output_files],
+            [f"test_part_00{i}.wav" for i in range(1, 5)]
+        )
+        for output_file in output_files:
+            self.assertEqual(self._frame_count(output_file), 2500)
+
+        self.assertEqual(progress_callback.call_count, 4)
+        self.assertEqual(progress_callback.call_args[0][0], PROGRESS_SPLITTING_END)
+
+    def test_split_fixed_duration_sequential(self):
+        """Test splitting into fixed durations with a single worker"""
+        output_files = split_audio(
+            self.audio, SPLIT_METHOD_DURATION, self.temp_dir, "test", "wav",
+            "{original_name}_part_{number:03d}", duration=5, max_workers=1
+        )
+
+        self.assertEqual(
+            [self._frame_count(f) for f in output_files],
+            [5000, 5000]
+        )
+
+    def test_equal_parts_bounds(self):
+        """Test the equal-parts boundaries, with and without overlap"""
+        self.assertEqual(
+            equal_parts_bounds(10000, 3).tolist(),
+            [[0, 3333], [3333, 6666], [6666, 10000]]
+        )
+        self.assertEqual(
+            equal_parts_bounds(10000, 2, 500).tolist(),
+            [[0, 5500], [4500, 10000]]
+        )
+
+    def test_fixed_duration_bounds(self):
+        """Test the fixed-duration boundaries, including a shorter last part"""
+        self.assertEqual(
+            fixed_duration_bounds(10000, 3000).tolist(),
+            [[0, 3000], [3000, 6000], [6000, 9000], [9000, 10000]]
+        )
+        self.assertEqual(
+            fixed_duration_bounds(10000, 3000, 1000).tolist(),
+            [[0, 3000], [2000, 5000], [4000, 7000], [6000, 9000], [8000, 10000]]
+        )
+        self.assertEqual(fixed_duration_bounds(2000, 3000).tolist(), [[0, 2000]])
+        self.assertEqual(len(fixed_duration_bounds(0, 3000)), 0)
+        with self.assertRaises(ValueError):
+            fixed_duration_bounds(10000, 3000, 3000)
+
+    def test_progress_reported_per_percent(self):
+        """Test that completions that don't change the percentage aren't reported"""
+        progress_callback = MagicMock()
+
+        output_files = split_audio(
+            self.audio, SPLIT_METHOD_EQUAL, self.temp_dir, "test", "wav",
+            "{original_name}_part_{number:03d}", progress_callback, num_parts=200
+        )
+
+        self.assertEqual(len(output_files), 200)
+        reported = [c[0][0] for c in progress_callback.call_args_list]
+        self.assertEqual(len(reported), len(set(reported)))
+        self.assertEqual(reported[-1], PROGRESS_SPLITTING_END)
+        self.assertLess(len(reported), 200)
+
+    def test_split_custom_ranges(self):
+        """Test splitting custom ranges, skipping invalid ones"""
+        output_files = split_audio(
+            self.audio, SPLIT_METHOD_CUSTOM, self.temp_dir, "test", "wav",
+            "{original_name}_part_{number:03d}", ranges=[(0, 2), (5, 4), (8, 20)]
+        )
+
+        self.assertEqual(len(output_files), 2)
+        self.assertEqual(self._frame_count(output_files[0]), 2000)
+        self.assertEqual(self._frame_count(output_files[1]), 2000)
+
+    def test_skip_existing(self):
+        """Test that existing outputs are kept and only missing ones are exported"""
+        existing = os.path.join(self.temp_dir, "test_part_001.wav")
+        with open(existing, "wb") as f:
+            f.write(b"keep")
+
+        output_files = split_audio(
+            self.audio, SPLIT_METHOD_EQUAL, self.temp_dir, "test", "wav",
+            "{original_name}_part_{number:03d}", num_parts=2, skip_existing=True
+        )
+
+        self.assertEqual(output_files[0], existing)
+        with open(existing, "rb") as f:
+            self.assertEqual(f.read(), b"keep")
+        self.assertEqual(self._frame_count(output_files[1]), 5000)
+
+    @patch('core.splitter.segment_audio')
+    def test_split_streamed_segment_muxer(self, mock_segment_audio):
+        """Test that a streamed source is split with one segment muxer run"""
+        def write_pieces(source_path, output_pattern, start_ms, end_ms, cut_times_ms, stream_copy):
+            for i in range(len(cut_times_ms) + 1):
+                with open(output_pattern % i, "wb") as f:
+                    f.write(str(i).encode())
+
+        mock_segment_audio.side_effect = write_pieces
+        audio = StreamedAudio("in.mp3", {
+            "duration_ms": 10000, "channels": 1, "frame_rate": 1000, "sample_width": 2, "codec": "mp3"
+        })
+
+        output_files = split_audio(
+            audio, SPLIT_METHOD_CUSTOM, self.temp_dir, "test", "mp3",
+            "{original_name}_part_{number:03d}", ranges=[(0, 2), (5, 8)]
+        )
+
+        mock_segment_audio.assert_called_once_with(
+            "in.mp3", unittest.mock.ANY, 0, 8000, [2000, 5000], False
+        )
+        # The gap between the ranges is discarded
+        contents = []
+        for output_file in output_files:
+            with open(output_file, "rb") as f:
+                contents.append(f.read())
+        self.assertEqual(contents, [b"0", b"2"])
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), sorted(os.path.basename(f) for f in output_files))
+
+    @patch('core.ffmpeg_tools.cut_audio')
+    @patch('core.splitter.segment_audio')
+    def test_split_streamed_overlap(self, mock_segment_audio, mock_cut_audio):
+        """Test that overlapping parts are cut one by one"""
+        audio = StreamedAudio("in.mp3", {
+            "duration_ms": 10000, "channels": 1, "frame_rate": 1000, "sample_width": 2, "codec": "mp3"
+        })
+
+        output_files = split_audio(
+            audio, SPLIT_METHOD_CUSTOM, self.temp_dir, "test", "mp3",
+            "{original_name}_part_{number:03d}", ranges=[(0, 5), (4, 8)]
+        )
+
+        mock_segment_audio.assert_not_called()
+        self.assertEqual(mock_cut_audio.call_count, 2)
+        self.assertEqual(len(output_files), 2)
+
+if __name__ == '__main__':
+    unittest.main()
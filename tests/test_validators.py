@@ -5,6 +5,7 @@ Tests for the validator functions
 import os
 import unittest
 import tempfile
+from unittest.mock import patch
 from utils.validators import (
     is_valid_audio_file,
     is_valid_output_format,
@@ -17,45 +18,49 @@ from utils.validators import (
 class TestValidators(unittest.TestCase):
     """Test case for validator functions"""
 
-    def test_is_valid_audio_file(self):
+    @patch('utils.validators.os.path.isfile')
+    def test_is_valid_audio_file(self, mock_isfile):
         """Test the is_valid_audio_file function"""
-        # Create temporary files for testing
-        with tempfile.NamedTemporaryFile(suffix=".mp3") as mp3_file, \
-             tempfile.NamedTemporaryFile(suffix=".txt") as txt_file:
+        mock_isfile.return_value = True
 
-            # Test valid audio file
-            self.assertTrue(is_valid_audio_file(mp3_file.name))
+        # Test valid audio file
+        self.assertTrue(is_valid_audio_file("/tmp/test.mp3"))
 
-            # Test invalid audio file
-            self.assertFalse(is_valid_audio_file(txt_file.name))
+        # Test invalid audio file
+        self.assertFalse(is_valid_audio_file("/tmp/test.txt"))
 
-            # Test non-existent file
-            self.assertFalse(is_valid_audio_file("non_existent_file.mp3"))
+        # Test non-existent file
+        mock_isfile.return_value = False
+        self.assertFalse(is_valid_audio_file("non_existent_file.mp3"))
 
     def test_is_valid_output_format(self):
         """Test the is_valid_output_format function"""
-        # Test valid formats
-        self.assertTrue(is_valid_output_format("mp3"))
-        self.assertTrue(is_valid_output_format("wav"))
-        self.assertTrue(is_valid_output_format("MP3"))  # Case insensitive
-
-        # Test invalid formats
-        self.assertFalse(is_valid_output_format("txt"))
-        self.assertFalse(is_valid_output_format(""))
+        cases = [
+            ("mp3", True),
+            ("wav", True),
+            ("MP3", True),  # Case insensitive
+            ("txt", False),
+            ("", False),
+        ]
+        for format_str, expected in cases:
+            with self.subTest(format_str=format_str):
+                self.assertEqual(is_valid_output_format(format_str), expected)
 
     def test_is_valid_time_format(self):
         """Test the is_valid_time_format function"""
-        # Test valid formats
-        self.assertTrue(is_valid_time_format("00:00"))
-        self.assertTrue(is_valid_time_format("01:30"))
-        self.assertTrue(is_valid_time_format("99:59"))
-
-        # Test invalid formats
-        self.assertFalse(is_valid_time_format(""))
-        self.assertFalse(is_valid_time_format("1:30"))  # Missing leading zero
-        self.assertFalse(is_valid_time_format("01:60"))  # Seconds > 59
-        self.assertFalse(is_valid_time_format("01:5"))   # Missing trailing zero
-        self.assertFalse(is_valid_time_format("01-30"))  # Wrong separator
+        cases = [
+            ("00:00", True),
+            ("01:30", True),
+            ("99:59", True),
+            ("", False),
+            ("1:30", False),   # Missing leading zero
+            ("01:60", False),  # Seconds > 59
+            ("01:5", False),   # Missing trailing zero
+            ("01-30", False),  # Wrong separator
+        ]
+        for time_str, expected in cases:
+            with self.subTest(time_str=time_str):
+                self.assertEqual(is_valid_time_format(time_str), expected)
 
     def test_is_valid_time_range(self):
         """Test the is_valid_time_range function"""
@@ -103,29 +108,21 @@ class TestValidators(unittest.TestCase):
 
     def test_is_valid_naming_pattern(self):
         """Test the is_valid_naming_pattern function"""
-        # Test valid patterns
-        valid, _ = is_valid_naming_pattern("{original_name}_part_{number}")
-        self.assertTrue(valid)
-
-        valid, _ = is_valid_naming_pattern("{original_name}_{start_time}-{end_time}")
-        self.assertTrue(valid)
-
-        # Test invalid patterns
-        valid, error = is_valid_naming_pattern("")
-        self.assertFalse(valid)
-        self.assertIn("Naming pattern cannot be empty", error)
-
-        valid, error = is_valid_naming_pattern("part_{number}")
-        self.assertFalse(valid)
-        self.assertIn("must include {original_name}", error)
-
-        valid, error = is_valid_naming_pattern("{original_name}_part")
-        self.assertFalse(valid)
-        self.assertIn("must include at least one of", error)
-
-        valid, error = is_valid_naming_pattern("{original_name}_part_{number}?")
-        self.assertFalse(valid)
-        self.assertIn("contains invalid characters", error)
+        # (pattern, expected validity, expected part of the error message)
+        cases = [
+            ("{original_name}_part_{number}", True, None),
+            ("{original_name}_{start_time}-{end_time}", True, None),
+            ("", False, "Naming pattern cannot be empty"),
+            ("part_{number}", False, "must include {original_name}"),
+            ("{original_name}_part", False, "must include at least one of"),
+            ("{original_name}_part_{number}?", False, "contains invalid characters"),
+        ]
+        for pattern, expected, error_part in cases:
+            with self.subTest(pattern=pattern):
+                valid, error = is_valid_naming_pattern(pattern)
+                self.assertEqual(valid, expected)
+                if error_part is not None:
+                    self.assertIn(error_part, error)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -4,6 +4,8 @@ About dialog for AudKyɛfo
 
 import logging
 import os
+import functools
+from typing import Dict
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
     QScrollArea, QFrame, QWidget
@@ -12,11 +14,54 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QPixmap, QIcon
 
 from utils.constants import APP_NAME, APP_DISPLAY_NAME, APP_VERSION, APP_AUTHOR
-from utils.translation_loader import tr
+from utils.translation_loader import tr, get_current_language
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+ICON_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icons", "app.png")
+
+@functools.lru_cache(maxsize=1)
+def _app_icon_pixmap() -> QPixmap:
+    """
+    Load the app icon once for all dialogs
+
+    Pixmaps need a running QApplication, so this runs on first use rather
+    than at import.
+
+    Returns:
+        The 64x64 app icon
+    """
+    # Fall back to the resource path if the icon isn't on disk
+    icon_path = ICON_PATH if os.path.exists(ICON_PATH) else ":/icons/app.png"
+    return QIcon(icon_path).pixmap(64, 64)
+
+@functools.lru_cache(maxsize=None)
+def _about_texts(language: str) -> Dict[str, str]:
+    """
+    Translate and format the dialog texts once per language
+
+    The texts only depend on the app constants and the language, which is
+    part of the cache key, so a language change needs no invalidation.
+
+    Args:
+        language: Current language code
+
+    Returns:
+        Dictionary of the formatted texts
+    """
+    return {
+        "title": tr("ui.about_dialog.title", "About {app_name}").format(app_name=APP_NAME),
+        "name": tr("app.display_name", APP_DISPLAY_NAME),
+        "version": tr("ui.about_dialog.version", "Version {version}").format(version=APP_VERSION),
+        "author": tr("ui.about_dialog.created_by", "Created by {author}").format(author=APP_AUTHOR),
+        "description": tr("ui.about_dialog.description",
+            "AudKyɛfo is an offline desktop application for splitting audio files "
+            "into segments based on custom preferences."
+        ),
+        "close": tr("ui.about_dialog.close_button", "Close"),
+    }
+
 class AboutDialog(QDialog):
     """
     Dialog showing information about the application
@@ -36,8 +81,10 @@ class AboutDialog(QDialog):
 
     def setup_ui(self):
         """Set up the user interface"""
+        texts = _about_texts(get_current_language())
+
         # Set window properties
-        self.setWindowTitle(tr("ui.about_dialog.title", "About {app_name}").format(app_name=APP_NAME))
+        self.setWindowTitle(texts["title"])
         self.setMinimumSize(400, 300)
         self.resize(450, 350)
 
@@ -66,76 +113,50 @@ class AboutDialog(QDialog):
         # App icon
         icon_label = QLabel()
         icon_label.setAlignment(Qt.AlignCenter)
-
-        # Try to load the app icon from resources
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icons", "app.png")
-        if os.path.exists(icon_path):
-            icon_label.setPixmap(QIcon(icon_path).pixmap(64, 64))
-        else:
-            # Fallback to the resource path
-            icon_label.setPixmap(QIcon(":/icons/app.png").pixmap(64, 64))
+        icon_label.setPixmap(_app_icon_pixmap())
 
         main_layout.addWidget(icon_label)
 
         # App name
-        app_display_name = tr("app.display_name", APP_DISPLAY_NAME)
-        name_label = QLabel(app_display_name)
-        name_label.setAlignment(Qt.AlignCenter)
-        name_label.setStyleSheet("font-size: 18px; font-weight: bold;")
-        main_layout.addWidget(name_label)
+        self.name_label = QLabel(texts["name"])
+        self.name_label.setAlignment(Qt.AlignCenter)
+        self.name_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        main_layout.addWidget(self.name_label)
 
         # App version
-        version_text = tr("ui.about_dialog.version", "Version {version}").format(version=APP_VERSION)
-        version_label = QLabel(version_text)
-        version_label.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(version_label)
+        self.version_label = QLabel(texts["version"])
+        self.version_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.version_label)
 
         # App author
-        author_text = tr("ui.about_dialog.created_by", "Created by {author}").format(author=APP_AUTHOR)
-        author_label = QLabel(author_text)
-        author_label.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(author_label)
+        self.author_label = QLabel(texts["author"])
+        self.author_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.author_label)
 
         # Description
-        description_text = tr("ui.about_dialog.description",
-            "AudKyɛfo is an offline desktop application for splitting audio files "
-            "into segments based on custom preferences."
-        )
-        description_label = QLabel(description_text)
-        description_label.setAlignment(Qt.AlignCenter)
-        description_label.setWordWrap(True)
-        main_layout.addWidget(description_label)
+        self.description_label = QLabel(texts["description"])
+        self.description_label.setAlignment(Qt.AlignCenter)
+        self.description_label.setWordWrap(True)
+        main_layout.addWidget(self.description_label)
 
         # Close button
-        close_button = QPushButton(tr("ui.about_dialog.close_button", "Close"))
-        close_button.clicked.connect(self.accept)
+        self.close_button = QPushButton(texts["close"])
+        self.close_button.clicked.connect(self.accept)
 
         button_layout = QHBoxLayout()
         button_layout.addStretch()
-        button_layout.addWidget(close_button)
+        button_layout.addWidget(self.close_button)
         button_layout.addStretch()
 
         main_layout.addLayout(button_layout)
 
     def update_translations(self):
         """Update all translated strings in the dialog"""
-        self.setWindowTitle(tr("ui.about_dialog.title", "About {app_name}").format(app_name=APP_NAME))
-
-        # Find and update all labels
-        for widget in self.findChildren(QLabel):
-            if widget.text() == APP_DISPLAY_NAME or widget.text() == tr("app.display_name", APP_DISPLAY_NAME):
-                widget.setText(tr("app.display_name", APP_DISPLAY_NAME))
-            elif "Version" in widget.text():
-                widget.setText(tr("ui.about_dialog.version", "Version {version}").format(version=APP_VERSION))
-            elif "Created by" in widget.text():
-                widget.setText(tr("ui.about_dialog.created_by", "Created by {author}").format(author=APP_AUTHOR))
-            elif "AudKyɛfo is" in widget.text():
-                widget.setText(tr("ui.about_dialog.description",
-                    "AudKyɛfo is an offline desktop application for splitting audio files "
-                    "into segments based on custom preferences."
-                ))
-
-        # Update close button
-        for widget in self.findChildren(QPushButton):
-            if widget.text() == "Close" or widget.text() == tr("ui.about_dialog.close_button", "Close"):
-                widget.setText(tr("ui.about_dialog.close_button", "Close"))
\ No newline at end of file
+        texts = _about_texts(get_current_language())
+
+        self.setWindowTitle(texts["title"])
+        self.name_label.setText(texts["name"])
+        self.version_label.setText(texts["version"])
+        self.author_label.setText(texts["author"])
+        self.description_label.setText(texts["description"])
+        self.close_button.setText(texts["close"])
\ No newline at end of file
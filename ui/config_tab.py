@@ -4,6 +4,7 @@ Split configuration tab for AudKyɛfo
 
 import os
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, List, Tuple, Optional
 
 from PyQt5.QtWidgets import (
@@ -13,7 +14,7 @@ from PyQt5.QtWidgets import (
     QTableWidgetItem, QHeaderView, QAbstractItemView, QSpacerItem,
     QSizePolicy, QSlider, QScrollArea, QFrame
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTime
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTime, QTimer
 
 from utils.constants import (
     SUPPORTED_OUTPUT_FORMATS,
@@ -21,16 +22,21 @@ from utils.constants import (
     DEFAULT_NAMING_PATTERN,
     SPLIT_METHOD_EQUAL,
     SPLIT_METHOD_DURATION,
-    SPLIT_METHOD_CUSTOM
+    SPLIT_METHOD_CUSTOM,
+    INPUT_DEBOUNCE_MS
 )
-from utils.translation_loader import tr
-from utils.helpers import format_time, parse_time, generate_output_filename
-from utils.validators import is_valid_time_format, is_valid_output_directory, is_valid_naming_pattern
+from utils.translation_loader import tr, get_current_language
+from utils.helpers import format_time, try_parse_time, generate_output_filename
+from utils.validators import is_valid_output_directory, is_valid_naming_pattern
 from utils.ui_translator import update_ui_translations
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Output quality per slider position, and the matching label text
+QUALITY_LEVELS = ("low", "medium", "high")
+QUALITY_LABELS = ("Low", "Medium", "High")
+
 class ConfigTab(QWidget):
     """
     Tab for configuring audio splitting options
@@ -39,16 +45,78 @@ class ConfigTab(QWidget):
     # Signals
     config_changed = pyqtSignal(dict)
 
+    # English widget text -> translation key, used when the language changes
+    TRANSLATION_MAP = MappingProxyType({
+        "Split Configuration": "ui.config_tab.title",
+        "Splitting Method": "ui.config_tab.method_group",
+        "Equal Parts": "ui.config_tab.method_equal",
+        "Fixed Duration": "ui.config_tab.method_duration",
+        "Custom Points": "ui.config_tab.method_custom",
+        "Number of parts:": "ui.config_tab.equal_parts_label",
+        "Duration per part:": "ui.config_tab.duration_label",
+        "Add": "ui.config_tab.add_button",
+        "Remove": "ui.config_tab.remove_button",
+        "Clear All": "ui.config_tab.clear_button",
+        "Split Points": "ui.config_tab.split_points_group",
+        "Time": "ui.config_tab.time_column",
+        "Label": "ui.config_tab.label_column",
+        "Output Settings": "ui.config_tab.output_group",
+        "Output Format:": "ui.config_tab.format_label",
+        "Output Quality:": "ui.config_tab.quality_label",
+        "Low": "ui.config_tab.quality_low",
+        "Medium": "ui.config_tab.quality_medium",
+        "High": "ui.config_tab.quality_high",
+        "Output Folder:": "ui.config_tab.output_folder_label",
+        "Browse...": "ui.config_tab.browse_button",
+        "Naming Pattern:": "ui.config_tab.naming_pattern_label",
+        "Advanced Options": "ui.config_tab.advanced_group",
+        "Add overlap between segments:": "ui.config_tab.overlap_label",
+        "Preserve original metadata": "ui.config_tab.preserve_metadata",
+        "Normalize audio levels": "ui.config_tab.normalize_audio"
+    })
+
     def __init__(self):
         """Initialize the configuration tab"""
         super().__init__()
 
         self.audio_metadata = {}
-        self.total_duration = 0
+        # Whole milliseconds, the same unit the splitter works in
+        self.total_duration_ms = 0
+
+        # Parsed start/end seconds of the custom ranges, kept in step with the
+        # table (None for a cell that isn't a valid time) so validation and
+        # the configuration don't have to read every cell back from Qt
+        self.range_starts: List[Optional[int]] = []
+        self.range_ends: List[Optional[int]] = []
+
+        # Items of removed range rows, reused by add_range
+        self.range_item_pool: List[QTableWidgetItem] = []
+
+        # Inputs of the last configuration that passed validation
+        self.last_valid_signature: Optional[Tuple] = None
+
+        # Whether the number of parts spin box updates the part duration
+        self.part_duration_connected = False
+
+        # Language the widget texts are currently in, and whether a
+        # retranslation is already queued
+        self.applied_language = get_current_language()
+        self.translation_pending = False
 
         # Set up the UI
         self.setup_ui()
 
+        # Timers that coalesce rapid edits into a single estimate update
+        self.part_duration_timer = QTimer(self)
+        self.part_duration_timer.setSingleShot(True)
+        self.part_duration_timer.setInterval(INPUT_DEBOUNCE_MS)
+        self.part_duration_timer.timeout.connect(self.update_part_duration)
+
+        self.num_segments_timer = QTimer(self)
+        self.num_segments_timer.setSingleShot(True)
+        self.num_segments_timer.setInterval(INPUT_DEBOUNCE_MS)
+        self.num_segments_timer.timeout.connect(self.update_num_segments)
+
         # Connect signals
         self.connect_signals()
 
@@ -76,12 +144,12 @@ class ConfigTab(QWidget):
         # Title label
         title_label = QLabel(tr("ui.config_tab.title", "Split Configuration"))
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
+        title_label.setObjectName("configTitle")
         main_layout.addWidget(title_label)
 
         # Splitting method group with improved styling
         method_group = QGroupBox(tr("ui.config_tab.method_group", "Splitting Method"))
-        method_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        method_group.setObjectName("methodGroup")
         method_layout = QVBoxLayout(method_group)
         method_layout.setContentsMargins(20, 30, 20, 20)
         method_layout.setSpacing(20)
@@ -96,7 +164,6 @@ class ConfigTab(QWidget):
         method_option_layout.setSpacing(10)
 
         self.equal_parts_radio = QRadioButton(tr("ui.config_tab.equal_parts_radio", "Equal Parts"))
-        self.equal_parts_radio.setStyleSheet("font-weight: bold;")
         self.method_group.addButton(self.equal_parts_radio, 0)
         method_option_layout.addWidget(self.equal_parts_radio)
         method_option_layout.addStretch(1)
@@ -134,30 +201,16 @@ class ConfigTab(QWidget):
         method_option_layout2.setSpacing(10)
 
         self.fixed_duration_radio = QRadioButton(tr("ui.config_tab.fixed_duration_radio", "Fixed Duration"))
-        self.fixed_duration_radio.setStyleSheet("font-weight: bold;")
         self.method_group.addButton(self.fixed_duration_radio, 1)
         method_option_layout2.addWidget(self.fixed_duration_radio)
         method_option_layout2.addStretch(1)
         method_layout.addLayout(method_option_layout2)
 
-        # Fixed duration settings with improved spacing
-        fixed_duration_widget = QWidget()
-        fixed_duration_layout = QFormLayout(fixed_duration_widget)
-        fixed_duration_layout.setContentsMargins(30, 5, 10, 15)
-        fixed_duration_layout.setSpacing(10)
-        fixed_duration_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
-
-        self.duration_edit = QLineEdit()
-        self.duration_edit.setPlaceholderText("MM:SS")
-        self.duration_edit.setText("01:00")  # Default to 1 minute
-        self.duration_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        fixed_duration_layout.addRow(tr("ui.config_tab.duration_format_label", "Duration (MM:SS):"), self.duration_edit)
-
-        self.num_segments_label = QLabel("0 segments")
-        self.num_segments_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        fixed_duration_layout.addRow(tr("ui.config_tab.estimated_segments_label", "Estimated segments:"), self.num_segments_label)
-
-        method_layout.addWidget(fixed_duration_widget)
+        # Fixed duration settings, built when the method is first selected
+        self.fixed_duration_widget = QWidget()
+        self.duration_edit = None
+        self.num_segments_label = None
+        method_layout.addWidget(self.fixed_duration_widget)
 
         # Add a separator between methods
         separator2 = QFrame()
@@ -171,52 +224,24 @@ class ConfigTab(QWidget):
         method_option_layout3.setSpacing(10)
 
         self.custom_ranges_radio = QRadioButton(tr("ui.config_tab.custom_ranges_radio", "Custom Ranges (Advanced)"))
-        self.custom_ranges_radio.setStyleSheet("font-weight: bold;")
         self.method_group.addButton(self.custom_ranges_radio, 2)
         method_option_layout3.addWidget(self.custom_ranges_radio)
         method_option_layout3.addStretch(1)
         method_layout.addLayout(method_option_layout3)
 
-        # Custom ranges settings with improved spacing
-        custom_ranges_widget = QWidget()
-        custom_ranges_layout = QVBoxLayout(custom_ranges_widget)
-        custom_ranges_layout.setContentsMargins(30, 5, 10, 15)
-        custom_ranges_layout.setSpacing(15)
-
-        # Table for time ranges
-        self.ranges_table = QTableWidget(0, 2)
-        self.ranges_table.setHorizontalHeaderLabels([
-            tr("ui.config_tab.start_time_format_column", "Start Time (MM:SS)"),
-            tr("ui.config_tab.end_time_format_column", "End Time (MM:SS)")
-        ])
-        self.ranges_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.ranges_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.ranges_table.setMinimumHeight(150)
-        self.ranges_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        custom_ranges_layout.addWidget(self.ranges_table)
-
-        # Buttons for managing ranges
-        ranges_buttons_layout = QHBoxLayout()
-        ranges_buttons_layout.setSpacing(10)
-
-        self.add_range_button = QPushButton(tr("ui.config_tab.add_range_button", "Add Range"))
-        self.add_range_button.setToolTip(tr("ui.config_tab.add_range_tooltip", "Add a new time range to the list"))
-        self.remove_range_button = QPushButton(tr("ui.config_tab.remove_range_button", "Remove Range"))
-        self.remove_range_button.setToolTip(tr("ui.config_tab.remove_range_tooltip", "Remove the selected time range"))
-
-        ranges_buttons_layout.addWidget(self.add_range_button)
-        ranges_buttons_layout.addWidget(self.remove_range_button)
-        ranges_buttons_layout.addStretch(1)
-
-        custom_ranges_layout.addLayout(ranges_buttons_layout)
-        method_layout.addWidget(custom_ranges_widget)
+        # Custom ranges settings, built when the method is first selected
+        self.custom_ranges_widget = QWidget()
+        self.ranges_table = None
+        self.add_range_button = None
+        self.remove_range_button = None
+        method_layout.addWidget(self.custom_ranges_widget)
 
         # Add spacing between sections
         main_layout.addSpacing(15)
 
         # Additional settings group with improved styling
         settings_group = QGroupBox(tr("ui.config_tab.additional_settings_group", "Additional Settings"))
-        settings_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        settings_group.setObjectName("settingsGroup")
         settings_layout = QFormLayout(settings_group)
         settings_layout.setContentsMargins(20, 30, 20, 20)
         settings_layout.setSpacing(15)
@@ -240,8 +265,12 @@ class ConfigTab(QWidget):
         self.format_combo = QComboBox()
         self.format_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.format_combo.setToolTip(tr("ui.config_tab.format_tooltip", "Select the output file format"))
-        for fmt in SUPPORTED_OUTPUT_FORMATS:
-            self.format_combo.addItem(fmt.upper(), fmt)
+        # Add all formats in one call, without a signal for the first item
+        self.format_combo.blockSignals(True)
+        self.format_combo.addItems([fmt.upper() for fmt in SUPPORTED_OUTPUT_FORMATS])
+        for index, fmt in enumerate(SUPPORTED_OUTPUT_FORMATS):
+            self.format_combo.setItemData(index, fmt)
+        self.format_combo.blockSignals(False)
         self.format_combo.setCurrentText(DEFAULT_OUTPUT_FORMAT.upper())
         settings_layout.addRow(tr("ui.config_tab.output_format_label", "Output Format:"), self.format_combo)
 
@@ -295,13 +324,13 @@ class ConfigTab(QWidget):
             tr("ui.config_tab.naming_pattern_help",
                "✓ One pattern creates ALL file names automatically (e.g., 1000 files from 1 pattern)")
         )
-        naming_help.setStyleSheet("font-size: 10px; color: #666666; padding-left: 10px;")
+        naming_help.setObjectName("namingHelp")
         naming_help.setWordWrap(True)
         settings_layout.addRow("", naming_help)
 
         # Naming pattern preview
         self.naming_pattern_preview = QLabel()
-        self.naming_pattern_preview.setStyleSheet("font-size: 10px; color: #0066cc; padding-left: 10px; font-style: italic;")
+        self.naming_pattern_preview.setObjectName("namingPreview")
         self.naming_pattern_preview.setWordWrap(True)
         settings_layout.addRow("", self.naming_pattern_preview)
 
@@ -328,6 +357,7 @@ class ConfigTab(QWidget):
 
         # Set default method
         self.equal_parts_radio.setChecked(True)
+        self.method_id = 0
 
         # Initialize the naming pattern preview
         self.update_naming_pattern_preview()
@@ -335,17 +365,14 @@ class ConfigTab(QWidget):
     def connect_signals(self):
         """Connect signals between components"""
         # Method selection
+        self.method_group.idToggled.connect(self.set_method_id)
         self.method_group.buttonClicked.connect(self.update_method_settings)
 
-        # Equal parts settings
-        self.num_parts_spin.valueChanged.connect(self.update_part_duration)
+        # The number of parts is only connected once there is a duration to
+        # divide (see set_part_duration_updates)
 
-        # Fixed duration settings
-        self.duration_edit.textChanged.connect(self.update_num_segments)
-
-        # Custom ranges settings
-        self.add_range_button.clicked.connect(self.add_range)
-        self.remove_range_button.clicked.connect(self.remove_range)
+        # The fixed duration and custom ranges settings connect their
+        # signals when they are built
 
         # Overlap settings
         self.overlap_check.stateChanged.connect(self.toggle_overlap)
@@ -359,6 +386,81 @@ class ConfigTab(QWidget):
         # Apply button
         self.apply_button.clicked.connect(self.apply_configuration)
 
+    def build_fixed_duration_panel(self):
+        """Build the fixed duration settings on first use"""
+        if self.duration_edit is not None:
+            return
+
+        fixed_duration_layout = QFormLayout(self.fixed_duration_widget)
+        fixed_duration_layout.setContentsMargins(30, 5, 10, 15)
+        fixed_duration_layout.setSpacing(10)
+        fixed_duration_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+
+        self.duration_edit = QLineEdit()
+        self.duration_edit.setPlaceholderText("MM:SS")
+        self.duration_edit.setText("01:00")  # Default to 1 minute
+        self.duration_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        fixed_duration_layout.addRow(tr("ui.config_tab.duration_format_label", "Duration (MM:SS):"), self.duration_edit)
+
+        self.num_segments_label = QLabel("0 segments")
+        self.num_segments_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        fixed_duration_layout.addRow(tr("ui.config_tab.estimated_segments_label", "Estimated segments:"), self.num_segments_label)
+
+        self.duration_edit.textChanged.connect(self.schedule_num_segments_update)
+
+    def build_custom_ranges_panel(self):
+        """Build the custom ranges settings on first use"""
+        if self.ranges_table is not None:
+            return
+
+        custom_ranges_layout = QVBoxLayout(self.custom_ranges_widget)
+        custom_ranges_layout.setContentsMargins(30, 5, 10, 15)
+        custom_ranges_layout.setSpacing(15)
+
+        # Table for time ranges
+        self.ranges_table = QTableWidget(0, 2)
+        # Header items are kept so retranslating only changes their text
+        self.start_header_item = QTableWidgetItem(tr("ui.config_tab.start_time_format_column", "Start Time (MM:SS)"))
+        self.end_header_item = QTableWidgetItem(tr("ui.config_tab.end_time_format_column", "End Time (MM:SS)"))
+        self.ranges_table.setHorizontalHeaderItem(0, self.start_header_item)
+        self.ranges_table.setHorizontalHeaderItem(1, self.end_header_item)
+        self.ranges_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.ranges_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.ranges_table.setMinimumHeight(150)
+        self.ranges_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        custom_ranges_layout.addWidget(self.ranges_table)
+
+        # Buttons for managing ranges
+        ranges_buttons_layout = QHBoxLayout()
+        ranges_buttons_layout.setSpacing(10)
+
+        self.add_range_button = QPushButton(tr("ui.config_tab.add_range_button", "Add Range"))
+        self.add_range_button.setToolTip(tr("ui.config_tab.add_range_tooltip", "Add a new time range to the list"))
+        self.remove_range_button = QPushButton(tr("ui.config_tab.remove_range_button", "Remove Range"))
+        self.remove_range_button.setToolTip(tr("ui.config_tab.remove_range_tooltip", "Remove the selected time range"))
+
+        ranges_buttons_layout.addWidget(self.add_range_button)
+        ranges_buttons_layout.addWidget(self.remove_range_button)
+        ranges_buttons_layout.addStretch(1)
+
+        custom_ranges_layout.addLayout(ranges_buttons_layout)
+
+        self.add_range_button.clicked.connect(self.add_range)
+        self.remove_range_button.clicked.connect(self.remove_range)
+        self.ranges_table.itemChanged.connect(self.update_range_value)
+
+    def build_method_panel(self, selected_id: int):
+        """
+        Build the settings of a splitting method if they don't exist yet
+
+        Args:
+            selected_id: ID of the method's radio button
+        """
+        if selected_id == 1:
+            self.build_fixed_duration_panel()
+        elif selected_id == 2:
+            self.build_custom_ranges_panel()
+
     def set_audio_metadata(self, metadata: Dict[str, Any]):
         """
         Set the audio metadata
@@ -367,7 +469,7 @@ class ConfigTab(QWidget):
             metadata: Audio metadata
         """
         self.audio_metadata = metadata
-        self.total_duration = metadata.get("duration_seconds", 0)
+        self.total_duration_ms = round(metadata.get("duration_seconds", 0) * 1000)
 
         # Set default output folder
         default_output_dir = os.path.dirname(metadata.get("path", ""))
@@ -378,6 +480,7 @@ class ConfigTab(QWidget):
         self.auto_suggest_naming_pattern(metadata)
 
         # Update UI based on the new metadata
+        self.set_part_duration_updates(self.total_duration_ms > 0)
         self.update_part_duration()
         self.update_num_segments()
 
@@ -403,17 +506,34 @@ class ConfigTab(QWidget):
 
         # Always use the correct pattern to ensure it's valid
         current_pattern = self.naming_pattern_edit.text().strip()
-        logger.debug(f"Auto-suggest: current='{current_pattern}', default='{DEFAULT_NAMING_PATTERN}', suggested='{suggested_pattern}'")
+        logger.debug(
+            "Auto-suggest: current='%s', default='%s', suggested='%s'",
+            current_pattern, DEFAULT_NAMING_PATTERN, suggested_pattern
+        )
 
         # Always set the correct pattern
         self.naming_pattern_edit.setText(suggested_pattern)
-        logger.debug(f"Auto-suggest: Set pattern to '{suggested_pattern}'")
+        logger.debug("Auto-suggest: Set pattern to '%s'", suggested_pattern)
         self.update_naming_pattern_preview()
 
+    @pyqtSlot(int, bool)
+    def set_method_id(self, button_id: int, checked: bool):
+        """
+        Remember the selected method, however the radio button got checked
+
+        Args:
+            button_id: ID of the toggled radio button
+            checked: Whether the button is now checked
+        """
+        if checked:
+            self.method_id = button_id
+
+    @pyqtSlot()
     def update_method_settings(self):
         """Update the settings based on the selected method"""
         # Get the selected method
-        selected_id = self.method_group.checkedId()
+        selected_id = self.method_id
+        self.build_method_panel(selected_id)
 
         # Update UI based on the selected method
         if selected_id == 0:  # Equal parts
@@ -421,70 +541,159 @@ class ConfigTab(QWidget):
         elif selected_id == 1:  # Fixed duration
             self.update_num_segments()
 
+    def set_part_duration_updates(self, enabled: bool):
+        """
+        Connect or disconnect the number of parts spin box from the part
+        duration label
+
+        Without an audio duration there is nothing to update, so the spin
+        box doesn't need to call into Python at all.
+
+        Args:
+            enabled: Whether changes of the number of parts update the label
+        """
+        if enabled == self.part_duration_connected:
+            return
+
+        if enabled:
+            self.num_parts_spin.valueChanged[int].connect(self.schedule_part_duration_update)
+        else:
+            self.num_parts_spin.valueChanged[int].disconnect(self.schedule_part_duration_update)
+            self.part_duration_timer.stop()
+        self.part_duration_connected = enabled
+
+    @pyqtSlot()
+    def schedule_part_duration_update(self):
+        """Update the part duration label once the spin box stops changing"""
+        self.part_duration_timer.start()
+
+    @pyqtSlot()
+    def schedule_num_segments_update(self):
+        """Update the number of segments label once typing pauses"""
+        self.num_segments_timer.start()
+
+    @pyqtSlot()
     def update_part_duration(self):
         """Update the part duration label"""
-        if not self.total_duration:
+        if not self.total_duration_ms:
             return
 
         num_parts = self.num_parts_spin.value()
-        part_duration = self.total_duration / num_parts
+        part_duration = self.total_duration_ms // (num_parts * 1000)
 
         self.part_duration_label.setText(format_time(part_duration))
 
+    @pyqtSlot()
     def update_num_segments(self):
         """Update the number of segments label"""
-        if not self.total_duration:
+        if not self.total_duration_ms or self.duration_edit is None:
             return
 
-        duration_str = self.duration_edit.text()
-        if not is_valid_time_format(duration_str):
+        duration = try_parse_time(self.duration_edit.text())
+        if duration is None:
             self.num_segments_label.setText("Invalid format")
             return
 
-        try:
-            duration = parse_time(duration_str)
-            if duration <= 0:
-                self.num_segments_label.setText("Invalid duration")
-                return
+        if duration <= 0:
+            self.num_segments_label.setText("Invalid duration")
+            return
 
-            num_segments = int(self.total_duration / duration) + (1 if self.total_duration % duration > 0 else 0)
-            self.num_segments_label.setText(f"{num_segments} segments")
-        except ValueError:
-            self.num_segments_label.setText("Invalid format")
+        # Ceiling division, a shorter last segment still counts
+        num_segments = -(-self.total_duration_ms // (duration * 1000))
+        self.num_segments_label.setText(f"{num_segments} segments")
 
+    @pyqtSlot()
     def add_range(self):
         """Add a new time range to the table"""
+        self.build_custom_ranges_panel()
         row = self.ranges_table.rowCount()
-        self.ranges_table.insertRow(row)
 
-        # Set default values
-        if row == 0:
-            start_time = "00:00"
-            end_time = format_time(min(60, self.total_duration))
-        else:
-            # Get the end time of the previous range
-            prev_end = self.ranges_table.item(row - 1, 1).text()
-            try:
-                prev_end_seconds = parse_time(prev_end)
-                start_time = prev_end
-                end_time = format_time(min(prev_end_seconds + 60, self.total_duration))
-            except ValueError:
-                start_time = "00:00"
-                end_time = format_time(min(60, self.total_duration))
+        # Start where the previous range ends
+        prev_end = self.range_ends[-1] if row else None
+        start_seconds = prev_end if prev_end is not None else 0
+        end_seconds = min(start_seconds + 60, self.total_duration_ms // 1000)
+        start_time = format_time(start_seconds)
+        end_time = format_time(end_seconds)
 
-        self.ranges_table.setItem(row, 0, QTableWidgetItem(start_time))
-        self.ranges_table.setItem(row, 1, QTableWidgetItem(end_time))
+        # The values are known, no need to parse them back from the cells
+        self.ranges_table.blockSignals(True)
+        self.ranges_table.insertRow(row)
+        self.ranges_table.setItem(row, 0, self._range_item(start_time))
+        self.ranges_table.setItem(row, 1, self._range_item(end_time))
+        self.ranges_table.blockSignals(False)
+
+        self.range_starts.append(try_parse_time(start_time))
+        self.range_ends.append(try_parse_time(end_time))
 
+    @pyqtSlot()
     def remove_range(self):
         """Remove the selected time range from the table"""
+        if self.ranges_table is None:
+            return
+
         selected_rows = self.ranges_table.selectionModel().selectedRows()
         if not selected_rows:
             return
 
-        # Remove rows in reverse order to avoid index issues
-        for row in sorted([index.row() for index in selected_rows], reverse=True):
-            self.ranges_table.removeRow(row)
+        # Group the rows into contiguous blocks, last block first so removing
+        # one doesn't shift the rows of the others
+        blocks = []
+        for row in sorted((index.row() for index in selected_rows), reverse=True):
+            if blocks and blocks[-1][0] == row + 1:
+                blocks[-1][0] = row
+                blocks[-1][1] += 1
+            else:
+                blocks.append([row, 1])
+
+        model = self.ranges_table.model()
+        self.ranges_table.setUpdatesEnabled(False)
+        self.ranges_table.blockSignals(True)
+        for start, count in blocks:
+            # Keep the rows' items for the next ranges that get added
+            for row in range(start, start + count):
+                for column in (0, 1):
+                    item = self.ranges_table.takeItem(row, column)
+                    if item is not None:
+                        self.range_item_pool.append(item)
+            model.removeRows(start, count)
+            del self.range_starts[start:start + count]
+            del self.range_ends[start:start + count]
+        self.ranges_table.blockSignals(False)
+        self.ranges_table.setUpdatesEnabled(True)
+
+    def _range_item(self, text: str) -> QTableWidgetItem:
+        """
+        Get a table item for a range cell, reusing a removed one if possible
+
+        Args:
+            text: Cell text
+
+        Returns:
+            Table item showing the text
+        """
+        if not self.range_item_pool:
+            return QTableWidgetItem(text)
+
+        item = self.range_item_pool.pop()
+        item.setText(text)
+        return item
+
+    @pyqtSlot(QTableWidgetItem)
+    def update_range_value(self, item: QTableWidgetItem):
+        """
+        Re-parse a time range cell after it was edited
 
+        Args:
+            item: Edited table item
+        """
+        row = item.row()
+        if row >= len(self.range_starts):
+            return
+
+        values = self.range_starts if item.column() == 0 else self.range_ends
+        values[row] = try_parse_time(item.text())
+
+    @pyqtSlot(int)
     def toggle_overlap(self, state: int):
         """
         Toggle the overlap duration field
@@ -498,6 +707,7 @@ class ConfigTab(QWidget):
         else:
             self.overlap_edit.clear()
 
+    @pyqtSlot(int)
     def update_quality_label(self, value: int):
         """
         Update the quality label based on the slider value
@@ -505,13 +715,11 @@ class ConfigTab(QWidget):
         Args:
             value: Slider value
         """
-        if value == 0:
-            self.quality_label.setText("Low")
-        elif value == 1:
-            self.quality_label.setText("Medium")
-        else:
-            self.quality_label.setText("High")
+        self.quality_label.setText(
+            tr(f"ui.config_tab.quality_{QUALITY_LEVELS[value]}", QUALITY_LABELS[value])
+        )
 
+    @pyqtSlot()
     def browse_output_folder(self):
         """Open a dialog to select the output folder"""
         folder = QFileDialog.getExistingDirectory(
@@ -521,6 +729,7 @@ class ConfigTab(QWidget):
         if folder:
             self.output_folder_edit.setText(folder)
 
+    @pyqtSlot()
     def update_naming_pattern_preview(self):
         """Update the naming pattern preview label"""
         pattern = self.naming_pattern_edit.text().strip()
@@ -541,6 +750,7 @@ class ConfigTab(QWidget):
             # If the pattern is invalid, show error
             self.naming_pattern_preview.setText("Preview: Invalid pattern")
 
+    @pyqtSlot()
     def apply_configuration(self):
         """Apply the current configuration"""
         # Validate the configuration
@@ -564,103 +774,101 @@ class ConfigTab(QWidget):
         output_dir = self.output_folder_edit.text()
         valid, error_message = is_valid_output_directory(output_dir)
         if not valid:
-            logger.error(f"Invalid output directory: {error_message}")
+            logger.error("Invalid output directory: %s", error_message)
             return False
 
+        # The remaining checks only depend on the inputs, so skip them if
+        # those haven't changed since they last passed
+        selected_id = self.method_id
+        self.build_method_panel(selected_id)
+        signature = self._validation_signature()
+        if signature == self.last_valid_signature:
+            return True
+
         # Validate naming pattern
         naming_pattern = self.naming_pattern_edit.text().strip()
-        logger.debug(f"Validating naming pattern: '{naming_pattern}'")
+        logger.debug("Validating naming pattern: '%s'", naming_pattern)
 
         # If pattern is empty, use default
         if not naming_pattern:
             naming_pattern = DEFAULT_NAMING_PATTERN
             self.naming_pattern_edit.setText(naming_pattern)
-            logger.debug(f"Empty pattern, using default: '{naming_pattern}'")
+            logger.debug("Empty pattern, using default: '%s'", naming_pattern)
 
         valid, error_message = is_valid_naming_pattern(naming_pattern)
         if not valid:
-            logger.error(f"Invalid naming pattern: {error_message}")
-            logger.error(f"Pattern was: '{naming_pattern}'")
+            logger.error("Invalid naming pattern: %s", error_message)
+            logger.error("Pattern was: '%s'", naming_pattern)
             # Try to fix with default pattern
             logger.info("Trying to use default naming pattern as fallback")
             self.naming_pattern_edit.setText(DEFAULT_NAMING_PATTERN)
             return False
 
         # Validate method-specific settings
-        selected_id = self.method_group.checkedId()
-
         if selected_id == 1:  # Fixed duration
-            duration_str = self.duration_edit.text()
-            if not is_valid_time_format(duration_str):
+            duration = try_parse_time(self.duration_edit.text())
+            if duration is None:
                 logger.error("Invalid duration format")
                 return False
 
-            try:
-                duration = parse_time(duration_str)
-                if duration <= 0:
-                    logger.error("Duration must be greater than 0")
-                    return False
-            except ValueError:
-                logger.error("Invalid duration format")
+            if duration <= 0:
+                logger.error("Duration must be greater than 0")
                 return False
 
         elif selected_id == 2:  # Custom ranges
-            if self.ranges_table.rowCount() == 0:
+            if not self.range_starts:
                 logger.error("No time ranges specified")
                 return False
 
-            for row in range(self.ranges_table.rowCount()):
-                start_item = self.ranges_table.item(row, 0)
-                end_item = self.ranges_table.item(row, 1)
-
-                if not start_item or not end_item:
-                    logger.error(f"Missing time value in row {row + 1}")
+            for row, (start_seconds, end_seconds) in enumerate(zip(self.range_starts, self.range_ends)):
+                if start_seconds is None:
+                    logger.error("Invalid start time format in row %d", row + 1)
                     return False
 
-                start_time = start_item.text()
-                end_time = end_item.text()
-
-                if not is_valid_time_format(start_time):
-                    logger.error(f"Invalid start time format in row {row + 1}")
+                if end_seconds is None:
+                    logger.error("Invalid end time format in row %d", row + 1)
                     return False
 
-                if not is_valid_time_format(end_time):
-                    logger.error(f"Invalid end time format in row {row + 1}")
+                if start_seconds >= end_seconds:
+                    logger.error("Start time must be less than end time in row %d", row + 1)
                     return False
 
-                try:
-                    start_seconds = parse_time(start_time)
-                    end_seconds = parse_time(end_time)
-
-                    if start_seconds >= end_seconds:
-                        logger.error(f"Start time must be less than end time in row {row + 1}")
-                        return False
-
-                    if end_seconds > self.total_duration:
-                        logger.error(f"End time exceeds audio duration in row {row + 1}")
-                        return False
-                except ValueError:
-                    logger.error(f"Invalid time format in row {row + 1}")
+                if end_seconds * 1000 > self.total_duration_ms:
+                    logger.error("End time exceeds audio duration in row %d", row + 1)
                     return False
 
         # Validate overlap
         if self.overlap_check.isChecked():
-            overlap_str = self.overlap_edit.text()
-            if not is_valid_time_format(overlap_str):
-                logger.error("Invalid overlap format")
-                return False
-
-            try:
-                overlap = parse_time(overlap_str)
-                if overlap < 0:
-                    logger.error("Overlap must be non-negative")
-                    return False
-            except ValueError:
+            # MM:SS can't express a negative overlap
+            if try_parse_time(self.overlap_edit.text()) is None:
                 logger.error("Invalid overlap format")
                 return False
 
+        self.last_valid_signature = signature
         return True
 
+    def _validation_signature(self) -> Tuple:
+        """
+        Get the inputs that validate_configuration checks
+
+        Returns:
+            Tuple that compares equal as long as none of the inputs changed
+        """
+        if self.method_id == 1:
+            method_input = self.duration_edit.text()
+        elif self.method_id == 2:
+            method_input = (tuple(self.range_starts), tuple(self.range_ends), self.total_duration_ms)
+        else:
+            method_input = None
+
+        return (
+            self.method_id,
+            method_input,
+            self.naming_pattern_edit.text(),
+            self.overlap_check.isChecked(),
+            self.overlap_edit.text()
+        )
+
     def get_configuration(self) -> Dict[str, Any]:
         """
         Get the current configuration
@@ -669,7 +877,8 @@ class ConfigTab(QWidget):
             Dictionary containing the configuration
         """
         # Get the selected method
-        selected_id = self.method_group.checkedId()
+        selected_id = self.method_id
+        self.build_method_panel(selected_id)
         if selected_id == 0:
             method = SPLIT_METHOD_EQUAL
         elif selected_id == 1:
@@ -684,47 +893,26 @@ class ConfigTab(QWidget):
             method_settings["num_parts"] = self.num_parts_spin.value()
 
         elif method == SPLIT_METHOD_DURATION:
-            try:
-                duration = parse_time(self.duration_edit.text())
-                method_settings["duration"] = duration
-            except ValueError:
-                method_settings["duration"] = 60  # Default to 60 seconds
+            duration = try_parse_time(self.duration_edit.text())
+            method_settings["duration"] = duration if duration is not None else 60  # Default to 60 seconds
 
         elif method == SPLIT_METHOD_CUSTOM:
-            ranges = []
-            for row in range(self.ranges_table.rowCount()):
-                start_item = self.ranges_table.item(row, 0)
-                end_item = self.ranges_table.item(row, 1)
-
-                if start_item and end_item:
-                    try:
-                        start_seconds = parse_time(start_item.text())
-                        end_seconds = parse_time(end_item.text())
-                        ranges.append((start_seconds, end_seconds))
-                    except ValueError:
-                        pass
-
-            method_settings["ranges"] = ranges
+            method_settings["ranges"] = [
+                (start_seconds, end_seconds)
+                for start_seconds, end_seconds in zip(self.range_starts, self.range_ends)
+                if start_seconds is not None and end_seconds is not None
+            ]
 
         # Get overlap
         overlap = 0
         if self.overlap_check.isChecked():
-            try:
-                overlap = parse_time(self.overlap_edit.text())
-            except ValueError:
-                pass
+            overlap = try_parse_time(self.overlap_edit.text()) or 0
 
         # Get output format
         output_format = self.format_combo.currentData()
 
         # Get output quality
-        quality_value = self.quality_slider.value()
-        if quality_value == 0:
-            quality = "low"
-        elif quality_value == 1:
-            quality = "medium"
-        else:
-            quality = "high"
+        quality = QUALITY_LEVELS[self.quality_slider.value()]
 
         # Build the configuration
         config = {
@@ -753,21 +941,34 @@ class ConfigTab(QWidget):
             self.num_parts_spin.setValue(config.get("num_parts", 2))
         elif method == SPLIT_METHOD_DURATION:
             self.fixed_duration_radio.setChecked(True)
+            self.build_fixed_duration_panel()
             duration = config.get("duration", 60)
             self.duration_edit.setText(format_time(duration))
         elif method == SPLIT_METHOD_CUSTOM:
             self.custom_ranges_radio.setChecked(True)
+            self.build_custom_ranges_panel()
             ranges = config.get("ranges", [])
 
-            # Clear existing ranges
-            self.ranges_table.setRowCount(0)
-
-            # Add new ranges
-            for start, end in ranges:
-                row = self.ranges_table.rowCount()
-                self.ranges_table.insertRow(row)
-                self.ranges_table.setItem(row, 0, QTableWidgetItem(format_time(start)))
-                self.ranges_table.setItem(row, 1, QTableWidgetItem(format_time(end)))
+            # Replace the ranges in one pass: size the table once and don't
+            # repaint or emit itemChanged for every cell
+            self.ranges_table.setUpdatesEnabled(False)
+            self.ranges_table.blockSignals(True)
+            try:
+                self.ranges_table.setRowCount(0)
+                self.ranges_table.setRowCount(len(ranges))
+                self.range_starts = []
+                self.range_ends = []
+
+                for row, (start, end) in enumerate(ranges):
+                    start_time = format_time(start)
+                    end_time = format_time(end)
+                    self.ranges_table.setItem(row, 0, QTableWidgetItem(start_time))
+                    self.ranges_table.setItem(row, 1, QTableWidgetItem(end_time))
+                    self.range_starts.append(try_parse_time(start_time))
+                    self.range_ends.append(try_parse_time(end_time))
+            finally:
+                self.ranges_table.blockSignals(False)
+                self.ranges_table.setUpdatesEnabled(True)
 
         # Set overlap
         overlap = config.get("overlap", 0)
@@ -785,12 +986,9 @@ class ConfigTab(QWidget):
 
         # Set output quality
         quality = config.get("output_quality", "medium")
-        if quality == "low":
-            self.quality_slider.setValue(0)
-        elif quality == "medium":
-            self.quality_slider.setValue(1)
-        else:
-            self.quality_slider.setValue(2)
+        if quality not in QUALITY_LEVELS:
+            quality = "medium"
+        self.quality_slider.setValue(QUALITY_LEVELS.index(quality))
 
         # Set output directory
         output_dir = config.get("output_dir", "")
@@ -802,7 +1000,7 @@ class ConfigTab(QWidget):
 
         # Always use a valid pattern that includes {original_name}
         if "{original_name}" not in naming_pattern:
-            logger.debug(f"Config has invalid naming pattern '{naming_pattern}', using default")
+            logger.debug("Config has invalid naming pattern '%s', using default", naming_pattern)
             naming_pattern = DEFAULT_NAMING_PATTERN
 
         self.naming_pattern_edit.setText(naming_pattern)
@@ -814,42 +1012,44 @@ class ConfigTab(QWidget):
         self.update_method_settings()
 
     def update_translations(self):
-        """Update all translated strings in the tab"""
-        # Create a translation map for common UI elements
-        translation_map = {
-            "Split Configuration": "ui.config_tab.title",
-            "Splitting Method": "ui.config_tab.method_group",
-            "Equal Parts": "ui.config_tab.method_equal",
-            "Fixed Duration": "ui.config_tab.method_duration",
-            "Custom Points": "ui.config_tab.method_custom",
-            "Number of parts:": "ui.config_tab.equal_parts_label",
-            "Duration per part:": "ui.config_tab.duration_label",
-            "Add": "ui.config_tab.add_button",
-            "Remove": "ui.config_tab.remove_button",
-            "Clear All": "ui.config_tab.clear_button",
-            "Split Points": "ui.config_tab.split_points_group",
-            "Time": "ui.config_tab.time_column",
-            "Label": "ui.config_tab.label_column",
-            "Output Settings": "ui.config_tab.output_group",
-            "Output Format:": "ui.config_tab.format_label",
-            "Output Quality:": "ui.config_tab.quality_label",
-            "Low": "ui.config_tab.quality_low",
-            "Medium": "ui.config_tab.quality_medium",
-            "High": "ui.config_tab.quality_high",
-            "Output Folder:": "ui.config_tab.output_folder_label",
-            "Browse...": "ui.config_tab.browse_button",
-            "Naming Pattern:": "ui.config_tab.naming_pattern_label",
-            "Advanced Options": "ui.config_tab.advanced_group",
-            "Add overlap between segments:": "ui.config_tab.overlap_label",
-            "Preserve original metadata": "ui.config_tab.preserve_metadata",
-            "Normalize audio levels": "ui.config_tab.normalize_audio"
-        }
+        """
+        Update all translated strings in the tab
+
+        The update runs once control returns to the event loop, so several
+        requests in a row (e.g. from more than one language change handler)
+        only retranslate the tab once.
+        """
+        if self.translation_pending:
+            return
+        self.translation_pending = True
+        QTimer.singleShot(0, self.apply_translations)
+
+    @pyqtSlot()
+    def apply_translations(self):
+        """Retranslate the tab's texts into the current language"""
+        self.translation_pending = False
+
+        # Nothing to do if the texts are already in the current language
+        language = get_current_language()
+        if language == self.applied_language:
+            return
+        self.applied_language = language
+
+        # Repaint the tab once, after every text has changed
+        self.setUpdatesEnabled(False)
 
         # Update all widgets using the translation map
-        update_ui_translations(self, translation_map)
+        update_ui_translations(self, self.TRANSLATION_MAP)
+
+        # Update the ranges table headers (the table only exists once the
+        # custom ranges settings have been shown)
+        if self.ranges_table is not None:
+            headers = (
+                (self.start_header_item, tr("ui.config_tab.start_time_format_column", "Start Time (MM:SS)")),
+                (self.end_header_item, tr("ui.config_tab.end_time_format_column", "End Time (MM:SS)"))
+            )
+            for item, text in headers:
+                if item.text() != text:
+                    item.setText(text)
 
-        # Update table headers
-        if hasattr(self, 'split_points_table'):
-            if self.split_points_table.columnCount() >= 2:
-                self.split_points_table.setHorizontalHeaderItem(0, QTableWidgetItem(tr("ui.config_tab.time_column", "Time")))
-                self.split_points_table.setHorizontalHeaderItem(1, QTableWidgetItem(tr("ui.config_tab.label_column", "Label")))
\ No newline at end of file
+        self.setUpdatesEnabled(True)
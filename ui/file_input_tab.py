@@ -5,6 +5,7 @@ File input tab for AudKyɛfo
 import os
 import sys
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 # Add the project root to the Python path when running this file directly
@@ -16,7 +17,7 @@ if __name__ == "__main__":
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QFileDialog, QGroupBox, QFormLayout, QSizePolicy,
-    QSpacerItem, QFrame, QSlider, QStyle, QToolButton,
+    QFrame, QSlider, QStyle, QToolButton,
     QApplication, QScrollArea
 )
 from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QIcon, QFont, QPixmap
@@ -27,8 +28,8 @@ from core.audio_processor import AudioProcessor
 from core.config_manager import ConfigManager
 from utils.helpers import format_time
 from utils.constants import (
-    SUPPORTED_INPUT_FORMATS, PRIMARY_COLOR, SECONDARY_COLOR,
-    BACKGROUND_COLOR, TEXT_COLOR, ACCENT_COLOR
+    SUPPORTED_INPUT_FORMATS, SUPPORTED_INPUT_EXTENSIONS, AUDIO_FILE_FILTER, POSITION_UPDATE_MS,
+    VOLUME_UPDATE_MS
 )
 from utils.translation_loader import tr
 from utils.style_loader import get_theme_colors
@@ -37,6 +38,16 @@ from utils.ui_translator import update_ui_translations
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Rows of the file information panel: value label name and English field text
+FILE_INFO_FIELDS = (
+    ("filename", "File Name:"),
+    ("format", "Format:"),
+    ("duration", "Duration:"),
+    ("channels", "Channels:"),
+    ("sample_rate", "Sample Rate:"),
+    ("size", "File Size:"),
+)
+
 class FileInputTab(QWidget):
     """
     Tab for selecting and previewing audio files
@@ -45,6 +56,26 @@ class FileInputTab(QWidget):
     # Signals
     file_loaded = pyqtSignal(bool, dict)  # success, metadata
 
+    # English widget text -> translation key, used when the language changes
+    TRANSLATION_MAP = MappingProxyType({
+        "Select Audio File": "ui.file_input_tab.title",
+        "Audio File Selection": "ui.file_input_tab.section_title",
+        "Browse for Audio File": "ui.file_input_tab.browse_button",
+        "File Information": "ui.file_input_tab.file_info_group",
+        "File Name:": "ui.file_input_tab.filename_label",
+        "Format:": "ui.file_input_tab.format_label",
+        "Duration:": "ui.file_input_tab.duration_label",
+        "Channels:": "ui.file_input_tab.channels_label",
+        "Sample Rate:": "ui.file_input_tab.sample_rate_label",
+        "File Size:": "ui.file_input_tab.size_label",
+        "Audio Preview": "ui.file_input_tab.preview_group",
+        "Play": "ui.file_input_tab.play_button",
+        "Pause": "ui.file_input_tab.pause_button",
+        "Rewind": "ui.file_input_tab.rewind_button",
+        "Forward": "ui.file_input_tab.forward_button",
+        "Volume": "ui.file_input_tab.volume_label"
+    })
+
     def __init__(self, audio_processor: AudioProcessor):
         """
         Initialize the file input tab
@@ -59,9 +90,22 @@ class FileInputTab(QWidget):
         self.is_playing = False
         self.previous_volume = 70  # Default volume level
 
-        # Get theme colors
+        # Get theme colors (the applied ones are None until the first show)
         self.config_manager = ConfigManager()
         self.theme_colors = get_theme_colors()
+        self.applied_theme_colors = None
+
+        # Standard icons, looked up once and reused on every state change
+        style = self.style()
+        self.icons = {
+            "folder": style.standardIcon(QStyle.SP_DirOpenIcon),
+            "play": style.standardIcon(QStyle.SP_MediaPlay),
+            "pause": style.standardIcon(QStyle.SP_MediaPause),
+            "rewind": style.standardIcon(QStyle.SP_MediaSkipBackward),
+            "forward": style.standardIcon(QStyle.SP_MediaSkipForward),
+            "volume": style.standardIcon(QStyle.SP_MediaVolume),
+            "muted": style.standardIcon(QStyle.SP_MediaVolumeMuted),
+        }
 
         # Set up the UI
         self.setup_ui()
@@ -72,23 +116,46 @@ class FileInputTab(QWidget):
         # Enable drag and drop
         self.setAcceptDrops(True)
 
-        # Create media player
-        self.media_player = QMediaPlayer()
-        self.media_player.setVolume(self.previous_volume)
+        # The media player is created on first use (see ensure_media_player),
+        # so starting the backend doesn't delay showing the tab or a file
+        self.media_player = None
+        self.media_player_file = None
 
-        # Connect media player signals
-        self.media_player.positionChanged.connect(self.update_position)
-        self.media_player.durationChanged.connect(self.update_duration)
-        self.media_player.stateChanged.connect(self.media_state_changed)
-
-        # Timer for updating the position slider
-        self.position_timer = QTimer(self)
-        self.position_timer.setInterval(1000)  # Update every second
-        self.position_timer.timeout.connect(self.update_position_timer)
+        # Position updates arriving less than POSITION_UPDATE_MS after the
+        # last one shown are held back, and only the newest is shown when the
+        # timer runs out
+        self.pending_position = None
+        self.position_throttle = QTimer(self)
+        self.position_throttle.setSingleShot(True)
+        self.position_throttle.setInterval(POSITION_UPDATE_MS)
+        self.position_throttle.timeout.connect(self.flush_position)
 
         # We'll update the theme when the tab is shown
         # Add a showEvent handler to update the theme
 
+    def ensure_media_player(self) -> QMediaPlayer:
+        """
+        Get the media player, creating it and loading the current file if needed
+
+        Returns:
+            Media player with the current file as its media
+        """
+        if self.media_player is None:
+            self.media_player = QMediaPlayer()
+            self.media_player.setVolume(self.volume_slider.value())
+
+            # Connect media player signals (positionChanged fires at the player's
+            # notify interval while playing, which drives the position display)
+            self.media_player.positionChanged.connect(self.update_position)
+            self.media_player.durationChanged.connect(self.update_duration)
+            self.media_player.stateChanged.connect(self.media_state_changed)
+
+        if self.media_player_file != self.current_file:
+            self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(self.current_file)))
+            self.media_player_file = self.current_file
+
+        return self.media_player
+
     def initialize_audio_player(self):
         """Initialize the audio player controls and connections"""
         # This would normally initialize a media player component
@@ -97,6 +164,22 @@ class FileInputTab(QWidget):
         # Connect time slider
         self.time_slider.sliderMoved.connect(self.seek_audio)
 
+        # Volume changes while dragging are applied at most every
+        # VOLUME_UPDATE_MS, and right away when the slider is released
+        self.pending_volume = None
+        self.volume_timer = QTimer(self)
+        self.volume_timer.setSingleShot(True)
+        self.volume_timer.setInterval(VOLUME_UPDATE_MS)
+        self.volume_timer.timeout.connect(self.flush_volume)
+
+        # Connect the control buttons (the handlers ignore clicks until a
+        # file is loaded)
+        self.rewind_button.clicked.connect(self.rewind_audio)
+        self.forward_button.clicked.connect(self.forward_audio)
+        self.volume_button.clicked.connect(self.toggle_mute)
+        self.volume_slider.valueChanged.connect(self.set_volume)
+        self.volume_slider.sliderReleased.connect(self.flush_volume)
+
         # Initialize time display
         self.current_time_label.setText("00:00")
         self.total_time_label.setText("00:00")
@@ -129,36 +212,19 @@ class FileInputTab(QWidget):
         # Title label with enhanced styling
         title_label = QLabel(tr("ui.file_input_tab.title", "Select Audio File"))
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(f"""
-            font-size: 20px;
-            font-weight: bold;
-            color: {self.theme_colors['highlight']};
-            margin-bottom: 10px;
-            background-color: transparent;
-        """)
+        title_label.setObjectName("fileInputTitle")
         main_layout.addWidget(title_label)
 
         # Add a separator line under the title
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet(f"background-color: {self.theme_colors['highlight']}; max-height: 2px;")
+        separator.setObjectName("fileInputSeparator")
         main_layout.addWidget(separator)
 
         # File selection section
         file_selection_group = QGroupBox()
-        file_selection_group.setStyleSheet(f"""
-            QGroupBox {{
-                border: 1px solid {self.theme_colors['border']};
-                border-radius: 8px;
-                background-color: {self.theme_colors['background_secondary']};
-                margin-top: 15px;
-            }}
-            QGroupBox QLabel {{
-                background-color: transparent;
-                border: none;
-            }}
-        """)
+        file_selection_group.setObjectName("fileSelectionGroup")
         file_selection_layout = QVBoxLayout(file_selection_group)
         file_selection_layout.setContentsMargins(15, 15, 15, 15)
         file_selection_layout.setSpacing(15)
@@ -166,13 +232,7 @@ class FileInputTab(QWidget):
 
         # Section title
         section_title = QLabel(tr("ui.file_input_tab.section_title", "Audio File Selection"))
-        section_title.setStyleSheet(f"""
-            font-weight: bold;
-            font-size: 14px;
-            color: {self.theme_colors['text']};
-            background-color: transparent;
-            border: none;
-        """)
+        section_title.setObjectName("sectionTitle")
         file_selection_layout.addWidget(section_title)
 
         # Drop zone with enhanced visual cues
@@ -183,52 +243,16 @@ class FileInputTab(QWidget):
         # Browse button with icon and better sizing
         browse_button = QPushButton(tr("ui.file_input_tab.browse_button", "Browse for Audio File"))
         # Get system folder icon
-        browse_button.setIcon(self.style().standardIcon(QStyle.SP_DirOpenIcon))
+        browse_button.setIcon(self.icons["folder"])
         browse_button.setIconSize(QSize(20, 20))
         browse_button.setFixedHeight(40)
-        browse_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme_colors['highlight_secondary']};
-                color: white;
-                border-radius: 4px;
-                padding: 5px 15px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme_colors['highlight_secondary']};
-                opacity: 0.9;
-            }}
-            QPushButton:pressed {{
-                background-color: {self.theme_colors['highlight_secondary']};
-                opacity: 1.0;
-            }}
-        """)
+        browse_button.setObjectName("browseButton")
         browse_button.clicked.connect(self.browse_file)
         file_selection_layout.addWidget(browse_button)
 
         # File info group box with enhanced styling
         self.file_info_group = QGroupBox(tr("ui.file_input_tab.file_info_group", "File Information"))
-        self.file_info_group.setStyleSheet(f"""
-            QGroupBox {{
-                border: 1px solid {self.theme_colors['border']};
-                border-radius: 8px;
-                margin-top: 15px;
-                font-weight: bold;
-                padding-top: 10px;
-                background-color: {self.theme_colors['background_secondary']};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: {self.theme_colors['highlight']};
-                background-color: transparent;
-            }}
-            QGroupBox QLabel {{
-                background-color: transparent;
-                border: none;
-            }}
-        """)
+        self.file_info_group.setObjectName("fileInfoGroup")
         self.file_info_group.setVisible(False)
         main_layout.addWidget(self.file_info_group)
 
@@ -239,73 +263,22 @@ class FileInputTab(QWidget):
         file_info_layout.setLabelAlignment(Qt.AlignRight)
         file_info_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
 
-        # File info labels with better styling
-        self.filename_label = QLabel()
-        self.format_label = QLabel()
-        self.duration_label = QLabel()
-        self.channels_label = QLabel()
-        self.sample_rate_label = QLabel()
-        self.size_label = QLabel()
-
-        # Apply consistent styling to all value labels
-        for label in [self.filename_label, self.format_label, self.duration_label,
-                     self.channels_label, self.sample_rate_label, self.size_label]:
-            label.setStyleSheet("""
-                font-weight: normal;
-                padding: 2px;
-                background-color: transparent;
-                border: none;
-            """)
-            label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        # One row per field: a styled field label and a selectable value label,
+        # stored as self.<name>_label
+        for name, default_text in FILE_INFO_FIELDS:
+            field = QLabel(tr(f"ui.file_input_tab.{name}_label", default_text))
+            field.setObjectName("fileInfoField")
 
-        # Add rows with styled field labels
-        field_style = """
-            font-weight: bold;
-            color: #555555;
-            background-color: transparent;
-            border: none;
-        """
-        file_name_field = QLabel(tr("ui.file_input_tab.filename_label", "File Name:"))
-        file_name_field.setStyleSheet(field_style)
-        file_info_layout.addRow(file_name_field, self.filename_label)
-
-        format_field = QLabel(tr("ui.file_input_tab.format_label", "Format:"))
-        format_field.setStyleSheet(field_style)
-        file_info_layout.addRow(format_field, self.format_label)
-
-        duration_field = QLabel(tr("ui.file_input_tab.duration_label", "Duration:"))
-        duration_field.setStyleSheet(field_style)
-        file_info_layout.addRow(duration_field, self.duration_label)
-
-        channels_field = QLabel(tr("ui.file_input_tab.channels_label", "Channels:"))
-        channels_field.setStyleSheet(field_style)
-        file_info_layout.addRow(channels_field, self.channels_label)
-
-        sample_rate_field = QLabel(tr("ui.file_input_tab.sample_rate_label", "Sample Rate:"))
-        sample_rate_field.setStyleSheet(field_style)
-        file_info_layout.addRow(sample_rate_field, self.sample_rate_label)
+            value = QLabel()
+            value.setObjectName("fileInfoValue")
+            value.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            setattr(self, f"{name}_label", value)
 
-        size_field = QLabel(tr("ui.file_input_tab.size_label", "File Size:"))
-        size_field.setStyleSheet(field_style)
-        file_info_layout.addRow(size_field, self.size_label)
+            file_info_layout.addRow(field, value)
 
         # Enhanced audio preview group
         self.preview_group = QGroupBox(tr("ui.file_input_tab.preview_group", "Audio Preview"))
-        self.preview_group.setStyleSheet(f"""
-            QGroupBox {{
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                margin-top: 15px;
-                font-weight: bold;
-                padding-top: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: {PRIMARY_COLOR};
-            }}
-        """)
+        self.preview_group.setObjectName("previewGroup")
         self.preview_group.setVisible(False)
         main_layout.addWidget(self.preview_group)
 
@@ -327,26 +300,7 @@ class FileInputTab(QWidget):
         self.time_slider = QSlider(Qt.Horizontal)
         self.time_slider.setRange(0, 100)
         self.time_slider.setValue(0)
-        self.time_slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                border: 1px solid #999999;
-                height: 8px;
-                background: #f0f0f0;
-                margin: 2px 0;
-                border-radius: 4px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {SECONDARY_COLOR};
-                border: 1px solid #5c5c5c;
-                width: 18px;
-                margin: -2px 0;
-                border-radius: 9px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {SECONDARY_COLOR};
-                border-radius: 4px;
-            }}
-        """)
+        self.time_slider.setObjectName("timeSlider")
         preview_layout.addWidget(self.time_slider)
 
         # Control buttons layout
@@ -355,71 +309,35 @@ class FileInputTab(QWidget):
 
         # Rewind button
         self.rewind_button = QToolButton()
-        self.rewind_button.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipBackward))
+        self.rewind_button.setIcon(self.icons["rewind"])
         self.rewind_button.setIconSize(QSize(24, 24))
         self.rewind_button.setToolTip("Rewind")
-        self.rewind_button.setStyleSheet("""
-            QToolButton {
-                border: none;
-                padding: 5px;
-            }
-            QToolButton:hover {
-                background-color: #e0e0e0;
-                border-radius: 12px;
-            }
-        """)
+        self.rewind_button.setObjectName("playerButton")
         controls_layout.addWidget(self.rewind_button)
 
         # Play/pause button
         self.play_button = QToolButton()
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.play_button.setIcon(self.icons["play"])
         self.play_button.setIconSize(QSize(32, 32))
         self.play_button.setToolTip("Play")
-        self.play_button.setStyleSheet("""
-            QToolButton {
-                border: none;
-                padding: 5px;
-            }
-            QToolButton:hover {
-                background-color: #e0e0e0;
-                border-radius: 16px;
-            }
-        """)
+        self.play_button.setObjectName("playButton")
         self.play_button.clicked.connect(self.toggle_playback)
         controls_layout.addWidget(self.play_button)
 
         # Forward button
         self.forward_button = QToolButton()
-        self.forward_button.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipForward))
+        self.forward_button.setIcon(self.icons["forward"])
         self.forward_button.setIconSize(QSize(24, 24))
         self.forward_button.setToolTip("Forward")
-        self.forward_button.setStyleSheet("""
-            QToolButton {
-                border: none;
-                padding: 5px;
-            }
-            QToolButton:hover {
-                background-color: #e0e0e0;
-                border-radius: 12px;
-            }
-        """)
+        self.forward_button.setObjectName("playerButton")
         controls_layout.addWidget(self.forward_button)
 
         # Volume button
         self.volume_button = QToolButton()
-        self.volume_button.setIcon(self.style().standardIcon(QStyle.SP_MediaVolume))
+        self.volume_button.setIcon(self.icons["volume"])
         self.volume_button.setIconSize(QSize(24, 24))
         self.volume_button.setToolTip("Volume")
-        self.volume_button.setStyleSheet("""
-            QToolButton {
-                border: none;
-                padding: 5px;
-            }
-            QToolButton:hover {
-                background-color: #e0e0e0;
-                border-radius: 12px;
-            }
-        """)
+        self.volume_button.setObjectName("playerButton")
         controls_layout.addWidget(self.volume_button)
 
         # Volume slider
@@ -427,43 +345,19 @@ class FileInputTab(QWidget):
         self.volume_slider.setRange(0, 100)
         self.volume_slider.setValue(70)
         self.volume_slider.setMaximumWidth(100)
-        self.volume_slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                border: 1px solid #999999;
-                height: 4px;
-                background: #f0f0f0;
-                margin: 2px 0;
-                border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {SECONDARY_COLOR};
-                border: 1px solid #5c5c5c;
-                width: 12px;
-                margin: -4px 0;
-                border-radius: 6px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {SECONDARY_COLOR};
-                border-radius: 2px;
-            }}
-        """)
+        self.volume_slider.setObjectName("volumeSlider")
         controls_layout.addWidget(self.volume_slider)
 
         # Add controls to preview layout
         preview_layout.addLayout(controls_layout)
 
-        # Add spacer at the bottom
-        main_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        # Keep the sections at the top when there is room to spare
+        main_layout.addStretch(1)
 
     def browse_file(self):
         """Open a file dialog to select an audio file"""
-        file_filter = "Audio Files ("
-        for fmt in SUPPORTED_INPUT_FORMATS:
-            file_filter += f"*.{fmt} "
-        file_filter = file_filter.strip() + ");;All Files (*)"
-
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open Audio File", "", file_filter
+            self, "Open Audio File", "", AUDIO_FILE_FILTER
         )
 
         if file_path:
@@ -489,12 +383,18 @@ class FileInputTab(QWidget):
             metadata = self.audio_processor.get_metadata()
             self.update_file_info(metadata)
 
-            # Load the file into the media player
-            self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(file_path)))
+            # Hand the file to an existing media player once the file info
+            # has been painted (a new player loads it on first use); if it
+            # already holds this file, rewinding it is enough
+            if self.media_player is not None:
+                if self.media_player_file == file_path:
+                    self.media_player.stop()
+                else:
+                    QTimer.singleShot(0, self.ensure_media_player)
 
             # Reset playback state
             self.is_playing = False
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+            self.play_button.setIcon(self.icons["play"])
             self.play_button.setToolTip("Play")
 
             self.file_loaded.emit(True, metadata)
@@ -511,34 +411,40 @@ class FileInputTab(QWidget):
         Args:
             metadata: File metadata
         """
-        # Update file information labels with enhanced formatting
-        self.filename_label.setText(metadata.get("filename", "Unknown"))
-        self.format_label.setText(metadata.get("format", "Unknown").upper())
-
-        duration = metadata.get("duration_seconds", 0)
-        minutes = int(duration // 60)
-        seconds = int(duration % 60)
-        duration_text = f"{minutes:02d}:{seconds:02d}"
-        self.duration_label.setText(duration_text)
-
-        self.channels_label.setText(str(metadata.get("channels", "Unknown")))
-        self.sample_rate_label.setText(f"{metadata.get('frame_rate', 0):,} Hz")
-        self.size_label.setText(metadata.get("size_human", "Unknown"))
+        # Update file information labels with enhanced formatting, leaving
+        # the ones that already show the right text (e.g. on a reload) alone
+        duration_text = format_time(metadata.get("duration_seconds", 0))
+        texts = {
+            "filename": metadata.get("filename", "Unknown"),
+            "format": metadata.get("format", "Unknown").upper(),
+            "duration": duration_text,
+            "channels": str(metadata.get("channels", "Unknown")),
+            "sample_rate": f"{metadata.get('frame_rate', 0):,} Hz",
+            "size": metadata.get("size_human", "Unknown"),
+        }
+        for name, text in texts.items():
+            label = getattr(self, f"{name}_label")
+            if label.text() != text:
+                label.setText(text)
 
         # Show the file info group with a smooth transition
-        self.file_info_group.setVisible(True)
+        if self.file_info_group.isHidden():
+            self.file_info_group.setVisible(True)
 
         # Update audio preview elements
-        self.current_time_label.setText("00:00")
-        self.total_time_label.setText(duration_text)
+        if self.current_time_label.text() != "00:00":
+            self.current_time_label.setText("00:00")
+        if self.total_time_label.text() != duration_text:
+            self.total_time_label.setText(duration_text)
         self.time_slider.setValue(0)
 
         # Reset playback controls
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.play_button.setIcon(self.icons["play"])
         self.play_button.setToolTip("Play")
 
         # Show the preview group with a smooth transition
-        self.preview_group.setVisible(True)
+        if self.preview_group.isHidden():
+            self.preview_group.setVisible(True)
 
         # Log the loaded file information
         logger.info(f"Loaded audio file: {metadata.get('filename', 'Unknown')}")
@@ -555,37 +461,24 @@ class FileInputTab(QWidget):
 
         if self.play_button.toolTip() == "Play":
             # Change to pause icon
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+            self.play_button.setIcon(self.icons["pause"])
             self.play_button.setToolTip("Pause")
 
             # Start audio playback
-            self.media_player.play()
+            self.ensure_media_player().play()
             self.is_playing = True
 
-            # Start the position update timer
-            self.position_timer.start()
-
-            # Connect the control buttons if not already connected
-            if not self.rewind_button.receivers(self.rewind_button.clicked):
-                self.rewind_button.clicked.connect(self.rewind_audio)
-                self.forward_button.clicked.connect(self.forward_audio)
-                self.volume_button.clicked.connect(self.toggle_mute)
-                self.volume_slider.valueChanged.connect(self.set_volume)
-
             # Log the action
             logger.info(f"Started playback of {self.current_file}")
         else:
             # Change to play icon
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+            self.play_button.setIcon(self.icons["play"])
             self.play_button.setToolTip("Play")
 
             # Pause audio playback
-            self.media_player.pause()
+            self.ensure_media_player().pause()
             self.is_playing = False
 
-            # Stop the position update timer
-            self.position_timer.stop()
-
             # Log the action
             logger.info(f"Paused playback of {self.current_file}")
 
@@ -595,10 +488,11 @@ class FileInputTab(QWidget):
             return
 
         # Rewind the audio by 5 seconds
-        current_position = self.media_player.position()
+        player = self.ensure_media_player()
+        current_position = player.position()
         new_position = max(0, current_position - 5000)  # 5000 ms = 5 seconds
-        self.media_player.setPosition(new_position)
-        logger.info(f"Rewind audio to {new_position} ms")
+        player.setPosition(new_position)
+        logger.debug("Rewind audio to %d ms", new_position)
 
     def forward_audio(self):
         """Forward the audio by 5 seconds"""
@@ -606,11 +500,12 @@ class FileInputTab(QWidget):
             return
 
         # Forward the audio by 5 seconds
-        current_position = self.media_player.position()
-        duration = self.media_player.duration()
+        player = self.ensure_media_player()
+        current_position = player.position()
+        duration = player.duration()
         new_position = min(duration, current_position + 5000)  # 5000 ms = 5 seconds
-        self.media_player.setPosition(new_position)
-        logger.info(f"Forward audio to {new_position} ms")
+        player.setPosition(new_position)
+        logger.debug("Forward audio to %d ms", new_position)
 
     def toggle_mute(self):
         """Toggle audio mute"""
@@ -618,34 +513,50 @@ class FileInputTab(QWidget):
             return
 
         # Toggle audio mute
-        if self.media_player.volume() > 0:
-            self.previous_volume = self.media_player.volume()
-            self.media_player.setVolume(0)
+        player = self.ensure_media_player()
+        if player.volume() > 0:
+            self.previous_volume = player.volume()
+            player.setVolume(0)
             self.volume_slider.setValue(0)
-            self.volume_button.setIcon(self.style().standardIcon(QStyle.SP_MediaVolumeMuted))
+            self.volume_button.setIcon(self.icons["muted"])
         else:
             volume_to_set = self.previous_volume if hasattr(self, 'previous_volume') and self.previous_volume > 0 else 70
-            self.media_player.setVolume(volume_to_set)
+            player.setVolume(volume_to_set)
             self.volume_slider.setValue(volume_to_set)
-            self.volume_button.setIcon(self.style().standardIcon(QStyle.SP_MediaVolume))
-        logger.info(f"Toggle mute: {'Muted' if self.media_player.volume() == 0 else 'Unmuted'}")
+            self.volume_button.setIcon(self.icons["volume"])
+        logger.debug("Toggle mute: %s", "Muted" if player.volume() == 0 else "Unmuted")
 
     def set_volume(self, value):
-        """Set the audio volume"""
+        """
+        Queue a volume change from the slider
+
+        Args:
+            value: Volume in percent
+        """
         if not self.current_file:
             return
 
-        # Set the audio volume
-        self.media_player.setVolume(value)
+        self.pending_volume = value
+        if not self.volume_timer.isActive():
+            self.volume_timer.start()
+
+    def flush_volume(self):
+        """Apply the newest volume set on the slider"""
+        self.volume_timer.stop()
+        if self.pending_volume is None:
+            return
+
+        value = self.pending_volume
+        self.pending_volume = None
+
+        # Set the audio volume (a player created later starts at the
+        # slider's value)
+        if self.media_player is not None:
+            self.media_player.setVolume(value)
 
         # Update the volume button icon based on the volume level
-        if value == 0:
-            self.volume_button.setIcon(self.style().standardIcon(QStyle.SP_MediaVolumeMuted))
-        elif value < 30:
-            self.volume_button.setIcon(self.style().standardIcon(QStyle.SP_MediaVolume))
-        else:
-            self.volume_button.setIcon(self.style().standardIcon(QStyle.SP_MediaVolume))
-        logger.info(f"Set volume to {value}%")
+        self.volume_button.setIcon(self.icons["muted"] if value == 0 else self.icons["volume"])
+        logger.debug("Set volume to %d%%", value)
 
     def seek_audio(self, position):
         """
@@ -658,20 +569,20 @@ class FileInputTab(QWidget):
             return
 
         # Calculate the position in milliseconds
-        duration = self.media_player.duration()
+        player = self.ensure_media_player()
+        duration = player.duration()
         if duration > 0:
             # Convert slider position (0-100) to milliseconds
             position_ms = int((position / 100.0) * duration)
 
             # Set the position in the media player
-            self.media_player.setPosition(position_ms)
+            player.setPosition(position_ms)
 
             # Update the current time label
-            minutes = int(position_ms / 60000)
-            seconds = int((position_ms % 60000) / 1000)
-            self.current_time_label.setText(f"{minutes:02d}:{seconds:02d}")
+            time_text = format_time(position_ms // 1000)
+            self.current_time_label.setText(time_text)
 
-            logger.info(f"Seek to position {position}% ({minutes:02d}:{seconds:02d})")
+            logger.debug("Seek to position %d%% (%s)", position, time_text)
 
     def update_position(self, position):
         """
@@ -683,22 +594,48 @@ class FileInputTab(QWidget):
         if self.time_slider.isSliderDown():
             return  # Don't update if user is dragging the slider
 
+        if not self.isVisible():
+            return  # Caught up in showEvent when the tab is shown again
+
+        if self.position_throttle.isActive():
+            self.pending_position = position
+            return
+
+        self.show_position(position)
+        self.position_throttle.start()
+
+    def flush_position(self):
+        """Show the newest position that arrived while updates were held back"""
+        if self.pending_position is None:
+            return
+
+        position = self.pending_position
+        self.pending_position = None
+        if not self.time_slider.isSliderDown():
+            self.show_position(position)
+            self.position_throttle.start()
+
+    def show_position(self, position):
+        """
+        Show a media position on the time slider and label
+
+        Widgets are only touched when their value actually changes.
+
+        Args:
+            position: Position in milliseconds
+        """
         # Update the time slider
         duration = self.media_player.duration()
         if duration > 0:
             # Convert position to slider value (0-100)
             slider_value = int((position / duration) * 100)
-            self.time_slider.setValue(slider_value)
+            if self.time_slider.value() != slider_value:
+                self.time_slider.setValue(slider_value)
 
         # Update the current time label
-        minutes = int(position / 60000)
-        seconds = int((position % 60000) / 1000)
-        self.current_time_label.setText(f"{minutes:02d}:{seconds:02d}")
-
-    def update_position_timer(self):
-        """Update position from timer for smoother updates"""
-        if self.is_playing and not self.time_slider.isSliderDown():
-            self.update_position(self.media_player.position())
+        time_text = format_time(position // 1000)
+        if self.current_time_label.text() != time_text:
+            self.current_time_label.setText(time_text)
 
     def update_duration(self, duration):
         """
@@ -708,9 +645,7 @@ class FileInputTab(QWidget):
             duration: Total duration in milliseconds
         """
         # Update the total time label
-        minutes = int(duration / 60000)
-        seconds = int((duration % 60000) / 1000)
-        self.total_time_label.setText(f"{minutes:02d}:{seconds:02d}")
+        self.total_time_label.setText(format_time(duration // 1000))
 
         # Reset the time slider
         self.time_slider.setValue(0)
@@ -726,10 +661,13 @@ class FileInputTab(QWidget):
 
         if state == QMediaPlayer.StoppedState:
             # Media playback has stopped (reached the end or stopped manually)
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+            self.play_button.setIcon(self.icons["play"])
             self.play_button.setToolTip("Play")
             self.is_playing = False
-            self.position_timer.stop()
+
+            # Drop any held back position so it can't overwrite the reset
+            self.pending_position = None
+            self.position_throttle.stop()
 
             # Reset position to beginning
             self.time_slider.setValue(0)
@@ -742,36 +680,21 @@ class FileInputTab(QWidget):
         # Update theme colors when the tab is shown
         self.theme_colors = get_theme_colors()
 
-        # Update UI with new theme colors
-        self.update_theme()
+        # Update UI with new theme colors, unless they are already applied
+        if self.theme_colors != self.applied_theme_colors:
+            self.update_theme()
+
+        # Position updates are skipped while the tab is hidden
+        if self.media_player is not None:
+            self.show_position(self.media_player.position())
 
         # Call the parent class's showEvent
         super().showEvent(event)
 
     def update_translations(self):
         """Update all translated strings in the tab"""
-        # Create a translation map for common UI elements
-        translation_map = {
-            "Select Audio File": "ui.file_input_tab.title",
-            "Audio File Selection": "ui.file_input_tab.section_title",
-            "Browse for Audio File": "ui.file_input_tab.browse_button",
-            "File Information": "ui.file_input_tab.file_info_group",
-            "File Name:": "ui.file_input_tab.filename_label",
-            "Format:": "ui.file_input_tab.format_label",
-            "Duration:": "ui.file_input_tab.duration_label",
-            "Channels:": "ui.file_input_tab.channels_label",
-            "Sample Rate:": "ui.file_input_tab.sample_rate_label",
-            "File Size:": "ui.file_input_tab.size_label",
-            "Audio Preview": "ui.file_input_tab.preview_group",
-            "Play": "ui.file_input_tab.play_button",
-            "Pause": "ui.file_input_tab.pause_button",
-            "Rewind": "ui.file_input_tab.rewind_button",
-            "Forward": "ui.file_input_tab.forward_button",
-            "Volume": "ui.file_input_tab.volume_label"
-        }
-
         # Update all widgets using the translation map
-        update_ui_translations(self, translation_map)
+        update_ui_translations(self, self.TRANSLATION_MAP)
 
         # Update drop zone translations
         if hasattr(self, 'drop_zone') and hasattr(self.drop_zone, 'update_translations'):
@@ -779,119 +702,11 @@ class FileInputTab(QWidget):
 
     def update_theme(self):
         """Update the UI with the current theme colors"""
-        # Update the drop zone
+        # The rest of the tab is styled by the application stylesheet, which
+        # is replaced as a whole when the theme changes; only the drop zone
+        # builds its style from the theme colors
         self.drop_zone.update_theme(self.theme_colors)
-
-        # Update file info group
-        self.file_info_group.setStyleSheet(f"""
-            QGroupBox {{
-                border: 1px solid {self.theme_colors['border']};
-                border-radius: 8px;
-                margin-top: 15px;
-                font-weight: bold;
-                padding-top: 10px;
-                background-color: {self.theme_colors['background_secondary']};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: {self.theme_colors['highlight']};
-            }}
-        """)
-
-        # Update preview group
-        self.preview_group.setStyleSheet(f"""
-            QGroupBox {{
-                border: 1px solid {self.theme_colors['border']};
-                border-radius: 8px;
-                margin-top: 15px;
-                font-weight: bold;
-                padding-top: 10px;
-                background-color: {self.theme_colors['background_secondary']};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: {self.theme_colors['highlight']};
-            }}
-        """)
-
-        # Update sliders
-        self.time_slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                border: 1px solid {self.theme_colors['border']};
-                height: 8px;
-                background: {self.theme_colors['form_field_bg']};
-                margin: 2px 0;
-                border-radius: 4px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {self.theme_colors['highlight_secondary']};
-                border: 1px solid {self.theme_colors['border']};
-                width: 18px;
-                margin: -2px 0;
-                border-radius: 9px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {self.theme_colors['highlight_secondary']};
-                border-radius: 4px;
-            }}
-        """)
-
-        self.volume_slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                border: 1px solid {self.theme_colors['border']};
-                height: 4px;
-                background: {self.theme_colors['form_field_bg']};
-                margin: 2px 0;
-                border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {self.theme_colors['highlight_secondary']};
-                border: 1px solid {self.theme_colors['border']};
-                width: 12px;
-                margin: -4px 0;
-                border-radius: 6px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {self.theme_colors['highlight_secondary']};
-                border-radius: 2px;
-            }}
-        """)
-
-        # Update control buttons
-        button_style = f"""
-            QToolButton {{
-                border: none;
-                padding: 5px;
-                background-color: transparent;
-                color: {self.theme_colors['text']};
-            }}
-            QToolButton:hover {{
-                background-color: {self.theme_colors['hover_bg']};
-                border-radius: 12px;
-            }}
-        """
-
-        self.rewind_button.setStyleSheet(button_style)
-        self.forward_button.setStyleSheet(button_style)
-        self.volume_button.setStyleSheet(button_style)
-
-        # Play button is slightly larger
-        self.play_button.setStyleSheet(f"""
-            QToolButton {{
-                border: none;
-                padding: 5px;
-                background-color: transparent;
-                color: {self.theme_colors['text']};
-            }}
-            QToolButton:hover {{
-                background-color: {self.theme_colors['hover_bg']};
-                border-radius: 16px;
-            }}
-        """)
+        self.applied_theme_colors = self.theme_colors
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         """
@@ -932,6 +747,15 @@ class DropZone(QFrame):
         # Get theme colors
         self.theme_colors = get_theme_colors()
 
+        # Icon label pixmaps for the idle, hover, valid and invalid drag states
+        style = self.style()
+        self.pixmaps = {
+            "file": style.standardIcon(QStyle.SP_FileIcon).pixmap(64, 64),
+            "folder": style.standardIcon(QStyle.SP_DirOpenIcon).pixmap(72, 72),  # Slightly larger on hover
+            "play": style.standardIcon(QStyle.SP_MediaPlay).pixmap(72, 72),
+            "warning": style.standardIcon(QStyle.SP_MessageBoxWarning).pixmap(72, 72),
+        }
+
         # Set up the UI
         self.setup_ui()
 
@@ -945,6 +769,9 @@ class DropZone(QFrame):
         """Update the UI with the current theme colors"""
         self.theme_colors = theme_colors
 
+        # Repaint once, after the frame and all of its labels are restyled
+        self.setUpdatesEnabled(False)
+
         # Update the styling with improved drop zone visuals
         self.setStyleSheet(f"""
             DropZone {{
@@ -993,6 +820,8 @@ class DropZone(QFrame):
                     border: none;
                 """)
 
+        self.setUpdatesEnabled(True)
+
     def setup_ui(self):
         """Set up the user interface with enhanced visual cues"""
         # Set frame style with dashed border as requested in the UI critique
@@ -1034,9 +863,7 @@ class DropZone(QFrame):
         icon_label.setStyleSheet("background-color: transparent;")
 
         # Use system icon for audio files
-        audio_icon = self.style().standardIcon(QStyle.SP_FileIcon)
-        icon_pixmap = audio_icon.pixmap(64, 64)
-        icon_label.setPixmap(icon_pixmap)
+        icon_label.setPixmap(self.pixmaps["file"])
 
         layout.addWidget(icon_label)
         self.icon_label = icon_label  # Store reference for hover effects
@@ -1087,8 +914,7 @@ class DropZone(QFrame):
         self.is_hovering = True
 
         # Change the icon to a highlighted version with proper transparency
-        audio_icon = self.style().standardIcon(QStyle.SP_DirOpenIcon)
-        self.icon_label.setPixmap(audio_icon.pixmap(72, 72))  # Slightly larger on hover
+        self.icon_label.setPixmap(self.pixmaps["folder"])
         self.icon_label.setStyleSheet("background-color: transparent;")
 
         # Apply hover styling with proper transparency for all elements
@@ -1113,8 +939,7 @@ class DropZone(QFrame):
         self.is_hovering = False
 
         # Restore the original icon with proper transparency
-        audio_icon = self.style().standardIcon(QStyle.SP_FileIcon)
-        self.icon_label.setPixmap(audio_icon.pixmap(64, 64))
+        self.icon_label.setPixmap(self.pixmaps["file"])
         self.icon_label.setStyleSheet("background-color: transparent;")
 
         # Reset to normal styling with proper transparency for all elements
@@ -1152,7 +977,7 @@ class DropZone(QFrame):
             file_path = url.toLocalFile()
             file_ext = os.path.splitext(file_path)[1].lower().lstrip('.')
 
-            if file_ext in SUPPORTED_INPUT_FORMATS:
+            if file_ext in SUPPORTED_INPUT_EXTENSIONS:
                 # Change styling to indicate valid drop target with proper transparency for labels
                 self.setStyleSheet(f"""
                     DropZone {{
@@ -1169,8 +994,7 @@ class DropZone(QFrame):
                 """)
 
                 # Change icon to indicate valid file
-                audio_icon = self.style().standardIcon(QStyle.SP_MediaPlay)
-                self.icon_label.setPixmap(audio_icon.pixmap(72, 72))
+                self.icon_label.setPixmap(self.pixmaps["play"])
                 self.icon_label.setStyleSheet("background-color: transparent;")
 
                 event.acceptProposedAction()
@@ -1191,8 +1015,7 @@ class DropZone(QFrame):
                 """)
 
                 # Change icon to indicate invalid file
-                audio_icon = self.style().standardIcon(QStyle.SP_MessageBoxWarning)
-                self.icon_label.setPixmap(audio_icon.pixmap(72, 72))
+                self.icon_label.setPixmap(self.pixmaps["warning"])
                 self.icon_label.setStyleSheet("background-color: transparent;")
 
                 # Don't accept the action for invalid files
@@ -1232,8 +1055,7 @@ class DropZone(QFrame):
             """)
 
             # Reset the icon with proper transparency
-            audio_icon = self.style().standardIcon(QStyle.SP_FileIcon)
-            self.icon_label.setPixmap(audio_icon.pixmap(64, 64))
+            self.icon_label.setPixmap(self.pixmaps["file"])
             self.icon_label.setStyleSheet("background-color: transparent;")
 
             # Emit the signal with the file path
@@ -1268,8 +1090,7 @@ class DropZone(QFrame):
         """)
 
         # Reset the icon with proper transparency
-        audio_icon = self.style().standardIcon(QStyle.SP_FileIcon)
-        self.icon_label.setPixmap(audio_icon.pixmap(64, 64))
+        self.icon_label.setPixmap(self.pixmaps["file"])
         self.icon_label.setStyleSheet("background-color: transparent;")
 
         super().dragLeaveEvent(event)
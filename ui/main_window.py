@@ -18,7 +18,6 @@ from ui.file_input_tab import FileInputTab
 from ui.config_tab import ConfigTab
 from ui.process_tab import ProcessTab
 from ui.settings_dialog import SettingsDialog
-from ui.about_dialog import AboutDialog
 
 from core.audio_processor import AudioProcessor
 from core.config_manager import ConfigManager
@@ -27,7 +26,7 @@ from core.file_handler import add_recent_file, get_recent_files, clear_recent_fi
 from utils.constants import (
     APP_NAME, APP_DISPLAY_NAME, APP_VERSION,
     WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT,
-    WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT
+    WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT, AUDIO_FILE_FILTER
 )
 from utils.translation_loader import translator, tr
 
@@ -190,9 +189,8 @@ class MainWindow(QMainWindow):
 
     def open_file_dialog(self):
         """Open a file dialog to select an audio file"""
-        file_filter = "Audio Files (*.mp3 *.wav *.aac *.ogg *.m4a *.flac);;All Files (*)"
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open Audio File", "", file_filter
+            self, "Open Audio File", "", AUDIO_FILE_FILTER
         )
 
         if file_path:
@@ -258,6 +256,9 @@ class MainWindow(QMainWindow):
 
     def show_about_dialog(self):
         """Show the about dialog"""
+        # Imported on first use, most sessions never open the dialog
+        from ui.about_dialog import AboutDialog
+
         dialog = AboutDialog(self)
         dialog.exec_()
 
@@ -401,5 +402,6 @@ class MainWindow(QMainWindow):
         """
         # Save settings before closing
         self.config_manager.save_last_configuration(self.config_tab.get_configuration())
+        self.config_manager.flush()
 
         event.accept()
\ No newline at end of file
@@ -4,6 +4,7 @@ Processing and results tab for AudKyɛfo
 
 import os
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 
 from PyQt5.QtWidgets import (
@@ -21,7 +22,7 @@ from core.audio_processor import AudioProcessor
 from core.file_handler import open_directory
 from utils.translation_loader import tr
 from utils.ui_translator import update_ui_translations
-from utils.helpers import generate_output_filename
+from utils.helpers import generate_output_filename, format_time
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -208,20 +209,14 @@ class MediaPlayerDialog(QDialog):
         self.position_slider.blockSignals(False)
 
         # Update time label
-        seconds = position // 1000
-        minutes = seconds // 60
-        seconds = seconds % 60
-        self.time_label.setText(f"{minutes:02d}:{seconds:02d}")
+        self.time_label.setText(format_time(position // 1000))
 
     def on_duration_changed(self, duration):
         """Handle duration changes"""
         self.position_slider.setRange(0, duration)
 
         # Update duration label
-        seconds = duration // 1000
-        minutes = seconds // 60
-        seconds = seconds % 60
-        self.duration_label.setText(f"{minutes:02d}:{seconds:02d}")
+        self.duration_label.setText(format_time(duration // 1000))
 
     def on_media_status_changed(self, status):
         """Handle media status changes"""
@@ -315,6 +310,24 @@ class ProcessTab(QWidget):
     processing_finished = pyqtSignal(list)
     processing_error = pyqtSignal(str)
 
+    # English widget text -> translation key, used when the language changes
+    TRANSLATION_MAP = MappingProxyType({
+        "Processing & Results": "ui.process_tab.title",
+        "Configuration Summary": "ui.process_tab.config_summary_group",
+        "Start Processing": "ui.process_tab.process_button",
+        "Processing": "ui.process_tab.progress_group",
+        "Operation:": "ui.process_tab.operation_label",
+        "Progress:": "ui.process_tab.progress_label",
+        "Log:": "ui.process_tab.log_label",
+        "Results": "ui.process_tab.results_group",
+        "Output Files": "ui.process_tab.results_table_title",
+        "Filename": "ui.process_tab.filename_column",
+        "Duration": "ui.process_tab.duration_column",
+        "Size": "ui.process_tab.size_column",
+        "Open Output Folder": "ui.process_tab.open_folder_button",
+        "Clear Results": "ui.process_tab.clear_button"
+    })
+
     def __init__(self, audio_processor: AudioProcessor):
         """
         Initialize the process tab
@@ -419,11 +432,14 @@ class ProcessTab(QWidget):
 
         # Results table
         self.results_table = QTableWidget(0, 3)
-        self.results_table.setHorizontalHeaderLabels([
-            tr("ui.process_tab.file_name_column", "File Name"),
-            tr("ui.process_tab.duration_column", "Duration"),
-            tr("ui.process_tab.size_column", "Size")
-        ])
+        # Header items are kept so retranslating only changes their text
+        self.results_header_items = [
+            QTableWidgetItem(tr("ui.process_tab.file_name_column", "File Name")),
+            QTableWidgetItem(tr("ui.process_tab.duration_column", "Duration")),
+            QTableWidgetItem(tr("ui.process_tab.size_column", "Size"))
+        ]
+        for column, item in enumerate(self.results_header_items):
+            self.results_table.setHorizontalHeaderItem(column, item)
         self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.results_table.setMinimumHeight(150)
@@ -510,9 +526,7 @@ class ProcessTab(QWidget):
             self.method_label.setText(f"Equal Parts ({num_parts} parts)")
         elif method == "fixed_duration":
             duration = self.config.get("duration", 60)
-            minutes = int(duration // 60)
-            seconds = int(duration % 60)
-            self.method_label.setText(f"Fixed Duration ({minutes:02d}:{seconds:02d} per segment)")
+            self.method_label.setText(f"Fixed Duration ({format_time(duration)} per segment)")
         elif method == "custom_ranges":
             ranges = self.config.get("ranges", [])
             self.method_label.setText(f"Custom Ranges ({len(ranges)} segments)")
@@ -662,10 +676,7 @@ class ProcessTab(QWidget):
         """
         try:
             audio = AudioSegment.from_file(file_path)
-            duration_seconds = len(audio) / 1000.0  # Convert from milliseconds
-            minutes = int(duration_seconds // 60)
-            seconds = int(duration_seconds % 60)
-            return f"{minutes:02d}:{seconds:02d}"
+            return format_time(len(audio) // 1000)
         except Exception as e:
             logger.warning(f"Could not get duration for {file_path}: {e}")
             return "N/A"
@@ -730,30 +741,15 @@ class ProcessTab(QWidget):
 
     def update_translations(self):
         """Update all translated strings in the tab"""
-        # Create a translation map for common UI elements
-        translation_map = {
-            "Processing & Results": "ui.process_tab.title",
-            "Configuration Summary": "ui.process_tab.config_summary_group",
-            "Start Processing": "ui.process_tab.process_button",
-            "Processing": "ui.process_tab.progress_group",
-            "Operation:": "ui.process_tab.operation_label",
-            "Progress:": "ui.process_tab.progress_label",
-            "Log:": "ui.process_tab.log_label",
-            "Results": "ui.process_tab.results_group",
-            "Output Files": "ui.process_tab.results_table_title",
-            "Filename": "ui.process_tab.filename_column",
-            "Duration": "ui.process_tab.duration_column",
-            "Size": "ui.process_tab.size_column",
-            "Open Output Folder": "ui.process_tab.open_folder_button",
-            "Clear Results": "ui.process_tab.clear_button"
-        }
-
         # Update all widgets using the translation map
-        update_ui_translations(self, translation_map)
+        update_ui_translations(self, self.TRANSLATION_MAP)
 
         # Update table headers
-        if hasattr(self, 'results_table'):
-            if self.results_table.columnCount() >= 3:
-                self.results_table.setHorizontalHeaderItem(0, QTableWidgetItem(tr("ui.process_tab.filename_column", "Filename")))
-                self.results_table.setHorizontalHeaderItem(1, QTableWidgetItem(tr("ui.process_tab.duration_column", "Duration")))
-                self.results_table.setHorizontalHeaderItem(2, QTableWidgetItem(tr("ui.process_tab.size_column", "Size")))
\ No newline at end of file
+        header_texts = (
+            tr("ui.process_tab.filename_column", "Filename"),
+            tr("ui.process_tab.duration_column", "Duration"),
+            tr("ui.process_tab.size_column", "Size")
+        )
+        for item, text in zip(self.results_header_items, header_texts):
+            if item.text() != text:
+                item.setText(text)
\ No newline at end of file
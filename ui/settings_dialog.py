@@ -261,12 +261,12 @@ class SettingsDialog(QDialog):
         new_language = self.language_combo.currentData()
         new_theme = self.theme_combo.currentData()
 
-        # Save settings
+        # Save settings (written now, other config managers read them from disk)
         self.config_manager.set_setting("output_format", self.format_combo.currentData())
         self.config_manager.set_setting("output_directory", self.output_location_edit.text())
         self.config_manager.set_setting("remember_last_settings", self.remember_check.isChecked())
         self.config_manager.set_setting("language", new_language)
-        self.config_manager.set_setting("theme", new_theme)
+        self.config_manager.set_setting("theme", new_theme, flush=True)
 
         # Apply changes immediately
         from utils.translation_loader import translator
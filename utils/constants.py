@@ -13,16 +13,32 @@ WINDOW_MIN_WIDTH = 600
 WINDOW_MIN_HEIGHT = 400
 WINDOW_DEFAULT_WIDTH = 800
 WINDOW_DEFAULT_HEIGHT = 600
+INPUT_DEBOUNCE_MS = 150  # Wait this long after the last edit before updating estimates
+POSITION_UPDATE_MS = 100  # Minimum time between playback position display updates
+VOLUME_UPDATE_MS = 50  # Minimum time between player volume changes while dragging
 
 # Audio formats
 SUPPORTED_INPUT_FORMATS = ["mp3", "wav", "aac", "ogg", "m4a", "flac"]
 SUPPORTED_OUTPUT_FORMATS = ["mp3", "wav", "aac", "ogg", "m4a", "flac"]
 
+# Same formats as sets for membership checks (the lists above keep the UI order)
+SUPPORTED_INPUT_EXTENSIONS = frozenset(SUPPORTED_INPUT_FORMATS)
+SUPPORTED_OUTPUT_EXTENSIONS = frozenset(SUPPORTED_OUTPUT_FORMATS)
+
+# File dialog filter for the supported input formats
+AUDIO_FILE_FILTER = (
+    "Audio Files (" + " ".join(f"*.{fmt}" for fmt in SUPPORTED_INPUT_FORMATS) + ");;All Files (*)"
+)
+
 # Default values
 DEFAULT_OUTPUT_FORMAT = "mp3"
 DEFAULT_NAMING_PATTERN = "{original_name}_part_{number:03d}"
 DEFAULT_OVERLAP_DURATION = 0  # in seconds
 
+# Files at least this large are split straight from disk with ffmpeg
+# instead of being decoded into memory first
+LOW_MEMORY_THRESHOLD_BYTES = 100 * 1024 * 1024
+
 # Splitting methods
 SPLIT_METHOD_EQUAL = "equal_parts"
 SPLIT_METHOD_DURATION = "fixed_duration"
@@ -40,4 +56,5 @@ PROGRESS_FILE_LOADING = 10
 PROGRESS_AUDIO_ANALYSIS = 20
 PROGRESS_SPLITTING_START = 30
 PROGRESS_SPLITTING_END = 90
-PROGRESS_FILE_EXPORT = 100
\ No newline at end of file
+PROGRESS_FILE_EXPORT = 100
+PROGRESS_MIN_INTERVAL = 0.05  # in seconds, at most ~20 progress updates per second
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Audio format detection for AudKyɛfo
+Identifies files by their leading bytes instead of trusting the extension
+"""
+
+import logging
+from typing import Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Number of bytes read from the start of a file
+SNIFF_SIZE = 12
+
+# (signature, offset, format) checked in order against the leading bytes
+MAGIC_SIGNATURES = [
+    (b"ID3", 0, "mp3"),
+    (b"fLaC", 0, "flac"),
+    (b"OggS", 0, "ogg"),
+    (b"ftyp", 4, "m4a"),
+]
+
+def sniff_format(file_path: str) -> Optional[str]:
+    """
+    Detect the audio format of a file from its first bytes
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Format name as used for extensions (mp3, wav, flac, ogg, m4a, aac),
+        or None if the format is not recognized or the file can't be read
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(SNIFF_SIZE)
+    except OSError as e:
+        logger.warning(f"Could not read {file_path}: {e}")
+        return None
+
+    for signature, offset, file_format in MAGIC_SIGNATURES:
+        if head[offset:offset + len(signature)] == signature:
+            return file_format
+
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+
+    # Raw MPEG audio frames: 11 sync bits, then the layer decides between
+    # MP3 (Layer III) and ADTS AAC (layer bits 00)
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:
+        if head[1] & 0x06 == 0x02:
+            return "mp3"
+        if head[1] & 0xF6 == 0xF0:
+            return "aac"
+
+    return None
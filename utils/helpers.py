@@ -4,30 +4,42 @@ Helper functions for the AudKyɛfo application
 
 import os
 import re
-from typing import List, Tuple, Optional
+import string
+import functools
+from typing import List, Tuple, Optional, Callable
 import logging
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+TIME_RE = re.compile(r"^(\d+):([0-5]\d)$")
+
+# MM:SS with at least two minute digits, as produced by format_time
+TIME_FORMAT_RE = re.compile(r"^(\d{2,}):([0-5]\d)$")
+
+@functools.lru_cache(maxsize=512)
 def format_time(seconds: float) -> str:
     """
     Format time in seconds to MM:SS format
 
+    Results are memoized, the UI formats the same few values on every edit.
+
     Args:
         seconds: Time in seconds
 
     Returns:
         Formatted time string in MM:SS format
     """
-    minutes = int(seconds // 60)
-    seconds = int(seconds % 60)
+    minutes, seconds = divmod(int(seconds), 60)
     return f"{minutes:02d}:{seconds:02d}"
 
+@functools.lru_cache(maxsize=512)
 def parse_time(time_str: str) -> float:
     """
     Parse time string in MM:SS format to seconds
 
+    Results are memoized, the UI re-parses every range on each validation.
+
     Args:
         time_str: Time string in MM:SS format
 
@@ -41,8 +53,7 @@ def parse_time(time_str: str) -> float:
         return 0.0
 
     # Check if the format is MM:SS
-    pattern = r"^(\d+):([0-5]\d)$"
-    match = re.match(pattern, time_str)
+    match = TIME_RE.match(time_str)
 
     if not match:
         raise ValueError(f"Invalid time format: {time_str}. Expected format: MM:SS")
@@ -50,10 +61,35 @@ def parse_time(time_str: str) -> float:
     minutes, seconds = match.groups()
     return int(minutes) * 60 + int(seconds)
 
+@functools.lru_cache(maxsize=512)
+def try_parse_time(time_str: str) -> Optional[int]:
+    """
+    Validate and parse a time string in MM:SS format in one pass
+
+    Accepts exactly what is_valid_time_format accepts, for input fields that
+    would otherwise be validated and then parsed.
+
+    Args:
+        time_str: Time string in MM:SS format
+
+    Returns:
+        Time in seconds, or None if the string is not a valid time
+    """
+    match = TIME_FORMAT_RE.match(time_str)
+    if match is None:
+        return None
+
+    minutes, seconds = match.groups()
+    return int(minutes) * 60 + int(seconds)
+
+@functools.lru_cache(maxsize=8192)
 def get_file_extension(file_path: str) -> str:
     """
     Get the file extension from a file path
 
+    Results are memoized, since directory scans and the recent files list
+    look up the same names over and over.
+
     Args:
         file_path: Path to the file
 
@@ -104,6 +140,50 @@ def ensure_directory_exists(directory: str) -> bool:
         logger.error(f"Error creating directory {directory}: {e}")
         return False
 
+@functools.lru_cache(maxsize=32)
+def compile_naming_pattern(
+    pattern: str = "{original_name}_part_{number:03d}",
+    extension: str = "mp3"
+) -> Callable[[str, int, Optional[float], Optional[float]], str]:
+    """
+    Prepare a naming pattern for generating many output filenames
+
+    The pattern is parsed once, and the start/end times are only formatted
+    if the pattern uses them.
+
+    Args:
+        pattern: Naming pattern
+        extension: Output file extension
+
+    Returns:
+        Function taking (original_name, part_number, start_time, end_time),
+        with the original name already stripped of its extension and the
+        times in seconds (or None), and returning the filename
+    """
+    fields = {
+        re.split(r"[.\[]", field_name, maxsplit=1)[0]
+        for _, field_name, _, _ in string.Formatter().parse(pattern)
+        if field_name
+    }
+    uses_start_time = "start_time" in fields
+    uses_end_time = "end_time" in fields
+    format_name = f"{pattern}.{extension}".format
+
+    def name(
+        original_name: str,
+        part_number: int,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None
+    ) -> str:
+        return format_name(
+            original_name=original_name,
+            number=part_number,
+            start_time=format_time(start_time) if uses_start_time and start_time is not None else "",
+            end_time=format_time(end_time) if uses_end_time and end_time is not None else ""
+        )
+
+    return name
+
 def generate_output_filename(
     original_name: str,
     part_number: int,
@@ -129,16 +209,7 @@ def generate_output_filename(
     # Remove extension from original name if present
     original_name = os.path.splitext(original_name)[0]
 
-    # Replace variables in the pattern
-    filename = pattern.format(
-        original_name=original_name,
-        number=part_number,
-        start_time=format_time(start_time) if start_time is not None else "",
-        end_time=format_time(end_time) if end_time is not None else ""
-    )
-
-    # Add extension
-    return f"{filename}.{extension}"
+    return compile_naming_pattern(pattern, extension)(original_name, part_number, start_time, end_time)
 
 def check_disk_space(directory: str, required_space: int) -> bool:
     """
@@ -20,10 +20,15 @@ class TranslationLoader:
         self.translations = {}
         self.current_language = "en"
         self.available_languages = []
+        # Resolved strings keyed on (language, key, default); the UI asks
+        # for the same keys every time a widget is built or retranslated
+        self._cache = {}
         self.load_translations()
 
     def load_translations(self) -> None:
         """Load all available translations"""
+        self._cache.clear()
+
         translations_dir = os.path.join(
             os.path.dirname(os.path.dirname(__file__)),
             "resources", "translations"
@@ -81,6 +86,26 @@ class TranslationLoader:
         """
         Get a translation for a key
 
+        Args:
+            key: Translation key (e.g., "ui.main_window.file_menu")
+            default: Default value if the key doesn't exist
+
+        Returns:
+            Translated string
+        """
+        cache_key = (self.current_language, key, default)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        translation = self._lookup(key, default)
+        self._cache[cache_key] = translation
+        return translation
+
+    def _lookup(self, key: str, default: Optional[str] = None) -> str:
+        """
+        Resolve a translation for a key, falling back to English
+
         Args:
             key: Translation key (e.g., "ui.main_window.file_menu")
             default: Default value if the key doesn't exist
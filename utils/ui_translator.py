@@ -3,7 +3,8 @@ UI translation utilities for AudKyɛfo
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple, Union, Mapping
 
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton, QAction, QMenu, QTabWidget,
@@ -17,6 +18,10 @@ from utils.translation_loader import tr
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Expanded versions of read-only translation maps, keyed on id(); the map is
+# kept alongside so its id can't be reused by another object
+_flexible_maps: Dict[int, Tuple[Mapping[str, str], Dict[str, str]]] = {}
+
 class UITranslator:
     """
     Utility class for translating UI components
@@ -118,12 +123,13 @@ class UITranslator:
         # Translate the parent widget itself
         UITranslator.translate_widget(parent, translation_map)
 
-        # Translate all child widgets
-        for child in parent.findChildren(QWidget):
+        # Translate all child widgets (walking the widget tree only once)
+        children = parent.findChildren(QWidget)
+        for child in children:
             UITranslator.translate_widget(child, translation_map)
 
         # Log translation activity
-        logger.debug(f"Translated {len(parent.findChildren(QWidget))} widgets in {parent.__class__.__name__}")
+        logger.debug(f"Translated {len(children)} widgets in {parent.__class__.__name__}")
 
     @staticmethod
     def create_translation_map(widgets: List[QWidget], prefix: str = "") -> Dict[str, str]:
@@ -224,6 +230,27 @@ def update_ui_translations(parent: QWidget, translation_map: Dict[str, str]) ->
     # Log the translation map for debugging
     logger.debug(f"Translation map for {parent.__class__.__name__}: {list(translation_map.keys())}")
 
+    UITranslator.translate_widgets(parent, get_flexible_map(translation_map))
+
+def get_flexible_map(translation_map: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Expand a translation map with whitespace and trailing colon variants
+
+    Read-only maps (MappingProxyType) can't change, so their expansion is
+    built once and reused on every later language change.
+
+    Args:
+        translation_map: Dictionary mapping widget text to translation keys
+
+    Returns:
+        Dictionary mapping every text variant to its translation key
+    """
+    cacheable = isinstance(translation_map, MappingProxyType)
+    if cacheable:
+        cached = _flexible_maps.get(id(translation_map))
+        if cached is not None and cached[0] is translation_map:
+            return cached[1]
+
     # Create a more flexible translation map that ignores case and whitespace
     flexible_map = {}
     for text, key in translation_map.items():
@@ -243,4 +270,6 @@ def update_ui_translations(parent: QWidget, translation_map: Dict[str, str]) ->
         if not text.endswith(':'):
             flexible_map[text + ':'] = key
 
-    UITranslator.translate_widgets(parent, flexible_map)
\ No newline at end of file
+    if cacheable:
+        _flexible_maps[id(translation_map)] = (translation_map, flexible_map)
+    return flexible_map
@@ -4,13 +4,25 @@ Validation functions for the AudKyɛfo application
 
 import os
 import re
+import functools
 from typing import Tuple, List, Optional
 import logging
-from utils.constants import SUPPORTED_INPUT_FORMATS, SUPPORTED_OUTPUT_FORMATS
+from utils.constants import SUPPORTED_INPUT_EXTENSIONS, SUPPORTED_OUTPUT_EXTENSIONS
+from utils.helpers import TIME_FORMAT_RE, format_time
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Placeholders that identify a part, at least one is needed for unique names
+PART_PLACEHOLDER_RE = re.compile(r"\{number|\{start_time\}|\{end_time\}")
+
+# Supported placeholders, removed before checking for invalid characters
+PLACEHOLDER_RE = re.compile(r"\{(?:original_name|number(?::03d)?|start_time|end_time)\}")
+
+# Characters not allowed in file names, as a str.translate deletion table
+INVALID_FILENAME_CHARS = '<>:"/\\|?*'
+INVALID_FILENAME_TABLE = str.maketrans("", "", INVALID_FILENAME_CHARS)
+
 def is_valid_audio_file(file_path: str) -> bool:
     """
     Check if a file is a valid audio file based on its extension
@@ -25,7 +37,7 @@ def is_valid_audio_file(file_path: str) -> bool:
         return False
 
     extension = os.path.splitext(file_path)[1][1:].lower()
-    return extension in SUPPORTED_INPUT_FORMATS
+    return extension in SUPPORTED_INPUT_EXTENSIONS
 
 def is_valid_output_format(format_str: str) -> bool:
     """
@@ -37,8 +49,9 @@ def is_valid_output_format(format_str: str) -> bool:
     Returns:
         True if the format is supported, False otherwise
     """
-    return format_str.lower() in SUPPORTED_OUTPUT_FORMATS
+    return format_str.lower() in SUPPORTED_OUTPUT_EXTENSIONS
 
+@functools.lru_cache(maxsize=256)
 def is_valid_time_format(time_str: str) -> bool:
     """
     Check if a time string is in valid MM:SS format
@@ -52,8 +65,7 @@ def is_valid_time_format(time_str: str) -> bool:
     if not time_str:
         return False
 
-    pattern = r"^(\d+):([0-5]\d)$"
-    return bool(re.match(pattern, time_str))
+    return TIME_FORMAT_RE.match(time_str) is not None
 
 def is_valid_time_range(start_time: str, end_time: str, total_duration: float) -> Tuple[bool, Optional[str]]:
     """
@@ -84,7 +96,7 @@ def is_valid_time_range(start_time: str, end_time: str, total_duration: float) -
         return False, "Start time cannot be negative"
 
     if end_seconds > total_duration:
-        return False, f"End time exceeds audio duration ({int(total_duration // 60):02d}:{int(total_duration % 60):02d})"
+        return False, f"End time exceeds audio duration ({format_time(total_duration)})"
 
     return True, None
 
@@ -119,10 +131,14 @@ def is_valid_output_directory(directory: str) -> Tuple[bool, Optional[str]]:
 
     return True, None
 
+@functools.lru_cache(maxsize=256)
 def is_valid_naming_pattern(pattern: str) -> Tuple[bool, Optional[str]]:
     """
     Check if a naming pattern is valid
 
+    The result only depends on the pattern, so it is cached; the pattern is
+    re-validated on every split and edit in the UI.
+
     Args:
         pattern: Naming pattern
 
@@ -136,17 +152,12 @@ def is_valid_naming_pattern(pattern: str) -> Tuple[bool, Optional[str]]:
     if "{original_name}" not in pattern:
         return False, "Naming pattern must include {original_name}"
 
-    if "{number" not in pattern and "{start_time}" not in pattern and "{end_time}" not in pattern:
+    if PART_PLACEHOLDER_RE.search(pattern) is None:
         return False, "Naming pattern must include at least one of: {number}, {start_time}, {end_time}"
 
-    # Check for invalid characters in file names
-    invalid_chars = r'[<>:"/\\|?*]'
-    # Remove the variables from the pattern before checking
-    test_pattern = pattern
-    for var in ["{original_name}", "{number}", "{number:03d}", "{start_time}", "{end_time}"]:
-        test_pattern = test_pattern.replace(var, "")
-
-    if re.search(invalid_chars, test_pattern):
+    # Check for invalid characters in file names, ignoring the variables
+    test_pattern = PLACEHOLDER_RE.sub("", pattern)
+    if test_pattern.translate(INVALID_FILENAME_TABLE) != test_pattern:
         return False, "Naming pattern contains invalid characters for file names"
 
     return True, None
\ No newline at end of file